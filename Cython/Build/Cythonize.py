@@ -51,6 +51,10 @@ def cython_compile(path_pattern, options):
 
 def _cython_compile_files(all_paths, options):
     pool = None
+    # The PGO training needs all extensions of the build, so they are
+    # built together per base directory after cythonizing all paths.
+    pgo_builds = {}
+    pgo_base_dirs = []
     try:
         for path in all_paths:
             if options.build_inplace:
@@ -80,7 +84,12 @@ def _cython_compile_files(all_paths, options):
                 **options.options)
 
             if ext_modules and options.build:
-                if len(ext_modules) > 1 and options.parallel > 1:
+                if options.pgo_train:
+                    if base_dir not in pgo_builds:
+                        pgo_base_dirs.append(base_dir)
+                        pgo_builds[base_dir] = []
+                    pgo_builds[base_dir].extend(ext_modules)
+                elif len(ext_modules) > 1 and options.parallel > 1:
                     if pool is None:
                         try:
                             pool = multiprocessing.Pool(options.parallel)
@@ -90,6 +99,9 @@ def _cython_compile_files(all_paths, options):
                         (base_dir, [ext]) for ext in ext_modules])
                 else:
                     run_distutils((base_dir, ext_modules))
+
+        for base_dir in pgo_base_dirs:
+            run_distutils((base_dir, pgo_builds[base_dir], options.pgo_train))
     except:
         if pool is not None:
             pool.terminate()
@@ -101,8 +113,14 @@ def _cython_compile_files(all_paths, options):
 
 
 def run_distutils(args):
-    base_dir, ext_modules = args
+    base_dir, ext_modules = args[:2]
+    pgo_train = args[2] if len(args) > 2 else None
     script_args = ['build_ext', '-i']
+    cmdclass = {}
+    if pgo_train:
+        from ..Distutils.build_ext import build_ext
+        cmdclass['build_ext'] = build_ext
+        script_args.extend(['--cython-pgo-train', pgo_train])
     cwd = os.getcwd()
     temp_dir = None
     try:
@@ -114,6 +132,7 @@ def run_distutils(args):
             script_name='setup.py',
             script_args=script_args,
             ext_modules=ext_modules,
+            cmdclass=cmdclass,
         )
     finally:
         if base_dir:
@@ -124,7 +143,8 @@ def run_distutils(args):
 
 def create_args_parser():
     from argparse import ArgumentParser, RawDescriptionHelpFormatter
-    from ..Compiler.CmdLine import ParseDirectivesAction, ParseOptionsAction, ParseCompileTimeEnvAction
+    from ..Compiler.CmdLine import (
+        ParseDirectivesAction, ParseOptionsAction, ParseCompileTimeEnvAction, ActivatePerformanceHintsAction)
 
     parser = ArgumentParser(
         formatter_class=RawDescriptionHelpFormatter,
@@ -140,6 +160,9 @@ Environment variables:
                       dest='directives', default={}, type=str,
                       action=ParseDirectivesAction,
                       help='set a compiler directive')
+    parser.add_argument('--explain-slow', dest='directives', action=ActivatePerformanceHintsAction, nargs=0,
+                      help='explain why loops and expressions were not compiled to plain C code '
+                           '(same as "-X warn.performance=True")')
     parser.add_argument('-E', '--compile-time-env', metavar='NAME=VALUE,...',
                       dest='compile_time_env', default={}, type=str,
                       action=ParseCompileTimeEnvAction,
@@ -159,6 +182,10 @@ Environment variables:
     parser.add_argument('--annotate-fullc', action='store_const', const='fullc', dest='annotate',
                       help='Produce a colorized HTML version of the source '
                            'which includes entire generated C/C++-code.')
+    parser.add_argument('--annotate-report', dest='annotate_report', metavar='FORMAT',
+                      choices=('json', 'csv'), action='store', type=str,
+                      help='Write the Python interactions of each line and function of the source '
+                           'into a machine-readable .interactions.FORMAT file ("json" or "csv").')
     parser.add_argument('-x', '--exclude', metavar='PATTERN', dest='excludes',
                       action='append', default=[],
                       help='exclude certain file patterns from the compilation')
@@ -171,6 +198,10 @@ Environment variables:
                       type=int, default=parallel_compiles,
                       help=('run builds in N parallel jobs (default: %d)' %
                             parallel_compiles or 1))
+    parser.add_argument('--pgo-train', dest='pgo_train', metavar='COMMAND', default=None,
+                      help='build with profile guided optimisation of the C compiler: build the '
+                           'extension modules with instrumentation, run this shell command to '
+                           'collect a runtime profile, then rebuild them for it (implies -b)')
     parser.add_argument('-f', '--force', dest='force', action='store_true', default=None,
                       help='force recompilation')
     parser.add_argument('-q', '--quiet', dest='quiet', action='store_true', default=None,
@@ -183,6 +214,9 @@ Environment variables:
     parser.add_argument('--no-docstrings', dest='no_docstrings', action='store_true', default=None,
                       help='strip docstrings')
     parser.add_argument('-M', '--depfile', action='store_true', help='produce depfiles for the sources')
+    parser.add_argument('--profile-compiler', dest='profile_compiler', metavar='REPORT.json', default=None,
+                      help='write the time, memory allocations and tree size of each compiler '
+                           'pipeline stage to a JSON report, per module and in total')
     parser.add_argument('sources', nargs='*')
     return parser
 
@@ -207,7 +241,7 @@ def parse_args(args):
 
     if not args:
         parser.error("no source files provided")
-    if options.build_inplace:
+    if options.build_inplace or options.pgo_train:
         options.build = True
     if multiprocessing is None:
         options.parallel = 0
@@ -223,9 +257,15 @@ def parse_args(args):
     if options.annotate:
         Options.annotate = options.annotate
 
+    if options.annotate_report:
+        Options.annotate_report = options.annotate_report
+
     if options.no_docstrings:
         Options.docstrings = False
 
+    if options.profile_compiler:
+        options.options['profile_compiler'] = options.profile_compiler
+
     return options, args
 
 
@@ -6,6 +6,7 @@ from .. import __version__
 import collections
 import contextlib
 import hashlib
+import json
 import os
 import shutil
 import subprocess
@@ -119,18 +120,49 @@ def nonempty(it, error_msg="expected non-empty iterator"):
         raise ValueError(error_msg)
 
 
-@cached_function
-def file_hash(filename):
-    path = os.path.normpath(filename)
-    prefix = ('%d:%s' % (len(path), path)).encode("UTF-8")
-    m = hashlib.sha1(prefix)
+def _update_hash_from_file(m, path):
     with open(path, 'rb') as f:
         data = f.read(65000)
         while data:
             m.update(data)
             data = f.read(65000)
+
+
+@cached_function
+def file_hash(filename):
+    path = os.path.normpath(filename)
+    prefix = ('%d:%s' % (len(path), path)).encode("UTF-8")
+    m = hashlib.sha1(prefix)
+    _update_hash_from_file(m, path)
+    return m.hexdigest()
+
+
+def content_hash(filename):
+    """
+    Return the hash of the content of a file, independent of its path.
+    """
+    m = hashlib.sha1()
+    _update_hash_from_file(m, filename)
     return m.hexdigest()
 
+cached_content_hash = cached_function(content_hash)
+
+
+def manifest_key(filename):
+    """
+    Return the path of a file relative to the current directory (with '/'
+    as separator), or its absolute path if it lies outside of it.
+    """
+    path = os.path.abspath(filename)
+    try:
+        relative_path = _relpath(path)
+    except ValueError:
+        # different drive on Windows
+        return path
+    if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+        return path
+    return relative_path.replace(os.sep, '/')
+
 
 def update_pythran_extension(ext):
     if pythran is None:
@@ -649,22 +681,52 @@ class DependencyTree(object):
             for x in sorted(self.all_dependencies(filename)):
                 if os.path.splitext(x)[1] not in ('.c', '.cpp', '.h'):
                     m.update(file_hash(x).encode('UTF-8'))
-            # Include the module attributes that change the compilation result
-            # in the fingerprint. We do not iterate over module.__dict__ and
-            # include almost everything here as users might extend Extension
-            # with arbitrary (random) attributes that would lead to cache
-            # misses.
-            m.update(str((
-                module.language,
-                getattr(module, 'py_limited_api', False),
-                getattr(module, 'np_pythran', False)
-            )).encode('UTF-8'))
-
-            m.update(compilation_options.get_fingerprint().encode('UTF-8'))
+            self._update_fingerprint(m, module, compilation_options)
             return m.hexdigest()
         except IOError:
             return None
 
+    def content_fingerprint(self, filename, module, compilation_options):
+        r"""
+        Return a fingerprint of a cython file like transitive_fingerprint(),
+        and a mapping from its dependencies (see manifest_key()) to the hashes
+        of their content.
+
+        Only the content of the files and their paths inside of the current
+        directory are considered, so that the fingerprint does not depend on
+        file timestamps or on the location of the project checkout.
+        Returns (None, None) if a file cannot be read.
+        """
+        try:
+            dependencies = {}
+            for path in set([filename]).union(self.all_dependencies(filename)):
+                if os.path.splitext(path)[1] not in ('.c', '.cpp', '.h'):
+                    dependencies[manifest_key(path)] = cached_content_hash(path)
+        except IOError:
+            return None, None
+        m = hashlib.sha1(__version__.encode('UTF-8'))
+        # Files outside of the project (e.g. in site-packages) only count by content.
+        for key, file_content_hash in sorted(
+                ('' if os.path.isabs(key) else key, file_content_hash)
+                for key, file_content_hash in dependencies.items()):
+            m.update(('%s:%s\n' % (key, file_content_hash)).encode('UTF-8'))
+        self._update_fingerprint(m, module, compilation_options)
+        return m.hexdigest(), dependencies
+
+    def _update_fingerprint(self, m, module, compilation_options):
+        # Include the module attributes that change the compilation result
+        # in the fingerprint. We do not iterate over module.__dict__ and
+        # include almost everything here as users might extend Extension
+        # with arbitrary (random) attributes that would lead to cache
+        # misses.
+        m.update(str((
+            module.language,
+            getattr(module, 'py_limited_api', False),
+            getattr(module, 'np_pythran', False)
+        )).encode('UTF-8'))
+
+        m.update(compilation_options.get_fingerprint().encode('UTF-8'))
+
     def distutils_info0(self, filename):
         info = self.parse_dependencies(filename)[3]
         kwds = info.values
@@ -738,6 +800,93 @@ def create_dependency_tree(ctx=None, quiet=False):
     return _dep_tree
 
 
+class ContentManifest(object):
+    """
+    Records in the cythonize cache directory from which dependencies
+    (by content) and options each generated C file was created.
+
+    A C file whose recorded content fingerprint is still current does not
+    need to be regenerated, even if its timestamp is older than that of its
+    sources, e.g. after a fresh checkout or after restoring a CI cache.
+    The hash of the C file itself is recorded as well, so that C files that
+    were replaced in the meantime are not trusted.
+    """
+    filename = 'manifest.json'
+
+    def __init__(self, cache_dir):
+        self.path = join_path(cache_dir, self.filename)
+        self.outputs = {}
+        self.changed = False
+        try:
+            with io_open(self.path, encoding='UTF-8') as f:
+                data = json.load(f)
+            if data.get('cython_version') == __version__:
+                self.outputs = dict(data['outputs'])
+        except (EnvironmentError, ValueError, KeyError, TypeError, AttributeError):
+            pass  # missing or unusable manifest => start a new one
+
+    def is_up_to_date(self, c_file, fingerprint):
+        entry = self.outputs.get(manifest_key(c_file))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        try:
+            return content_hash(c_file) == entry.get('output_hash')
+        except EnvironmentError:
+            return False
+
+    def changed_dependencies(self, c_file, dependencies):
+        """
+        Return the dependencies whose content differs from the one recorded
+        for 'c_file', or None if nothing was recorded for it.
+        """
+        entry = self.outputs.get(manifest_key(c_file))
+        if not entry:
+            return None
+        old_dependencies = entry.get('dependencies', {})
+        return sorted(
+            key for key, file_content_hash in dependencies.items()
+            if old_dependencies.get(key) != file_content_hash)
+
+    def record(self, c_file, fingerprint, dependencies):
+        key = manifest_key(c_file)
+        if Utils.file_generated_by_this_cython(c_file):
+            try:
+                self.outputs[key] = {
+                    'fingerprint': fingerprint,
+                    'output_hash': content_hash(c_file),
+                    'dependencies': dependencies,
+                }
+                self.changed = True
+                return
+            except EnvironmentError:
+                pass
+        if self.outputs.pop(key, None) is not None:
+            self.changed = True
+
+    def save(self):
+        """
+        Write the manifest if it changed.  Failures are ignored since the
+        manifest only serves to avoid regenerating C files.
+        """
+        if not self.changed:
+            return
+        data = json.dumps({'cython_version': __version__, 'outputs': self.outputs},
+                          indent=1, sort_keys=True)
+        if not isinstance(data, type(u'')):
+            data = data.decode('UTF-8')
+        tmp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        try:
+            with io_open(tmp_path, 'w', encoding='UTF-8') as f:
+                f.write(data)
+            if os.name == 'nt' and os.path.exists(self.path):
+                os.remove(self.path)  # os.rename() does not replace files on Windows
+            os.rename(tmp_path, self.path)
+            self.changed = False
+        except EnvironmentError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 # If this changes, change also docs/src/reference/compilation.rst
 # which mentions this function
 def default_create_extension(template, kwds):
@@ -957,12 +1106,38 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
     :param annotate-fullc: If ``True`` will produce a colorized HTML version of
                            the source which includes entire generated C/C++-code.
 
+    :param annotate_report: If set to ``"json"`` or ``"csv"``, will write the number of
+                            Python C-API calls, reference counting operations, exception
+                            checks, GIL acquisitions and boxing/unboxing conversions of
+                            each line and function into a machine-readable
+                            ``.interactions.json`` or ``.interactions.csv`` file
+                            next to the generated C file.
+
 
     :param compiler_directives: Allow to set compiler directives in the ``setup.py`` like this:
                                 ``compiler_directives={'embedsignature': True}``.
                                 See :ref:`compiler-directives`.
 
     :param depfile: produce depfiles for the sources if True.
+
+    :param cache: If ``True`` or a directory name, generated C files are stored in a cache
+                  under a fingerprint of their sources and options, and restored from there
+                  instead of compiling the same sources again.  The cache also keeps a manifest
+                  of the content hashes from which the current C files were generated, so that
+                  C files whose sources only got new timestamps (e.g. in a fresh checkout) are
+                  not regenerated.  ``True`` uses the ``compiler`` subdirectory of the Cython
+                  cache directory.
+
+    :param pxd_cache: If ``True`` or a directory name, the parse trees of cimported ``.pxd``
+                      files are stored on disk and reused by later compiler runs instead of
+                      re-parsing unchanged files.  ``True`` uses the ``pxd`` subdirectory
+                      of the Cython cache directory.
+
+    :param profile_compiler: Name of a JSON file to which the time, memory allocations
+                             and tree size of each compiler pipeline stage are written,
+                             per module and summed up over all compiled modules.
+                             Modules that were profiled in earlier runs stay in the
+                             report unless they are compiled again.
     """
     if exclude is None:
         exclude = []
@@ -1011,6 +1186,10 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
                                 os.path.dirname(_relpath(filepath, root)))
             copy_once_if_newer(filepath_abs, mod_dir)
 
+    # content fingerprints of the sources, see ContentManifest
+    manifest = ContentManifest(options.cache) if options.cache else None
+    manifest_updates = []
+
     modules_by_cfile = collections.defaultdict(list)
     to_compile = []
     for m in module_list:
@@ -1070,8 +1249,18 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
                 else:
                     dep_timestamp, dep = deps.newest_dependency(source)
                     priority = 2 - (dep in deps.immediate_dependencies(source))
+                content_fingerprint = dependency_hashes = None
+                if manifest is not None and (force or c_timestamp < dep_timestamp):
+                    content_fingerprint, dependency_hashes = deps.content_fingerprint(source, m, options)
+                    if not force and content_fingerprint and manifest.is_up_to_date(c_file, content_fingerprint):
+                        # Only the timestamps changed, e.g. in a fresh checkout.
+                        dep_timestamp = c_timestamp
                 if force or c_timestamp < dep_timestamp:
                     if not quiet and not force:
+                        if content_fingerprint:
+                            changed = manifest.changed_dependencies(c_file, dependency_hashes)
+                            if changed and manifest_key(source) not in changed:
+                                dep = changed[0]
                         if source == dep:
                             print(u"Compiling %s because it changed." % Utils.decode_filename(source))
                         else:
@@ -1087,6 +1276,8 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
                         priority, source, c_file, fingerprint, quiet,
                         options, not exclude_failures, module_metadata.get(m.name),
                         full_module_name, show_all_warnings))
+                    if content_fingerprint:
+                        manifest_updates.append((c_file, content_fingerprint, dependency_hashes))
                 new_sources.append(c_file)
                 modules_by_cfile[c_file].append(m)
             else:
@@ -1111,6 +1302,12 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
         nthreads = 0
     if nthreads:
         import multiprocessing
+        if _forks_worker_processes(multiprocessing):
+            # Load the compiler once here instead of once in every worker.
+            # The forked workers share the loaded modules and caches
+            # (copy-on-write) with this process.
+            from ..Compiler.Main import warm_up
+            warm_up(options)
         pool = multiprocessing.Pool(
             nthreads, initializer=_init_multiprocessing_helper)
         # This is a bit more involved than it should be, because KeyboardInterrupts
@@ -1129,9 +1326,18 @@ def cythonize(module_list, exclude=None, nthreads=0, aliases=None, quiet=False,
             pool.terminate()
             raise
         pool.join()
+        profiles = result.get() if result.successful() else []
     else:
-        for args in to_compile:
-            cythonize_one(*args)
+        profiles = [cythonize_one(*args) for args in to_compile]
+
+    if manifest is not None:
+        for c_file, content_fingerprint, dependency_hashes in manifest_updates:
+            manifest.record(c_file, content_fingerprint, dependency_hashes)
+        manifest.save()
+
+    if options.profile_compiler:
+        from ..Compiler.CompilerProfile import write_report
+        write_report(options.profile_compiler, [profile for profile in profiles if profile])
 
     if exclude_failures:
         failed_modules = set()
@@ -1201,9 +1407,10 @@ if os.environ.get('XML_RESULTS'):
         def with_record(*args):
             t = time.time()
             success = True
+            result = None
             try:
                 try:
-                    func(*args)
+                    result = func(*args)
                 except:
                     success = False
             finally:
@@ -1225,6 +1432,7 @@ if os.environ.get('XML_RESULTS'):
                     </testsuite>
                 """.strip() % locals())
                 output.close()
+            return result
         return with_record
 else:
     def record_results(func):
@@ -1318,6 +1526,8 @@ def cythonize_one(pyx_file, c_file, fingerprint, quiet, options=None,
                     zip.write(artifact, os.path.basename(artifact))
         os.rename(fingerprint_file + '.tmp', fingerprint_file)
 
+    return result.compiler_profile if not any_failures else None
+
 
 def cythonize_one_helper(m):
     import traceback
@@ -1328,6 +1538,14 @@ def cythonize_one_helper(m):
         raise
 
 
+def _forks_worker_processes(multiprocessing):
+    try:
+        return multiprocessing.get_start_method() == 'fork'
+    except AttributeError:
+        # Py2 always forks on POSIX systems
+        return os.name == 'posix'
+
+
 def _init_multiprocessing_helper():
     # KeyboardInterrupt kills workers, so don't let them get it
     import signal
@@ -2,9 +2,13 @@ from __future__ import absolute_import
 
 import hashlib
 import inspect
+import json
 import os
 import re
+import shutil
 import sys
+import tempfile
+import time
 
 from distutils.core import Distribution, Extension
 from distutils.command.build_ext import build_ext
@@ -20,7 +24,7 @@ from ..Compiler.TreeFragment import parse_from_strings
 from ..Compiler.StringEncoding import _unicode
 from .Dependencies import strip_string_literals, cythonize, cached_function
 from ..Compiler import Pipeline
-from ..Utils import get_cython_cache_dir
+from ..Utils import get_cython_cache_dir, safe_makedirs, file_lock
 import cython as cython_module
 
 
@@ -164,6 +168,179 @@ def _inline_key(orig_code, arg_sigs, language_level):
     return hashlib.sha1(_unicode(key).encode('utf-8')).hexdigest()
 
 
+def _code_key(orig_code):
+    return hashlib.sha1(to_unicode(orig_code).encode('utf-8')).hexdigest()
+
+
+class _InlineCacheIndex(object):
+    """
+    Persistent index of the modules in an inline cache directory.
+
+    It remembers the unbound symbols of the code snippets, so that a new
+    process does not have to parse the code again, and when each module was
+    last used, so that unused modules can be evicted.  All processes that
+    use the directory share the index file and merge their updates into it
+    under a file lock.
+    """
+    filename = 'index.json'
+
+    def __init__(self, lib_dir):
+        self.lib_dir = lib_dir
+        self.path = os.path.join(lib_dir, self.filename)
+        self.lock_path = self.path + '.lock'
+        self.symbols = {}
+        self.modules = {}
+        self._new_symbols = {}
+        self._used_modules = {}
+        self._mtime = None
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}, {}
+        if data.get('cython_version') != Cython.__version__:
+            # Symbols might differ between Cython versions, and the modules are rebuilt anyway.
+            return {}, data.get('modules', {})
+        return data.get('symbols', {}), data.get('modules', {})
+
+    def _refresh(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self.symbols, self.modules = self._read()
+
+    def unbound_symbols(self, orig_code):
+        code_key = _code_key(orig_code)
+        symbols = self._new_symbols.get(code_key)
+        if symbols is None:
+            self._refresh()
+            symbols = self.symbols.get(code_key)
+        return tuple(symbols) if symbols is not None else None
+
+    def add_symbols(self, orig_code, symbols):
+        self._new_symbols[_code_key(orig_code)] = sorted(symbols)
+
+    def use_module(self, module_name, orig_code):
+        self._used_modules[module_name] = {'code': _code_key(orig_code), 'last_used': time.time()}
+
+    def save(self, max_size=None, max_age=None):
+        """
+        Merge the changes of this process into the index file and evict
+        modules that exceed the age and size limits.
+        """
+        with file_lock(self.lock_path):
+            self.symbols, self.modules = self._read()
+            self.symbols.update(self._new_symbols)
+            self.modules.update(self._used_modules)
+            self._new_symbols.clear()
+            self._used_modules.clear()
+            if max_size is not None or max_age is not None:
+                self._evict(max_size, max_age)
+            self._write()
+
+    def _write(self):
+        data = {
+            'cython_version': Cython.__version__,
+            'symbols': self.symbols,
+            'modules': self.modules,
+        }
+        temp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, sort_keys=True)
+        if sys.platform == 'win32' and os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(temp_path, self.path)
+        self._mtime = os.path.getmtime(self.path)
+
+    def _module_files(self):
+        module_files = {}
+        for dirpath, dirnames, filenames in os.walk(self.lib_dir):
+            # Skip the temporary build directories of running builds.
+            dirnames[:] = [dirname for dirname in dirnames if not dirname.startswith('_cython_inline_')]
+            for filename in filenames:
+                if filename.startswith('_cython_inline_') and not filename.endswith('.lock'):
+                    module_name = filename.split('.', 1)[0]
+                    module_files.setdefault(module_name, []).append(os.path.join(dirpath, filename))
+        return module_files
+
+    def _evict(self, max_size, max_age):
+        now = time.time()
+        modules = []
+        total_size = 0
+        for module_name, paths in self._module_files().items():
+            size = 0
+            last_used = 0
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                size += stat.st_size
+                last_used = max(last_used, stat.st_mtime)
+            if module_name in self.modules:
+                last_used = self.modules[module_name]['last_used']
+            total_size += size
+            modules.append((last_used, size, module_name, paths))
+
+        present = set(module_name for _, _, module_name, _ in modules)
+        for module_name in list(self.modules):
+            if module_name not in present:
+                del self.modules[module_name]
+
+        # Evict the least recently used modules first.
+        evict = []
+        modules.sort()
+        for last_used, size, module_name, paths in modules:
+            expired = max_age is not None and last_used < now - max_age
+            too_large = max_size is not None and total_size > max_size
+            if not (expired or too_large):
+                break
+            if module_name in sys.modules:
+                continue
+            # Skip modules that another process is building right now.  The
+            # lock file itself is kept, since another process might already
+            # have opened it to wait for the lock.
+            with file_lock(os.path.join(self.lib_dir, module_name + '.lock'), blocking=False) as locked:
+                if not locked:
+                    continue
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            evict.append(module_name)
+            total_size -= size
+
+        for module_name in evict:
+            self.modules.pop(module_name, None)
+        if evict:
+            used_code = set(module['code'] for module in self.modules.values())
+            for code_key in list(self.symbols):
+                if code_key not in used_code:
+                    del self.symbols[code_key]
+
+
+_inline_cache_indices = {}
+
+
+def _get_inline_cache_index(lib_dir):
+    index = _inline_cache_indices.get(lib_dir)
+    if index is None:
+        index = _inline_cache_indices[lib_dir] = _InlineCacheIndex(lib_dir)
+    return index
+
+
+def _strip_code(orig_code):
+    code = to_unicode(orig_code)
+    code, literals = strip_string_literals(code)
+    return strip_common_indent(code), literals
+
+
 def cython_inline(code, get_type=unsafe_type,
                   lib_dir=os.path.join(get_cython_cache_dir(), 'inline'),
                   cython_include_dirs=None, cython_compiler_directives=None,
@@ -194,20 +371,28 @@ def cython_inline(code, get_type=unsafe_type,
             return invoke(*arg_list)
 
     orig_code = code
-    code = to_unicode(code)
-    code, literals = strip_string_literals(code)
-    code = strip_common_indent(code)
+    code = literals = None
+    lib_dir = os.path.abspath(lib_dir)
+    cache_index = _get_inline_cache_index(lib_dir)
     if locals is None:
         locals = inspect.currentframe().f_back.f_back.f_locals
     if globals is None:
         globals = inspect.currentframe().f_back.f_back.f_globals
-    try:
-        _cython_inline_cache[orig_code] = _unbound_symbols = unbound_symbols(code)
+    if _unbound_symbols is None:
+        # Look up the symbols that an earlier process found before parsing the code.
+        _unbound_symbols = cache_index.unbound_symbols(orig_code)
+    if _unbound_symbols is None:
+        code, literals = _strip_code(orig_code)
+        try:
+            _unbound_symbols = unbound_symbols(code)
+            cache_index.add_symbols(orig_code, _unbound_symbols)
+        except AssertionError:
+            if not quiet:
+                # Parsing from strings not fully supported (e.g. cimports).
+                print("Could not parse code as a string (to extract unbound symbols).")
+    if _unbound_symbols is not None:
+        _cython_inline_cache[orig_code] = _unbound_symbols
         _populate_unbound(kwds, _unbound_symbols, locals, globals)
-    except AssertionError:
-        if not quiet:
-            # Parsing from strings not fully supported (e.g. cimports).
-            print("Could not parse code as a string (to extract unbound symbols).")
 
     cimports = []
     for name, arg in list(kwds.items()):
@@ -230,63 +415,21 @@ def cython_inline(code, get_type=unsafe_type,
             build_extension = _get_build_extension()
             cython_inline.so_ext = build_extension.get_ext_filename('')
 
-        lib_dir = os.path.abspath(lib_dir)
         module_path = os.path.join(lib_dir, module_name + cython_inline.so_ext)
 
         if not os.path.exists(lib_dir):
-            os.makedirs(lib_dir)
+            safe_makedirs(lib_dir)
+        built = False
         if force or not os.path.isfile(module_path):
-            cflags = []
-            define_macros = []
-            c_include_dirs = []
-            qualified = re.compile(r'([.\w]+)[.]')
-            for type, _ in arg_sigs:
-                m = qualified.match(type)
-                if m:
-                    cimports.append('\ncimport %s' % m.groups()[0])
-                    # one special case
-                    if m.groups()[0] == 'numpy':
-                        import numpy
-                        c_include_dirs.append(numpy.get_include())
-                        define_macros.append(("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION"))
-                        # cflags.append('-Wno-unused')
-            module_body, func_body = extract_func_code(code)
-            params = ', '.join(['%s %s' % a for a in arg_sigs])
-            module_code = """
-%(module_body)s
-%(cimports)s
-def __invoke(%(params)s):
-%(func_body)s
-    return locals()
-            """ % {'cimports': '\n'.join(cimports),
-                   'module_body': module_body,
-                   'params': params,
-                   'func_body': func_body }
-            for key, value in literals.items():
-                module_code = module_code.replace(key, value)
-            pyx_file = os.path.join(lib_dir, module_name + '.pyx')
-            fh = open(pyx_file, 'w')
-            try:
-                fh.write(module_code)
-            finally:
-                fh.close()
-            extension = Extension(
-                name=module_name,
-                sources=[pyx_file],
-                include_dirs=c_include_dirs or None,
-                extra_compile_args=cflags or None,
-                define_macros=define_macros or None,
-            )
-            if build_extension is None:
-                build_extension = _get_build_extension()
-            build_extension.extensions = cythonize(
-                [extension],
-                include_path=cython_include_dirs or ['.'],
-                compiler_directives=cython_compiler_directives,
-                quiet=quiet)
-            build_extension.build_temp = os.path.dirname(pyx_file)
-            build_extension.build_lib  = lib_dir
-            build_extension.run()
+            with file_lock(os.path.join(lib_dir, module_name + '.lock')):
+                # Another process might have built the module while we were waiting.
+                if force or not os.path.isfile(module_path):
+                    if code is None:
+                        code, literals = _strip_code(orig_code)
+                    _build_inline_module(
+                        module_name, module_path, code, literals, cimports, arg_sigs, lib_dir,
+                        cython_include_dirs, cython_compiler_directives, quiet, build_extension)
+                    built = True
 
         if sys.platform == 'win32' and sys.version_info >= (3, 8):
             with os.add_dll_directory(os.path.abspath(lib_dir)):
@@ -294,15 +437,92 @@ def __invoke(%(params)s):
         else:
             module = load_dynamic(module_name, module_path)
 
+        cache_index.use_module(module_name, orig_code)
+        if built:
+            # Only new modules make the directory grow.
+            cache_index.save(cython_inline.cache_size, cython_inline.cache_max_age)
+        else:
+            cache_index.save()
+
     _cython_inline_cache[orig_code, arg_sigs, key_hash] = module.__invoke
     arg_list = [kwds[arg] for arg in arg_names]
     return module.__invoke(*arg_list)
 
 
+def _build_inline_module(module_name, module_path, code, literals, cimports, arg_sigs, lib_dir,
+                         cython_include_dirs, cython_compiler_directives, quiet, build_extension=None):
+    cflags = []
+    define_macros = []
+    c_include_dirs = []
+    qualified = re.compile(r'([.\w]+)[.]')
+    for type, _ in arg_sigs:
+        m = qualified.match(type)
+        if m:
+            cimports.append('\ncimport %s' % m.groups()[0])
+            # one special case
+            if m.groups()[0] == 'numpy':
+                import numpy
+                c_include_dirs.append(numpy.get_include())
+                define_macros.append(("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION"))
+                # cflags.append('-Wno-unused')
+    module_body, func_body = extract_func_code(code)
+    params = ', '.join(['%s %s' % a for a in arg_sigs])
+    module_code = """
+%(module_body)s
+%(cimports)s
+def __invoke(%(params)s):
+%(func_body)s
+    return locals()
+    """ % {'cimports': '\n'.join(cimports),
+           'module_body': module_body,
+           'params': params,
+           'func_body': func_body }
+    for key, value in literals.items():
+        module_code = module_code.replace(key, value)
+    pyx_file = os.path.join(lib_dir, module_name + '.pyx')
+    fh = open(pyx_file, 'w')
+    try:
+        fh.write(module_code)
+    finally:
+        fh.close()
+    extension = Extension(
+        name=module_name,
+        sources=[pyx_file],
+        include_dirs=c_include_dirs or None,
+        extra_compile_args=cflags or None,
+        define_macros=define_macros or None,
+    )
+    if build_extension is None:
+        build_extension = _get_build_extension()
+    build_extension.extensions = cythonize(
+        [extension],
+        include_path=cython_include_dirs or ['.'],
+        compiler_directives=cython_compiler_directives,
+        quiet=quiet)
+    build_extension.build_temp = os.path.dirname(pyx_file)
+    # Link into a private directory and move the module into place afterwards,
+    # so that other processes never load a partially written module.
+    build_extension.build_lib = tempfile.mkdtemp(prefix=module_name + '.', dir=lib_dir)
+    try:
+        build_extension.run()
+        if sys.platform == 'win32' and os.path.exists(module_path):
+            os.remove(module_path)
+        os.rename(os.path.join(build_extension.build_lib, os.path.basename(module_path)), module_path)
+    finally:
+        shutil.rmtree(build_extension.build_lib, ignore_errors=True)
+
+
 # Cached suffix used by cython_inline above.  None should get
 # overridden with actual value upon the first cython_inline invocation
 cython_inline.so_ext = None
 
+# Limits for the modules kept in the cache directory.  When a new module
+# gets built, modules that were not used for 'cache_max_age' seconds are
+# removed, and then the least recently used ones until all modules fit
+# into 'cache_size' bytes.  None disables the respective limit.
+cython_inline.cache_size = 500 * 1024 * 1024
+cython_inline.cache_max_age = 30 * 24 * 60 * 60
+
 _find_non_space = re.compile('[^ ]').search
 
 
@@ -76,23 +76,10 @@ from ..Shadow import __version__ as cython_version
 from ..Compiler.Errors import CompileError
 from .Inline import cython_inline, load_dynamic
 from .Dependencies import cythonize
+from .ProfileGuided import PGO_CONFIG, get_pgo_flags
 from ..Utils import captured_fd, print_captured
 
 
-PGO_CONFIG = {
-    'gcc': {
-        'gen': ['-fprofile-generate', '-fprofile-dir={TEMPDIR}'],
-        'use': ['-fprofile-use', '-fprofile-correction', '-fprofile-dir={TEMPDIR}'],
-    },
-    # blind copy from 'configure' script in CPython 3.7
-    'icc': {
-        'gen': ['-prof-gen'],
-        'use': ['-prof-use'],
-    }
-}
-PGO_CONFIG['mingw32'] = PGO_CONFIG['gcc']
-
-
 if IS_PY2:
     def encode_fs(name):
         return name if isinstance(name, bytes) else name.encode(IO_ENCODING)
@@ -469,31 +456,13 @@ class CythonMagics(Magics):
                 distutils.log.set_threshold(old_threshold)
 
     def _add_pgo_flags(self, build_extension, step_name, temp_dir):
-        compiler_type = build_extension.compiler.compiler_type
-        if compiler_type == 'unix':
-            compiler_cmd = build_extension.compiler.compiler_so
-            # TODO: we could try to call "[cmd] --version" for better insights
-            if not compiler_cmd:
-                pass
-            elif 'clang' in compiler_cmd or 'clang' in compiler_cmd[0]:
-                compiler_type = 'clang'
-            elif 'icc' in compiler_cmd or 'icc' in compiler_cmd[0]:
-                compiler_type = 'icc'
-            elif 'gcc' in compiler_cmd or 'gcc' in compiler_cmd[0]:
-                compiler_type = 'gcc'
-            elif 'g++' in compiler_cmd or 'g++' in compiler_cmd[0]:
-                compiler_type = 'gcc'
-        config = PGO_CONFIG.get(compiler_type)
+        flags = get_pgo_flags(build_extension.compiler, step_name, temp_dir)
         orig_flags = []
-        if config and step_name in config:
-            flags = [f.format(TEMPDIR=temp_dir) for f in config[step_name]]
+        if flags:
             for extension in build_extension.extensions:
                 orig_flags.append((extension.extra_compile_args, extension.extra_link_args))
                 extension.extra_compile_args = extension.extra_compile_args + flags
                 extension.extra_link_args = extension.extra_link_args + flags
-        else:
-            print("No PGO %s configuration known for C compiler type '%s'" % (step_name, compiler_type),
-                  file=sys.stderr)
         return orig_flags
 
     @property
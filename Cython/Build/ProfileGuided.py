@@ -0,0 +1,100 @@
+"""
+C compiler support for profile guided optimisation (PGO).
+
+A PGO build compiles the extension modules twice: first with instrumentation
+('gen' step), then, after running a representative workload that writes the
+runtime profile, optimised for that profile ('use' step).
+"""
+
+from __future__ import absolute_import, print_function
+
+import glob
+import os
+import subprocess
+import sys
+
+
+PGO_CONFIG = {
+    'gcc': {
+        'gen': ['-fprofile-generate', '-fprofile-dir={TEMPDIR}'],
+        'use': ['-fprofile-use', '-fprofile-correction', '-fprofile-dir={TEMPDIR}'],
+    },
+    # clang writes raw profiles that must be merged with llvm-profdata before the 'use' step
+    'clang': {
+        'gen': ['-fprofile-generate={TEMPDIR}'],
+        'use': ['-fprofile-use={TEMPDIR}', '-Wno-profile-instr-unprofiled'],
+    },
+    # blind copy from 'configure' script in CPython 3.7
+    'icc': {
+        'gen': ['-prof-gen'],
+        'use': ['-prof-use'],
+    }
+}
+PGO_CONFIG['mingw32'] = PGO_CONFIG['gcc']
+
+
+def get_compiler_type(compiler):
+    """
+    Return the PGO_CONFIG key for a distutils C compiler instance.
+    """
+    compiler_type = compiler.compiler_type
+    if compiler_type == 'unix':
+        compiler_cmd = compiler.compiler_so
+        # TODO: we could try to call "[cmd] --version" for better insights
+        if not compiler_cmd:
+            pass
+        elif 'clang' in compiler_cmd or 'clang' in compiler_cmd[0]:
+            compiler_type = 'clang'
+        elif 'icc' in compiler_cmd or 'icc' in compiler_cmd[0]:
+            compiler_type = 'icc'
+        elif 'gcc' in compiler_cmd or 'gcc' in compiler_cmd[0]:
+            compiler_type = 'gcc'
+        elif 'g++' in compiler_cmd or 'g++' in compiler_cmd[0]:
+            compiler_type = 'gcc'
+    return compiler_type
+
+
+def _find_llvm_profdata():
+    try:
+        from shutil import which
+    except ImportError:
+        from distutils.spawn import find_executable as which
+    tool = which('llvm-profdata')
+    if tool:
+        return [tool]
+    if sys.platform == 'darwin' and which('xcrun'):
+        return ['xcrun', 'llvm-profdata']
+    return None
+
+
+def merge_clang_profiles(profile_dir):
+    """
+    Merge the raw clang profiles in 'profile_dir' into the 'default.profdata'
+    file that '-fprofile-use' reads.  Returns False if that is not possible.
+    """
+    raw_profiles = glob.glob(os.path.join(profile_dir, '*.profraw'))
+    tool = _find_llvm_profdata()
+    if not raw_profiles or tool is None:
+        return False
+    output = '-output=' + os.path.join(profile_dir, 'default.profdata')
+    return subprocess.call(tool + ['merge', output] + raw_profiles) == 0
+
+
+def get_pgo_flags(compiler, step_name, profile_dir):
+    """
+    Return the C compiler and linker flags for the PGO step 'gen' or 'use'
+    that keep the profile data in 'profile_dir', or None if the C compiler
+    does not support PGO.  For the 'use' step, this also prepares the profile
+    data that the 'gen' step collected.
+    """
+    compiler_type = get_compiler_type(compiler)
+    config = PGO_CONFIG.get(compiler_type)
+    if not config or step_name not in config:
+        print("No PGO %s configuration known for C compiler type '%s'" % (step_name, compiler_type),
+              file=sys.stderr)
+        return None
+    if step_name == 'use' and compiler_type == 'clang' and not merge_clang_profiles(profile_dir):
+        print("Could not merge the PGO profile data in '%s' with llvm-profdata" % profile_dir,
+              file=sys.stderr)
+        return None
+    return [flag.format(TEMPDIR=profile_dir) for flag in config[step_name]]
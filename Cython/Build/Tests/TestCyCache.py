@@ -69,7 +69,7 @@ class TestCyCache(CythonTest):
         with open(a_pyx, 'w') as f:
             f.write('pass')
         self.fresh_cythonize(a_pyx, cache=self.cache_dir)
-        a_cache = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        a_cache = self.cache_files('a.c*')[0]
         gzip.GzipFile(a_cache, 'wb').write('fake stuff'.encode('ascii'))
         os.unlink(a_c)
         self.fresh_cythonize(a_pyx, cache=self.cache_dir)
@@ -114,3 +114,66 @@ class TestCyCache(CythonTest):
         os.unlink(hash_c)
         self.fresh_cythonize(hash_pyx, cache=self.cache_dir, cplus=False, show_version=True)
         self.assertEqual(2, len(self.cache_files('options.c*')))
+
+    def test_manifest_ignores_timestamps(self):
+        a_pyx = os.path.join(self.src_dir, 'a.pyx')
+        a_c = a_pyx[:-4] + '.c'
+        b_pxd = os.path.join(self.src_dir, 'b.pxd')
+        with open(a_pyx, 'w') as f:
+            f.write('cimport b\n\ndef get_value():\n    return b.VALUE\n')
+        with open(b_pxd, 'w') as f:
+            f.write('cdef enum:\n    VALUE = 1\n')
+        self.fresh_cythonize(a_pyx, cache=self.cache_dir)
+        self.assertEqual(1, len(self.cache_files('manifest.json')))
+
+        # sources with new timestamps, as after a fresh checkout
+        os.utime(a_c, (1000, 1000))
+        self.fresh_cythonize(a_pyx, cache=self.cache_dir)
+        self.assertEqual(os.path.getmtime(a_c), 1000)
+
+        # a C file that was replaced is not trusted
+        with open(a_c, 'a') as f:
+            f.write('/* modified */\n')
+        os.utime(a_c, (1000, 1000))
+        self.fresh_cythonize(a_pyx, cache=self.cache_dir)
+        self.assertNotEqual(os.path.getmtime(a_c), 1000)
+        with open(a_c) as f:
+            self.assertNotIn('/* modified */', f.read())
+
+        # a changed dependency
+        os.utime(a_c, (1000, 1000))
+        with open(b_pxd, 'w') as f:
+            f.write('cdef enum:\n    VALUE = 2\n')
+        self.fresh_cythonize(a_pyx, cache=self.cache_dir)
+        self.assertNotEqual(os.path.getmtime(a_c), 1000)
+
+    def test_pxd_cache(self):
+        a_pyx = os.path.join(self.src_dir, 'a.pyx')
+        a_c = a_pyx[:-4] + '.c'
+        b_pxd = os.path.join(self.src_dir, 'b.pxd')
+        with open(a_pyx, 'w') as f:
+            f.write('cimport b\n\ndef get_value():\n    return b.VALUE\n')
+        with open(b_pxd, 'w') as f:
+            f.write('cdef enum:\n    VALUE = 1\n')
+
+        self.fresh_cythonize(a_pyx, pxd_cache=self.cache_dir, force=True)
+        self.assertEqual(1, len(self.cache_files('*.pickle')))
+        with open(a_c) as f:
+            a_contents1 = f.read()
+
+        self.fresh_cythonize(a_pyx, pxd_cache=self.cache_dir, force=True)
+        self.assertEqual(1, len(self.cache_files('*.pickle')))
+        with open(a_c) as f:
+            a_contents = f.read()
+        self.assertEqual(
+            a_contents, a_contents1,
+            msg='\n'.join(list(difflib.unified_diff(
+                a_contents.split('\n'), a_contents1.split('\n')))[:10]))
+
+        with open(b_pxd, 'w') as f:
+            f.write('cdef enum:\n    VALUE = 2\n')
+        self.fresh_cythonize(a_pyx, pxd_cache=self.cache_dir, force=True)
+        self.assertEqual(2, len(self.cache_files('*.pickle')))
+        with open(a_c) as f:
+            a_contents2 = f.read()
+        self.assertNotEqual(a_contents1, a_contents2, 'C file not changed!')
@@ -25,7 +25,8 @@ class TestCythonizeArgsParser(TestCase):
     def are_default(self, options, skip):
         # empty containers
         empty_containers = ['directives', 'compile_time_env', 'options', 'excludes']
-        are_none = ['language_level', 'annotate', 'build', 'build_inplace', 'force', 'quiet', 'lenient', 'keep_going', 'no_docstrings']
+        are_none = ['language_level', 'annotate', 'annotate_report', 'build', 'build_inplace', 'force', 'quiet',
+                    'lenient', 'keep_going', 'no_docstrings', 'pgo_train']
         for opt_name in empty_containers:
             if len(getattr(options, opt_name))!=0 and (opt_name not in skip):
                 self.assertEqual(opt_name,"", msg="For option "+opt_name)
@@ -260,6 +261,24 @@ class TestCythonizeArgsParser(TestCase):
         self.assertTrue(self.are_default(options, ['annotate']))
         self.assertEqual(options.annotate, 'fullc')
 
+    def test_explain_slow(self):
+        options, args =  self.parse_args(['--explain-slow', '-X', 'cdivision=True'])
+        self.assertFalse(args)
+        self.assertTrue(self.are_default(options, ['directives']))
+        self.assertEqual(options.directives, {'cdivision': True, 'warn.performance': True})
+
+    def test_annotate_report(self):
+        options, args =  self.parse_args(['--annotate-report', 'json'])
+        self.assertFalse(args)
+        self.assertTrue(self.are_default(options, ['annotate_report']))
+        self.assertEqual(options.annotate_report, 'json')
+
+    def test_pgo_train(self):
+        options, args =  self.parse_args(['--pgo-train', 'python bench.py'])
+        self.assertFalse(args)
+        self.assertTrue(self.are_default(options, ['pgo_train']))
+        self.assertEqual(options.pgo_train, 'python bench.py')
+
     def test_annotate_and_positional(self):
         options, args =  self.parse_args(['-a', 'foo.pyx'])
         self.assertEqual(args, ['foo.pyx'])
@@ -456,6 +475,11 @@ class TestParseArgs(TestCase):
         self.assertEqual(options.build, True)
         self.check_default_global_options()
 
+    def test_build_set_for_pgo_train(self):
+        options, args = parse_args(['foo.pyx', '--pgo-train', 'python bench.py'])
+        self.assertEqual(options.build, True)
+        self.check_default_global_options()
+
     def test_lenient(self):
         options, sources = parse_args(['foo.pyx', '--lenient'])
         self.assertEqual(sources, ['foo.pyx'])
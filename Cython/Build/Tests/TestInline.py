@@ -1,9 +1,14 @@
+import json
 import os
+import shutil
 import tempfile
+import time
 import unittest
 from Cython.Shadow import inline
+from Cython.Build import Inline
 from Cython.Build.Inline import safe_type
 from Cython.TestUtils import CythonTest
+from Cython.Utils import file_lock
 
 try:
     import numpy
@@ -103,6 +108,80 @@ class TestInline(CythonTest):
         self.assertEqual(f(5, 2), 10)
         self.assertEqual(f(5, 3), 15)
 
+    def test_cache_index(self):
+        lib_dir = tempfile.mkdtemp(prefix='cython_inline_',
+                                   dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.addCleanup(shutil.rmtree, lib_dir)
+        code = "return index_value * 2"
+        index_value = 21
+        self.assertEqual(inline(code, lib_dir=lib_dir, quiet=True), 42)
+        with open(os.path.join(lib_dir, 'index.json')) as f:
+            index = json.load(f)
+        self.assertEqual(list(index['symbols'].values()), [['index_value']])
+        self.assertEqual(len(index['modules']), 1)
+
+        # A new process finds the symbols in the index instead of parsing the code.
+        del Inline._cython_inline_cache[code]
+        Inline._inline_cache_indices.clear()
+        def fail(*args):
+            raise AssertionError("code was parsed again")
+        unbound_symbols, Inline.unbound_symbols = Inline.unbound_symbols, fail
+        try:
+            index_value = 5
+            self.assertEqual(inline(code, lib_dir=lib_dir, quiet=True), 10)
+        finally:
+            Inline.unbound_symbols = unbound_symbols
+
+    def test_cache_eviction(self):
+        lib_dir = tempfile.mkdtemp(prefix='cython_inline_',
+                                   dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.addCleanup(shutil.rmtree, lib_dir)
+        index = Inline._InlineCacheIndex(lib_dir)
+        now = time.time()
+        for name, age in [('old', 100), ('older', 200), ('recent', 10), ('new', 0)]:
+            module_name = '_cython_inline_' + name
+            for ext in ('.pyx', '.c'):
+                with open(os.path.join(lib_dir, module_name + ext), 'w') as f:
+                    f.write('x' * 50)
+            index.modules[module_name] = {'code': name, 'last_used': now - age}
+        index._used_modules.update(index.modules)
+
+        def remaining():
+            return sorted(name[len('_cython_inline_'):].split('.')[0]
+                          for name in os.listdir(lib_dir) if name.endswith('.c'))
+
+        index.save(max_age=150)
+        self.assertEqual(remaining(), ['new', 'old', 'recent'])
+        index.save(max_size=250)
+        self.assertEqual(remaining(), ['new', 'recent'])
+        with open(index.path) as f:
+            self.assertEqual(sorted(json.load(f)['modules']), ['_cython_inline_new', '_cython_inline_recent'])
+
+    def test_cache_eviction_skips_running_builds(self):
+        lib_dir = tempfile.mkdtemp(prefix='cython_inline_',
+                                   dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.addCleanup(shutil.rmtree, lib_dir)
+        index = Inline._InlineCacheIndex(lib_dir)
+        now = time.time()
+        for name in ('building', 'unused'):
+            module_name = '_cython_inline_' + name
+            for ext in ('.pyx', '.c'):
+                with open(os.path.join(lib_dir, module_name + ext), 'w') as f:
+                    f.write('x' * 50)
+            index.modules[module_name] = {'code': name, 'last_used': now - 1000}
+        index._used_modules.update(index.modules)
+        # a temporary build directory and the lock of a build in another process
+        build_dir = tempfile.mkdtemp(prefix='_cython_inline_building.', dir=lib_dir)
+        with open(os.path.join(build_dir, '_cython_inline_building.so'), 'w') as f:
+            f.write('x' * 50)
+
+        with file_lock(os.path.join(lib_dir, '_cython_inline_building.lock')):
+            index.save(max_age=100)
+        self.assertEqual(sorted(os.listdir(lib_dir)), sorted([
+            '_cython_inline_building.c', '_cython_inline_building.lock', '_cython_inline_building.pyx',
+            os.path.basename(build_dir), 'index.json', 'index.json.lock', '_cython_inline_unused.lock']))
+        self.assertEqual(os.listdir(build_dir), ['_cython_inline_building.so'])
+
     @unittest.skipIf(not has_numpy, "NumPy is not available")
     def test_numpy(self):
         import numpy
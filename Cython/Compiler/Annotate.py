@@ -6,6 +6,8 @@ import os
 import os.path
 import re
 import codecs
+import csv
+import json
 import textwrap
 from datetime import datetime
 from functools import partial
@@ -21,6 +23,19 @@ from .Code import CCodeWriter
 from .. import Utils
 
 
+# The kinds of Python interactions in the machine-readable report.
+INTERACTION_KINDS = (
+    'python_api_calls',
+    'python_calls',
+    'python_attributes',
+    'boxing',
+    'unboxing',
+    'refcount_operations',
+    'exception_checks',
+    'gil_acquisitions',
+)
+
+
 class AnnotationCCodeWriter(CCodeWriter):
 
     # also used as marker for detection of complete code emission in tests
@@ -38,12 +53,15 @@ class AnnotationCCodeWriter(CCodeWriter):
             self.code = defaultdict(partial(defaultdict, str))
             # scopes[filename][line] -> set(scopes)
             self.scopes = defaultdict(partial(defaultdict, set))
+            # interactions[filename][line, function][kind] -> count
+            self.interactions = defaultdict(partial(defaultdict, partial(defaultdict, int)))
         else:
             # When creating an insertion point, keep references to the same database
             self.annotation_buffer = create_from.annotation_buffer
             self.annotations = create_from.annotations
             self.code = create_from.code
             self.scopes = create_from.scopes
+            self.interactions = create_from.interactions
             self.last_annotated_pos = create_from.last_annotated_pos
 
     def create_new(self, create_from, buffer, copy_formatting):
@@ -69,6 +87,81 @@ class AnnotationCCodeWriter(CCodeWriter):
     def annotate(self, pos, item):
         self.annotations[pos[0].filename][pos[1]].append((pos[2], item))
 
+    def count_interaction(self, kind, pos=None, function=None):
+        """
+        Count one Python interaction of the given kind at the source line of
+        'pos', or at the line for which code is currently being generated.
+        """
+        if pos is None:
+            pos = self.last_annotated_pos
+            if pos is None:
+                return
+            if self.funcstate and self.funcstate.scope:
+                function = self.funcstate.scope.qualified_name
+            else:
+                # module level setup code, e.g. the creation of constants
+                function = self.globalstate.module_node.scope.qualified_name
+        self.interactions[pos[0].filename][pos[1], function][kind] += 1
+
+    # Python interactions that the code writer sees during code generation.
+    # The expression level interactions are collected from the final tree
+    # by the InteractionCollector below.
+
+    def _count_refcount_operation(self, type, incref=False):
+        # memoryview slices are only increfed through put_incref_memoryviewslice()
+        if type.is_pyobject or (type.is_memoryviewslice and not incref):
+            self.count_interaction('refcount_operations')
+
+    def put_incref(self, cname, type, nanny=True):
+        self._count_refcount_operation(type, incref=True)
+        CCodeWriter.put_incref(self, cname, type, nanny=nanny)
+
+    def put_xincref(self, cname, type, nanny=True):
+        self._count_refcount_operation(type, incref=True)
+        CCodeWriter.put_xincref(self, cname, type, nanny=nanny)
+
+    def put_decref(self, cname, type, nanny=True, have_gil=True):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_decref(self, cname, type, nanny=nanny, have_gil=have_gil)
+
+    def put_xdecref(self, cname, type, nanny=True, have_gil=True):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_xdecref(self, cname, type, nanny=nanny, have_gil=have_gil)
+
+    def put_decref_clear(self, cname, type, clear_before_decref=False, nanny=True, have_gil=True):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_decref_clear(self, cname, type, clear_before_decref=clear_before_decref,
+                                     nanny=nanny, have_gil=have_gil)
+
+    def put_xdecref_clear(self, cname, type, clear_before_decref=False, nanny=True, have_gil=True):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_xdecref_clear(self, cname, type, clear_before_decref=clear_before_decref,
+                                      nanny=nanny, have_gil=have_gil)
+
+    def put_decref_set(self, cname, type, rhs_cname):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_decref_set(self, cname, type, rhs_cname)
+
+    def put_xdecref_set(self, cname, type, rhs_cname):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_xdecref_set(self, cname, type, rhs_cname)
+
+    def put_incref_memoryviewslice(self, slice_cname, type, have_gil):
+        self._count_refcount_operation(type)
+        CCodeWriter.put_incref_memoryviewslice(self, slice_cname, type, have_gil=have_gil)
+
+    def put_ensure_gil(self, declare_gilstate=True, variable=None):
+        self.count_interaction('gil_acquisitions')
+        CCodeWriter.put_ensure_gil(self, declare_gilstate=declare_gilstate, variable=variable)
+
+    def put_acquire_gil(self, variable=None, unknown_gil_state=True):
+        self.count_interaction('gil_acquisitions')
+        CCodeWriter.put_acquire_gil(self, variable=variable, unknown_gil_state=unknown_gil_state)
+
+    def error_goto(self, pos, used=True):
+        self.count_interaction('exception_checks')
+        return CCodeWriter.error_goto(self, pos, used=used)
+
     def _css(self):
         """css template will later allow to choose a colormap"""
         css = [self._css_template]
@@ -128,6 +221,83 @@ class AnnotationCCodeWriter(CCodeWriter):
         with codecs.open(html_filename, "w", encoding="UTF-8") as out_buffer:
             out_buffer.write(self._save_annotation(code, generated_code, c_file, source_filename, coverage_xml))
 
+    def collect_interactions(self, module_node):
+        """
+        Count the Python interactions of the expressions in the (fully
+        generated) module tree.
+        """
+        from . import ExprNodes, Nodes
+
+        def collect(node, function):
+            if isinstance(node, Nodes.FuncDefNode) and getattr(node, 'local_scope', None) is not None:
+                function = node.local_scope.qualified_name
+            elif isinstance(node, ExprNodes.ExprNode) and node.type is not None:
+                kind = None
+                if isinstance(node, ExprNodes.CoerceToPyTypeNode):
+                    kind = 'boxing'
+                elif isinstance(node, ExprNodes.CoerceFromPyTypeNode):
+                    kind = 'unboxing'
+                elif isinstance(node, ExprNodes.CoercionNode):
+                    pass
+                elif node.is_temp and node.type.is_pyobject:
+                    kind = 'python_api_calls'
+                if kind:
+                    self.count_interaction(kind, node.pos, function)
+                if isinstance(node, ExprNodes.AttributeNode) and node.is_py_attr:
+                    self.count_interaction('python_attributes', node.pos, function)
+                elif isinstance(node, (ExprNodes.SimpleCallNode, ExprNodes.GeneralCallNode)) and (
+                        node.function.type.is_pyobject):
+                    self.count_interaction('python_calls', node.pos, function)
+            for attr in node.child_attrs or ():
+                child = getattr(node, attr, None)
+                if child is None:
+                    continue
+                for child_node in (child if isinstance(child, list) else [child]):
+                    if isinstance(child_node, Nodes.Node):
+                        collect(child_node, function)
+
+        collect(module_node, module_node.scope.qualified_name)
+
+    def save_interaction_report(self, source_filename, target_filename, report_format='json'):
+        """
+        Write the Python interactions of each line and function of the source
+        file into a JSON or CSV file next to the target file.
+        """
+        lines = sorted(
+            (line, function or '', counts)
+            for (line, function), counts in self.interactions.get(source_filename, {}).items()
+        )
+        report_filename = os.path.splitext(target_filename)[0] + '.interactions.' + report_format
+
+        if report_format == 'csv':
+            with open(report_filename, 'w') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(('line', 'function') + INTERACTION_KINDS)
+                for line, function, counts in lines:
+                    writer.writerow((line, function) + tuple(counts.get(kind, 0) for kind in INTERACTION_KINDS))
+            return
+
+        functions = {}
+        for line, function, counts in lines:
+            totals = functions.get(function)
+            if totals is None:
+                totals = functions[function] = dict((kind, 0) for kind in INTERACTION_KINDS)
+                totals['line'] = line
+            for kind in INTERACTION_KINDS:
+                totals[kind] += counts.get(kind, 0)
+        report = {
+            'source': os.path.basename(source_filename),
+            'interactions': INTERACTION_KINDS,
+            'functions': functions,
+            'lines': [
+                dict([('line', line), ('function', function)] +
+                     [(kind, counts.get(kind, 0)) for kind in INTERACTION_KINDS])
+                for line, function, counts in lines
+            ],
+        }
+        with open(report_filename, 'w') as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
     def _save_annotation_header(self, c_file, source_filename, coverage_timestamp=None):
         coverage_info = ''
         if coverage_timestamp:
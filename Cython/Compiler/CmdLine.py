@@ -51,6 +51,13 @@ class ActivateAllWarningsAction(Action):
         namespace.compiler_directives = directives
 
 
+class ActivatePerformanceHintsAction(Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        directives = dict(getattr(namespace, self.dest, None) or {})
+        directives['warn.performance'] = True
+        setattr(namespace, self.dest, directives)
+
+
 class SetLenientAction(Action):
     def __call__(self, parser, namespace, values, option_string=None):
         namespace.error_on_unknown_names = False
@@ -115,6 +122,10 @@ def create_cython_argparser():
     parser.add_argument('--annotate-fullc', action='store_const', const='fullc', dest='annotate',
                       help='Produce a colorized HTML version of the source '
                            'which includes entire generated C/C++-code.')
+    parser.add_argument('--annotate-report', dest='annotate_report', metavar='FORMAT',
+                      choices=('json', 'csv'), action='store', type=str,
+                      help='Write the Python interactions of each line and function of the source '
+                           'into a machine-readable .interactions.FORMAT file ("json" or "csv").')
     parser.add_argument("--annotate-coverage", dest='annotate_coverage_xml', action=SetAnnotateCoverageAction, type=str,
                       help='Annotate and include coverage information from cov.xml.')
     parser.add_argument("--line-directives", dest='emit_linenums', action='store_true',
@@ -142,6 +153,9 @@ def create_cython_argparser():
                       help='Make all warnings into errors')
     parser.add_argument("-Wextra", "--warning-extra", action=ActivateAllWarningsAction, nargs=0,
                       help='Enable extra warnings')
+    parser.add_argument("--explain-slow", dest='compiler_directives', action=ActivatePerformanceHintsAction, nargs=0,
+                      help='Explain why loops and expressions were not compiled to plain C code '
+                           '(same as "-X warn.performance=True")')
 
     parser.add_argument('-X', '--directive', metavar='NAME=VALUE,...',
                       dest='compiler_directives', type=str,
@@ -157,6 +171,20 @@ def create_cython_argparser():
                            'deduced from the import path if source file is in '
                            'a package, or equals the filename otherwise.')
     parser.add_argument('-M', '--depfile', action='store_true', help='produce depfiles for the sources')
+    parser.add_argument('--pxd-cache', dest='pxd_cache', action='store_const', const=True,
+                      help='Cache the parsed .pxd files in the Cython cache directory '
+                           'and reuse them in later compiler runs.')
+    parser.add_argument('--pxd-cache-dir', dest='pxd_cache', metavar='DIR', action='store', type=str,
+                      help='Cache the parsed .pxd files in DIR. Implies --pxd-cache.')
+    parser.add_argument('--profile-compiler', dest='profile_compiler', metavar='REPORT.json',
+                      action='store', type=str,
+                      help='Write the time, memory allocations and tree size of each compiler '
+                           'pipeline stage and transform to a JSON report.')
+    parser.add_argument('--server', dest='server', metavar='ADDRESS', action='store', type=str,
+                      help='Run as a compiler server that keeps the compiler loaded and accepts '
+                           'compile requests on ADDRESS ("host:port" or a socket path). '
+                           'Use "python -m Cython.Compiler.Server ADDRESS [options] sources" to send them. '
+                           'Clients authenticate with CYTHON_SERVER_AUTHKEY or the key file that the server writes.')
     parser.add_argument('sources', nargs='*', default=[])
 
     # TODO: add help
@@ -239,7 +267,7 @@ def parse_command_line(args):
 
     if options.use_listing_file and len(sources) > 1:
         parser.error("cython: Only one source file allowed when using -o\n")
-    if len(sources) == 0 and not options.show_version:
+    if len(sources) == 0 and not (options.show_version or getattr(options, 'server', None)):
         parser.error("cython: Need at least one source file\n")
     if Options.embed and len(sources) > 1:
         parser.error("cython: Only one source file allowed when using --embed\n")
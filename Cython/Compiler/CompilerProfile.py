@@ -0,0 +1,220 @@
+#
+#   Profiling of the compiler pipeline (--profile-compiler)
+#
+
+from __future__ import absolute_import
+
+import io
+import json
+import os
+from time import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2
+    tracemalloc = None
+
+from .. import __version__
+from . import Pipeline
+
+
+class ModuleProfile(object):
+    """
+    Records the wall time, the memory allocations and the size of the
+    tree for each pipeline stage while one module is compiled.  Stages of
+    nested pipelines (cimported .pxd files, Cython utility code) are
+    recorded as well, with the name of the nested pipeline and a depth > 0.
+    Their time is included in the time of the enclosing stage.
+
+    Memory is traced with tracemalloc (if available), which slows down
+    the compilation, so the times are mostly useful in relation to each
+    other.
+    """
+
+    def __init__(self, module_name, source_file):
+        self.module_name = module_name
+        self.source_file = source_file
+        self.stages = []
+        self.total_time = 0.0
+        self._depth = 0
+        self._peaks = []  # highest traced memory of the running stages
+        self._start_time = None
+        self._stop_tracing = False
+
+    def start(self):
+        if tracemalloc is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracing = True
+        Pipeline.threadlocal.cython_compiler_profile = self
+        self._start_time = time()
+
+    def stop(self):
+        self.total_time += time() - self._start_time
+        Pipeline.threadlocal.cython_compiler_profile = None
+        if self._stop_tracing:
+            tracemalloc.stop()
+            self._stop_tracing = False
+
+    def run_stage(self, source, phase_name, run, phase, data):
+        """
+        Call 'run(phase, data)' and record its cost.
+        Returns the result and the elapsed time.
+        """
+        trace_memory = tracemalloc is not None and tracemalloc.is_tracing()
+        # The peak can only be measured per stage if it can be reset (Py3.9+).
+        trace_peak = trace_memory and hasattr(tracemalloc, 'reset_peak')
+        if trace_peak:
+            # Remember the peak of the enclosing stage before resetting it.
+            self._update_peak(tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        if trace_memory:
+            memory_before = tracemalloc.get_traced_memory()[0]
+
+        self._depth += 1
+        self._peaks.append(0)
+        try:
+            t = time()
+            data = run(phase, data)
+            t = time() - t
+        finally:
+            self._depth -= 1
+            peak = self._peaks.pop()
+
+        stage = {
+            'stage': phase_name,
+            'pipeline': describe_source(source),
+            'depth': self._depth,
+            'time': t,
+            'memory_allocated': None,
+            'memory_peak': None,
+            'nodes': count_nodes(data),
+        }
+        if trace_memory:
+            memory_after, memory_peak = tracemalloc.get_traced_memory()
+            stage['memory_allocated'] = memory_after - memory_before
+            if trace_peak:
+                peak = max(peak, memory_peak)
+                self._update_peak(peak)
+                stage['memory_peak'] = peak - memory_before
+        self.stages.append(stage)
+        return data, t
+
+    def _update_peak(self, peak):
+        if self._peaks and peak > self._peaks[-1]:
+            self._peaks[-1] = peak
+
+    def as_dict(self):
+        return {
+            'module': self.module_name,
+            'source': self.source_file,
+            'time': self.total_time,
+            'stages': self.stages,
+        }
+
+
+def describe_source(source):
+    name = getattr(source, 'full_module_name', None)
+    if name:
+        return str(name)
+    try:
+        return source.get_description()
+    except AttributeError:
+        return type(source).__name__
+
+
+def count_nodes(tree):
+    """
+    Count the nodes in the tree 'tree', or return None if it is not a tree.
+    """
+    from .Nodes import Node
+    if not isinstance(tree, Node):
+        return None
+    count = 0
+    seen = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        count += 1
+        for attr in node.child_attrs:
+            child = getattr(node, attr, None)
+            if child is None:
+                continue
+            if isinstance(child, list):
+                stack.extend(item for item in child if isinstance(item, Node))
+            elif isinstance(child, Node):
+                stack.append(child)
+    return count
+
+
+def aggregate(modules):
+    """
+    Sum up the top-level stages of all modules by stage name, most
+    expensive first.  Nested pipelines are not counted separately since
+    their cost is part of the enclosing stage.
+    """
+    stages = {}
+    total_time = sum(module['time'] for module in modules)
+    for module in modules:
+        for stage in module['stages']:
+            if stage['depth']:
+                continue
+            try:
+                summary = stages[stage['stage']]
+            except KeyError:
+                summary = stages[stage['stage']] = {
+                    'stage': stage['stage'],
+                    'calls': 0,
+                    'time': 0.0,
+                    'memory_allocated': None,
+                    'memory_peak': None,
+                }
+            summary['calls'] += 1
+            summary['time'] += stage['time']
+            if stage['memory_allocated'] is not None:
+                summary['memory_allocated'] = (summary['memory_allocated'] or 0) + stage['memory_allocated']
+                summary['memory_peak'] = max(summary['memory_peak'] or 0, stage['memory_peak'])
+
+    result = sorted(stages.values(), key=lambda summary: (-summary['time'], summary['stage']))
+    for summary in result:
+        summary['share'] = summary['time'] / total_time if total_time else 0.0
+    return result
+
+
+def write_report(path, modules):
+    """
+    Write the profiles of the compiled modules as JSON report to 'path'.
+
+    Modules in an existing report are kept unless they were compiled
+    again, so that the profiles of several compiler runs (e.g. all
+    cythonize() calls of a setup.py) end up in one report.
+    """
+    modules_by_name = {}
+    try:
+        with io.open(path, encoding='UTF-8') as f:
+            report = json.load(f)
+        if report.get('cython_version') == __version__:
+            for module in report['modules']:
+                modules_by_name[module['module']] = module
+    except (EnvironmentError, ValueError, KeyError, TypeError, AttributeError):
+        pass  # no or unusable report => start a new one
+
+    for module in modules:
+        modules_by_name[module['module']] = module
+    modules = [modules_by_name[name] for name in sorted(modules_by_name)]
+    report = {
+        'cython_version': __version__,
+        'time': sum(module['time'] for module in modules),
+        'stages': aggregate(modules),
+        'modules': modules,
+    }
+
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    data = json.dumps(report, indent=1, sort_keys=True)
+    with io.open(path, 'w', encoding='UTF-8') as f:
+        f.write(data if isinstance(data, type(u'')) else data.decode('UTF-8'))
@@ -221,6 +221,16 @@ def warning(position, message, level=0):
     return warn
 
 
+def performance_hint(position, message, directives):
+    """
+    Explain why some code could not be compiled to efficient C code,
+    if the 'warn.performance' directive is enabled.
+    """
+    if not directives['warn.performance']:
+        return
+    return warning(position, "performance hint: %s" % message, 1)
+
+
 def warn_once(position, message, level=0):
     if level < LEVEL:
         return
@@ -25,7 +25,7 @@ import operator
 
 from .Errors import (
     error, warning, InternalError, CompileError, report_error, local_errors,
-    CannotSpecialize)
+    CannotSpecialize, performance_hint)
 from .Code import UtilityCode, TempitaUtilityCode
 from . import StringEncoding
 from . import Naming
@@ -45,6 +45,7 @@ from . import Symtab
 from .. import Utils
 from .Annotate import AnnotationItem
 from . import Future
+from . import TypeFeedback
 from ..Debugging import print_call_chain
 from .DebugFlags import debug_disposal_code, debug_coercion
 
@@ -4405,8 +4406,14 @@ class IndexNode(_IndexingBaseNode):
 
                     break
             else:
-                # This is a bug
-                raise InternalError("Couldn't find the right signature")
+                entry = self.base.type.entry
+                if entry is not None and entry.fused_cfunction and entry.fused_cfunction.is_restricted:
+                    error(self.pos, "This specialization of '%s' is excluded by cython.fused_specializations()" % (
+                        entry.name))
+                    self.type = error_type
+                else:
+                    # This is a bug
+                    raise InternalError("Couldn't find the right signature")
 
     gil_message = "Indexing Python object"
 
@@ -4913,7 +4920,13 @@ class MemoryViewIndexNode(BufferIndexNode):
                         new_indices.append(value)
 
             elif index.type.is_int or index.type.is_pyobject:
-                if index.type.is_pyobject and not self.warned_untyped_idx:
+                if index.type.is_pyobject and env.directives['warn.performance']:
+                    performance_hint(
+                        index.pos,
+                        "memoryview index is a Python object and gets converted to Py_ssize_t "
+                        "on each access; declare it as a C integer",
+                        env.directives)
+                elif index.type.is_pyobject and not self.warned_untyped_idx:
                     warning(index.pos, "Index should be typed for more efficient access", level=2)
                     MemoryViewIndexNode.warned_untyped_idx = True
 
@@ -11578,6 +11591,8 @@ class BinopNode(ExprNode):
             assert self.type.is_pythran_expr
             self.is_temp = 1
         elif self.is_py_operation():
+            if env.directives['warn.performance']:
+                self.explain_py_operation(env)
             self.coerce_operands_to_pyobjects(env)
             self.type = self.result_type(self.operand1.type,
                                          self.operand2.type, env)
@@ -11588,6 +11603,18 @@ class BinopNode(ExprNode):
         else:
             self.analyse_c_operation(env)
 
+    def explain_py_operation(self, env):
+        # Point out C numbers that get boxed because the other operand is untyped.
+        for c_operand, py_operand in [(self.operand1, self.operand2), (self.operand2, self.operand1)]:
+            if c_operand.type.is_numeric and py_operand.type is py_object_type:
+                performance_hint(
+                    self.pos,
+                    "'%s' operation on a C %s and an untyped Python object is evaluated in Python; "
+                    "declare the type of the other operand to get C arithmetic" % (
+                        self.operator, c_operand.type),
+                    env.directives)
+                break
+
     def is_py_operation(self):
         return self.is_py_operation_types(self.operand1.type, self.operand2.type)
 
@@ -11697,6 +11724,13 @@ class BinopNode(ExprNode):
             extra_args = ", Py_None" if self.operator == '**' else ""
             op1_result = self.operand1.py_result() if type1.is_pyobject else self.operand1.result()
             op2_result = self.operand2.py_result() if type2.is_pyobject else self.operand2.result()
+            if code.globalstate.directives['record_type_feedback'] and self.has_type_feedback():
+                code.globalstate.use_utility_code(UtilityCode.load_cached("TypeFeedback", "Profile.c"))
+                code.putln("{ static __Pyx_TypeFeedbackSite __pyx_site = {%s}; "
+                           "__Pyx_RecordTypeFeedback(&__pyx_site, %s, %s); }" % (
+                    StringEncoding.EncodedString(TypeFeedback.position_key(
+                        code.globalstate.module_node.full_module_name, self.pos)).as_c_string_literal(),
+                    op1_result, op2_result))
             code.putln(
                 "%s = %s(%s, %s%s); %s" % (
                     self.result(),
@@ -11725,6 +11759,13 @@ class BinopNode(ExprNode):
                     self.operand2.type))
         self.type = PyrexTypes.error_type
 
+    def has_type_feedback(self):
+        # Arithmetic on untyped objects, for which the operand types can be
+        # recorded and guarded fast paths be generated.
+        return (self.operator in TypeFeedback.feedback_operators and
+                self.operand1.type is py_object_type and
+                self.operand2.type is py_object_type)
+
 
 class CBinopNode(BinopNode):
 
@@ -11873,6 +11914,16 @@ class NumBinopNode(BinopNode):
                 BinopNode.is_py_operation_types(self, type1, type2))
 
     def py_operation_function(self, code):
+        feedback_file = code.globalstate.directives['type_feedback']
+        if feedback_file and self.has_type_feedback():
+            guarded = TypeFeedback.guarded_operation(
+                code.globalstate.module_node.full_module_name, self.pos, self.operator, feedback_file)
+            if guarded is not None:
+                type_name, op = guarded
+                code.globalstate.use_utility_code(TempitaUtilityCode.load_cached(
+                    "PyGuardedBinop", "Optimize.c",
+                    context=dict(type=type_name, op=op, inplace=self.inplace)))
+                return "__Pyx_Py%s_%s%sGuarded" % (type_name, 'InPlace' if self.inplace else '', op)
         function_name = self.py_functions[self.operator]
         if self.inplace:
             function_name = function_name.replace('PyNumber_', 'PyNumber_InPlace')
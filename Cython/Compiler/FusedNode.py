@@ -37,11 +37,16 @@ class FusedCFuncDefNode(StatListNode):
                             fused function
 
     fused_compound_types    All fused (compound) types (e.g. floating[:])
+    permutations            The (cname, fused_to_specific) pairs of the
+                            generated specializations
+    is_restricted           Whether some specializations were excluded by
+                            @cython.fused_specializations()
     """
 
     __signatures__ = None
     resulting_fused_function = None
     fused_func_assignment = None
+    is_restricted = False
     defaults_tuple = None
     decorators = None
 
@@ -86,6 +91,7 @@ class FusedCFuncDefNode(StatListNode):
             [arg.type for arg in self.node.args if arg.type.is_fused])
         fused_types = self._get_fused_base_types(fused_compound_types)
         permutations = PyrexTypes.get_all_specialized_permutations(fused_types)
+        permutations = self.permutations = self._restrict_permutations(permutations, fused_types, env)
 
         self.fused_compound_types = fused_compound_types
 
@@ -124,6 +130,8 @@ class FusedCFuncDefNode(StatListNode):
         versions.
         """
         permutations = self.node.type.get_all_specialized_permutations()
+        permutations = self.permutations = self._restrict_permutations(
+            permutations, self.node.type.get_fused_types(), env)
         # print 'Node %s has %d specializations:' % (self.node.entry.name,
         #                                            len(permutations))
         # import pprint; pprint.pprint([d for cname, d in permutations])
@@ -211,6 +219,55 @@ class FusedCFuncDefNode(StatListNode):
         else:
             self.py_func = orig_py_func
 
+    def _restrict_permutations(self, permutations, fused_types, env):
+        """
+        Drop the specializations that are excluded by a decorator like
+
+            @cython.fused_specializations(floating=double, integral=(int, long))
+
+        Calls with the excluded types are rejected at compile time (C calls)
+        or by the dispatcher of the Python function.
+        """
+        restrictions = self.node.local_scope.directives.get('fused_specializations')
+        if not restrictions:
+            return permutations
+
+        fused_types_by_name = dict((fused_type.name, fused_type) for fused_type in fused_types)
+        allowed_types = {}
+        for name, type_nodes in restrictions.items():
+            fused_type = fused_types_by_name.get(name)
+            if fused_type is None:
+                error(type_nodes.pos, "'%s' is not a fused type of this function" % name)
+                continue
+            if isinstance(type_nodes, TupleNode):
+                type_nodes = type_nodes.args
+            else:
+                type_nodes = [type_nodes]
+            allowed = []
+            for type_node in type_nodes:
+                specific_type = type_node.analyse_as_type(env)
+                if specific_type is None:
+                    error(type_node.pos, "Unknown type")
+                elif not any(specific_type.same_as(t) for t in fused_type.types):
+                    error(type_node.pos, "'%s' is not a specialization of fused type '%s'" % (
+                        specific_type, name))
+                else:
+                    allowed.append(specific_type)
+            if allowed:
+                allowed_types[fused_type] = allowed
+
+        if self.node.entry.defined_in_pxd:
+            error(self.node.pos, "Specializations of fused functions declared in a .pxd file cannot be restricted")
+            return permutations
+
+        result = [
+            (cname, fused_to_specific) for cname, fused_to_specific in permutations
+            if all(any(fused_to_specific[fused_type].same_as(t) for t in allowed)
+                   for fused_type, allowed in allowed_types.items())
+        ]
+        self.is_restricted = len(result) < len(permutations)
+        return result
+
     def _get_fused_base_types(self, fused_compound_types):
         """
         Get a list of unique basic fused types, from a list of
@@ -594,6 +651,12 @@ class FusedCFuncDefNode(StatListNode):
         Specialize fused types and split into normal types and buffer types.
         """
         specialized_types = PyrexTypes.get_specialized_types(arg.type)
+        if self.is_restricted:
+            generated_types = [arg.type.specialize(fused_to_specific)
+                               for cname, fused_to_specific in self.permutations]
+            specialized_types = [
+                specialized_type for specialized_type in specialized_types
+                if any(specialized_type.same_as(t) for t in generated_types)]
 
         # Prefer long over int, etc by sorting (see type classes in PyrexTypes.py)
         specialized_types.sort()
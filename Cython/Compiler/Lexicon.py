@@ -6,6 +6,16 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import hashlib
+import os
+import struct
+import sys
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
 raw_prefixes = "rR"
 bytes_prefixes = "bB"
 string_prefixes = "fFuU" + bytes_prefixes
@@ -154,6 +164,75 @@ def make_lexicon():
         )
 
 
+# Building the lexicon is expensive, mostly due to the NFA to DFA conversion.
+# The finished state machine is therefore written to a file at build time
+# ('python setup.py build' or 'install') and loaded from there.
+
+lexicon_tables_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Lexicon.tables')
+
+# all sources that influence the generated state machine
+_lexicon_sources = [
+    os.path.join('Compiler', 'Lexicon.py'),
+] + [
+    os.path.join('Plex', name + '.py')
+    for name in ('Actions', 'DFA', 'Lexicons', 'Machines', 'Regexps', 'Transitions')
+]
+
+
+def lexicon_fingerprint():
+    """
+    Return a hash of everything that the lexicon tables depend on.
+    Source files that cannot be read change the hash, so that the
+    tables are rebuilt instead of trusted.
+    """
+    from .. import __version__
+    cython_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    m = hashlib.sha1(__version__.encode('UTF-8'))
+    # the arrays of the state machine are stored as raw bytes
+    m.update(repr((sys.version_info[:2], sys.maxunicode, sys.byteorder, struct.calcsize('i'))).encode('UTF-8'))
+    for path in _lexicon_sources:
+        try:
+            with open(os.path.join(cython_dir, path), 'rb') as f:
+                m.update(f.read())
+        except EnvironmentError:
+            m.update(('missing: ' + path).encode('UTF-8'))
+    return m.hexdigest()
+
+
+def load_lexicon(path=lexicon_tables_file):
+    """
+    Load the lexicon from the tables file, or build it if the file
+    is missing or does not match the current sources.
+    """
+    from ..Plex import Lexicon
+    try:
+        with open(path, 'rb') as f:
+            fingerprint, tables = pickle.load(f)
+        if fingerprint == lexicon_fingerprint():
+            return Lexicon.from_tables(tables)
+    except Exception:
+        # missing, stale or broken => regenerate
+        pass
+    return make_lexicon()
+
+
+def write_lexicon_tables(path=lexicon_tables_file):
+    """
+    Build the lexicon and write its tables to 'path' for load_lexicon().
+    """
+    tables = make_lexicon().to_tables()
+    tmp_path = path + '.tmp%d' % os.getpid()
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((lexicon_fingerprint(), tables), f, 2)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 # BEGIN GENERATED CODE
 # Generated with 'cython-generate-lexicon.py' from:
 # cpython 3.12.0a7+ (heads/master:4cd1cc843a, Apr 11 2023, 10:32:26) [GCC 11.3.0]
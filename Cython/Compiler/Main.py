@@ -371,6 +371,20 @@ class Context(object):
             raise RuntimeError("Only file sources for code supported")
         source_filename = source_desc.filename
         scope.cpp = self.cpp
+
+        pxd_cache = cache_key = None
+        if pxd and self.options is not None:
+            from .PxdCache import get_pxd_cache, parser_state
+            pxd_cache = get_pxd_cache(self.options)
+            if pxd_cache is not None:
+                cache_key = pxd_cache.fingerprint(self, source_desc, full_module_name)
+                if cache_key is not None:
+                    tree = pxd_cache.load(cache_key, source_desc)
+                    if tree is not None:
+                        return tree
+                state_before = parser_state(self)
+                num_included_files = len(scope.included_files)
+
         # Parse the given source file and return a parse tree.
         num_errors = Errors.get_errors_count()
         try:
@@ -393,6 +407,10 @@ class Context(object):
 
         if Errors.get_errors_count() > num_errors:
             raise CompileError()
+        if (cache_key is not None
+                and len(scope.included_files) == num_included_files
+                and parser_state(self) == state_before):
+            pxd_cache.store(cache_key, tree)
         return tree
 
     def _report_decode_error(self, source_desc, exc):
@@ -536,7 +554,17 @@ def run_pipeline(source, options, full_module_name=None, context=None):
                 "Dotted filenames ('%s') are deprecated."
                 " Please use the normal Python package directory layout." % os.path.basename(abs_path), level=1)
 
-    err, enddata = Pipeline.run_pipeline(pipeline, source)
+    profile = None
+    if options.profile_compiler:
+        from .CompilerProfile import ModuleProfile
+        profile = ModuleProfile(full_module_name, abs_path)
+        profile.start()
+    try:
+        err, enddata = Pipeline.run_pipeline(pipeline, source)
+    finally:
+        if profile is not None:
+            profile.stop()
+            result.compiler_profile = profile.as_dict()
     context.teardown_errors(err, options, result)
     if err is None and options.depfile:
         from ..Build.Dependencies import create_dependency_tree
@@ -573,6 +601,7 @@ class CompilationResult(object):
     listing_file     string or None   File of error messages
     object_file      string or None   Result of compiling the C file
     extension_file   string or None   Result of linking the object file
+    compiler_profile dict or None     Pipeline profile (with the 'profile_compiler' option)
     num_errors       integer          Number of compilation errors
     compilation_source CompilationSource
     """
@@ -586,6 +615,7 @@ class CompilationResult(object):
         self.object_file = None
         self.extension_file = None
         self.main_source_file = None
+        self.compiler_profile = None
 
 
 class CompilationResultSet(dict):
@@ -667,9 +697,41 @@ def compile(source, options = None, full_module_name = None, **kwds):
     """
     options = CompilationOptions(defaults = options, **kwds)
     if isinstance(source, basestring) and not options.timestamps:
-        return compile_single(source, options, full_module_name)
+        result = compile_single(source, options, full_module_name)
+        results = [result]
     else:
-        return compile_multiple(source, options)
+        result = compile_multiple(source, options)
+        results = result.values()
+    if options.profile_compiler:
+        from .CompilerProfile import write_report
+        write_report(options.profile_compiler, [
+            r.compiler_profile for r in results if r.compiler_profile is not None])
+    return result
+
+
+def warm_up(options=None):
+    """
+    Load everything that every compilation needs but that does not depend
+    on the compiled module: the compiler modules, the scanner lexicon and
+    the utility code files.  Useful in long-running compiler processes and
+    before forking worker processes.
+    """
+    from . import Pipeline
+    from .Scanning import get_lexicon
+    from .Code import UtilityCodeBase
+
+    if options is None:
+        options = CompilationOptions(default_options)
+    # importing the transforms happens when the pipeline is created
+    Pipeline.create_pipeline(Context.from_options(options), 'pyx')
+    get_lexicon()
+    utility_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Utility')
+    for filename in sorted(os.listdir(utility_dir)):
+        if os.path.splitext(filename)[1] in ('.c', '.cpp', '.h', '.pyx', '.pxd'):
+            try:
+                UtilityCodeBase.load_utilities_from_file(filename)
+            except ValueError:
+                pass  # not a utility code file
 
 
 @Utils.cached_function
@@ -754,7 +816,16 @@ def setuptools_main():
 
 
 def main(command_line = 0):
-    args = sys.argv[1:]
+    any_failures = run_command_line(sys.argv[1:], command_line)
+    if any_failures:
+        sys.exit(1)
+
+
+def run_command_line(args, command_line=1):
+    """
+    Run the compiler for the given command line arguments and return
+    a false value on success.
+    """
     any_failures = 0
     if command_line:
         try:
@@ -774,6 +845,10 @@ def main(command_line = 0):
     if options.show_version:
         from .. import __version__
         print("Cython version %s" % __version__)
+    if getattr(options, 'server', None):
+        from .Server import serve
+        serve(options.server, verbose=options.verbose)
+        return any_failures
     if options.working_path!="":
         os.chdir(options.working_path)
     try:
@@ -783,5 +858,4 @@ def main(command_line = 0):
     except (EnvironmentError, PyrexError) as e:
         sys.stderr.write(str(e) + '\n')
         any_failures = 1
-    if any_failures:
-        sys.exit(1)
+    return any_failures
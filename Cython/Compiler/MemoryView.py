@@ -837,6 +837,8 @@ typeinfo_to_format_code = load_memview_cy_utility(
 
 is_contig_utility = load_memview_c_utility("MemviewSliceIsContig", context)
 overlapping_utility = load_memview_c_utility("OverlappingSlices", context)
+array_expression_utility = load_memview_c_utility(
+    "MemviewArrayExpression", context, requires=[overlapping_utility])
 copy_contents_new_utility = load_memview_c_utility(
     "MemviewSliceCopyTemplate",
     context,
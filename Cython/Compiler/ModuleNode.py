@@ -51,6 +51,11 @@ def check_c_declarations_pxd(module_node):
     return module_node
 
 
+def needs_annotation_writer(options):
+    return bool(Options.annotate or options.annotate or
+                Options.annotate_report or options.annotate_report)
+
+
 def check_c_declarations(module_node):
     module_node.scope.check_c_classes()
     module_node.scope.check_c_functions()
@@ -59,6 +64,8 @@ def check_c_declarations(module_node):
 
 def generate_c_code_config(env, options):
     if Options.annotate or options.annotate:
+        # Line directives would end up in the C code shown in the HTML file.
+        # The interaction report does not depend on them.
         emit_linenums = False
     else:
         emit_linenums = options.emit_linenums
@@ -468,7 +475,7 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
         self.assure_safe_target(result.c_file, allow_failed=True)
         modules = self.referenced_modules
 
-        if Options.annotate or options.annotate:
+        if needs_annotation_writer(options):
             show_entire_c_code = Options.annotate == "fullc" or options.annotate == "fullc"
             rootwriter = Annotate.AnnotationCCodeWriter(
                 show_entire_c_code=show_entire_c_code,
@@ -517,6 +524,7 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
 
         code.mark_pos(None)
         self.generate_typeobj_definitions(env, code)
+        self.generate_freelist_stats_function(env, code)
         self.generate_method_table(env, code)
         if env.has_import_star:
             self.generate_import_star(env, code)
@@ -553,10 +561,17 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
         result.c_file_generated = 1
         if options.gdb_debug:
             self._serialize_lineno_map(env, rootwriter)
-        if Options.annotate or options.annotate:
+        if needs_annotation_writer(options):
             self._generate_annotations(rootwriter, result, options)
 
     def _generate_annotations(self, rootwriter, result, options):
+        report_format = Options.annotate_report or options.annotate_report
+        if report_format:
+            rootwriter.collect_interactions(self)
+            rootwriter.save_interaction_report(result.main_source_file, result.c_file, report_format)
+        if not (Options.annotate or options.annotate):
+            return
+
         self.annotate(rootwriter)
 
         coverage_xml_filename = Options.annotate_coverage_xml or options.annotate_coverage_xml
@@ -1537,10 +1552,17 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
                     slot_func)
         code.putln("")
         if freelist_size:
+            code.globalstate.use_utility_code(
+                UtilityCode.load_cached("FreelistStats", "ModuleSetupCode.c"))
             code.putln("static %s[%d];" % (
                 scope.parent_type.declaration_code(freelist_name),
                 freelist_size))
             code.putln("static int %s = 0;" % freecount_name)
+            code.putln("#if CYTHON_FREELIST_STATS")
+            code.putln("static Py_ssize_t %s = 0, %s = 0;" % (
+                scope.mangle_internal(Naming.freelist_hits_name),
+                scope.mangle_internal(Naming.freelist_misses_name)))
+            code.putln("#endif")
             code.putln("")
         code.putln(
             "static PyObject *%s(PyTypeObject *t, %sPyObject *a, %sPyObject *k) {" % (
@@ -1573,6 +1595,7 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
                 code.putln(
                     "if (CYTHON_COMPILING_IN_CPYTHON && likely((int)(%s > 0) & (int)(t->tp_basicsize == sizeof(%s))%s)) {" % (
                         freecount_name, obj_struct, type_safety_check))
+                code.putln("__Pyx_FREELIST_STAT(%s);" % scope.mangle_internal(Naming.freelist_hits_name))
                 code.putln("o = (PyObject*)%s[--%s];" % (
                     freelist_name, freecount_name))
                 code.putln("memset(o, 0, sizeof(%s));" % obj_struct)
@@ -1580,6 +1603,7 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
                 if scope.needs_gc():
                     code.putln("PyObject_GC_Track(o);")
                 code.putln("} else {")
+                code.putln("__Pyx_FREELIST_STAT(%s);" % scope.mangle_internal(Naming.freelist_misses_name))
             if not is_final_type:
                 code.putln("if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {")
             code.putln("o = (*t->tp_alloc)(t, 0);")
@@ -2645,6 +2669,15 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
         for entry in env.pyfunc_entries:
             if not entry.fused_cfunction and not (binding and entry.is_overridable):
                 code.put_pymethoddef(entry, ",", wrapper_code_writer=wrapper_code_writer)
+        if env.is_module_scope and self.freelist_type_entries(env):
+            code.putln("#if CYTHON_FREELIST_STATS")
+            code.putln('{"__pyx_freelist_stats__", (PyCFunction)%s, METH_NOARGS, 0},' % (
+                Naming.freelist_stats_cname))
+            code.putln("#endif")
+        if env.is_module_scope and env.directives['record_type_feedback']:
+            code.globalstate.use_utility_code(
+                UtilityCode.load_cached("TypeFeedback", "Profile.c"))
+            code.putln('{"__pyx_type_feedback__", (PyCFunction)__Pyx_TypeFeedback_Report, METH_NOARGS, 0},')
         code.putln(
             "{0, 0, 0, 0}")
         code.putln(
@@ -2653,6 +2686,43 @@ class ModuleNode(Nodes.Node, Nodes.BlockNode):
         if wrapper_code_writer.getvalue():
             wrapper_code_writer.putln("")
 
+    def freelist_type_entries(self, env):
+        return [
+            entry for entry in env.c_class_entries
+            if not entry.type.is_external and not entry.type.base_type
+            and entry.type.scope.directives.get('freelist', 0)
+        ]
+
+    def generate_freelist_stats_function(self, env, code):
+        # Only available when the C code is compiled with CYTHON_FREELIST_STATS.
+        freelist_entries = self.freelist_type_entries(env)
+        if not freelist_entries:
+            return
+        code.globalstate.use_utility_code(
+            UtilityCode.load_cached("FreelistStats", "ModuleSetupCode.c"))
+        code.putln("")
+        code.putln("#if CYTHON_FREELIST_STATS")
+        code.putln("static PyObject *%s(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *unused) {" % (
+            Naming.freelist_stats_cname))
+        code.putln("PyObject *stats = PyDict_New();")
+        code.putln("if (unlikely(!stats)) return NULL;")
+        for entry in freelist_entries:
+            scope = entry.type.scope
+            code.putln("if (unlikely(__Pyx_AddFreelistStats(stats, %s, %s, %s) < 0)) goto bad;" % (
+                entry.name.as_c_string_literal(),
+                scope.mangle_internal(Naming.freelist_hits_name),
+                scope.mangle_internal(Naming.freelist_misses_name)))
+        code.putln("#ifdef __Pyx_Coroutine_USE_FREELIST")
+        code.putln('if (unlikely(__Pyx_AddFreelistStats(stats, "coroutine", '
+                   '__pyx_Coroutine_freelist_hits, __pyx_Coroutine_freelist_misses) < 0)) goto bad;')
+        code.putln("#endif")
+        code.putln("return stats;")
+        code.putln("bad:")
+        code.putln("Py_DECREF(stats);")
+        code.putln("return NULL;")
+        code.putln("}")
+        code.putln("#endif")
+
     def generate_dict_getter_function(self, scope, code):
         dict_attr = scope.lookup_here("__dict__")
         if not dict_attr or not dict_attr.is_variable:
@@ -26,6 +26,7 @@ func_prefix       = pyrex_prefix + "f_"
 func_prefix_api   = pyrex_prefix + "api_f_"
 pyfunc_prefix     = pyrex_prefix + "pf_"
 pywrap_prefix     = pyrex_prefix + "pw_"
+kwindex_prefix    = pyrex_prefix + "kwindex_"
 genbody_prefix    = pyrex_prefix + "gb_"
 gstab_prefix      = pyrex_prefix + "getsets_"
 prop_get_prefix   = pyrex_prefix + "getprop_"
@@ -126,6 +127,7 @@ import_star      = pyrex_prefix + "import_star"
 import_star_set  = pyrex_prefix + "import_star_set"
 outer_scope_cname= pyrex_prefix + "outer_scope"
 cur_scope_cname  = pyrex_prefix + "cur_scope"
+cur_scope_struct_cname = pyrex_prefix + "cur_scope_struct"
 enc_scope_cname  = pyrex_prefix + "enc_scope"
 frame_cname      = pyrex_prefix + "frame"
 frame_code_cname = pyrex_prefix + "frame_code"
@@ -150,6 +152,9 @@ global_code_object_cache_insert = pyrex_prefix + 'insert_code_object'
 genexpr_id_ref = 'genexpr'
 freelist_name  = 'freelist'
 freecount_name = 'freecount'
+freelist_hits_name = 'freelist_hits'
+freelist_misses_name = 'freelist_misses'
+freelist_stats_cname = pyrex_prefix + 'freelist_stats'
 
 line_c_macro = "__LINE__"
 
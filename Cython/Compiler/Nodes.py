@@ -2011,9 +2011,13 @@ class FuncDefNode(StatNode, BlockNode):
         cenv = env
         while cenv.is_py_class_scope or cenv.is_c_class_scope:
             cenv = cenv.outer_scope
+        closure_on_stack = self.needs_closure and lenv.scope_class.type.scope.is_stack_allocated
         if self.needs_closure:
             code.put(lenv.scope_class.type.declaration_code(Naming.cur_scope_cname))
             code.putln(";")
+            if closure_on_stack:
+                code.putln("%s %s;" % (
+                    lenv.scope_class.type.declaration_code("", deref=True), Naming.cur_scope_struct_cname))
         elif self.needs_outer_scope:
             if lenv.is_passthrough:
                 code.put(lenv.scope_class.type.declaration_code(Naming.cur_scope_cname))
@@ -2101,7 +2105,12 @@ class FuncDefNode(StatNode, BlockNode):
         if is_getbuffer_slot:
             self.getbuffer_init(code)
         # ----- Create closure scope object
-        if self.needs_closure:
+        if closure_on_stack:
+            code.globalstate.use_utility_code(
+                UtilityCode.load_cached("IncludeStringH", "StringTools.c"))
+            code.putln("%s = &%s;" % (Naming.cur_scope_cname, Naming.cur_scope_struct_cname))
+            code.putln("memset(%s, 0, sizeof(%s));" % (Naming.cur_scope_cname, Naming.cur_scope_struct_cname))
+        elif self.needs_closure:
             tp_slot = TypeSlots.ConstructorSlot("tp_new", '__new__')
             slot_func_cname = TypeSlots.get_slot_function(lenv.scope_class.type.scope, tp_slot)
             if not slot_func_cname:
@@ -2136,7 +2145,7 @@ class FuncDefNode(StatNode, BlockNode):
                     Naming.self_cname))
             if lenv.is_passthrough:
                 code.putln("%s = %s;" % (Naming.cur_scope_cname, outer_scope_cname))
-            elif self.needs_closure:
+            elif self.needs_closure and not cenv.scope_class.type.scope.is_stack_allocated:
                 # inner closures own a reference to their outer parent
                 code.put_incref(outer_scope_cname, cenv.scope_class.type)
                 code.put_giveref(outer_scope_cname, cenv.scope_class.type)
@@ -2382,7 +2391,12 @@ class FuncDefNode(StatNode, BlockNode):
 
             # FIXME use entry.xdecref_cleanup - del arg seems to be the problem
             code.put_var_xdecref(entry, have_gil=gil_owned['success'])
-        if self.needs_closure:
+        if closure_on_stack:
+            assure_gil('success')
+            for entry in lenv.scope_class.type.scope.var_entries:
+                if entry.type.is_pyobject and not entry.borrowed:
+                    code.put_xdecref("%s->%s" % (Naming.cur_scope_cname, entry.cname), entry.type, nanny=False)
+        elif self.needs_closure:
             assure_gil('success')
             code.put_decref(Naming.cur_scope_cname, lenv.scope_class.type)
 
@@ -2696,6 +2710,8 @@ class CFuncDefNode(FuncDefNode):
             defining=self.body is not None, modifiers=self.modifiers,
             overridable=self.overridable)
         self.entry.inline_func_in_pxd = self.inline_in_pxd
+        if env.directives.get('exhausts_iterables'):
+            self.entry.exhausts_iterables = True
         self.return_type = typ.return_type
         if self.return_type.is_array and self.visibility != 'extern':
             error(self.pos, "Function cannot return an array")
@@ -3595,6 +3611,10 @@ class DefNodeWrapper(FuncDefNode):
     defnode = None
     target = None  # Target DefNode
 
+    # Functions with at least this many keyword arguments look up
+    # keyword names with a generated switch instead of a linear search.
+    keyword_index_min_args = 4
+
     def __init__(self, *args, **kwargs):
         FuncDefNode.__init__(self, *args, **kwargs)
         self.num_posonly_args = self.target.num_posonly_args
@@ -4055,6 +4075,10 @@ class DefNodeWrapper(FuncDefNode):
         code.putln("PyObject **%s[] = {%s};" % (
             Naming.pykwdlist_cname,
             non_pos_args_id))
+        if len(non_posonly_args) >= self.keyword_index_min_args:
+            keyword_index = self.generate_keyword_index_function(non_posonly_args, code)
+        else:
+            keyword_index = None
 
         # Before being converted and assigned to the target variables,
         # borrowed references to all unpacked argument values are
@@ -4087,14 +4111,15 @@ class DefNodeWrapper(FuncDefNode):
         if accept_kwd_args:
             self.generate_keyword_unpacking_code(
                 min_positional_args, max_positional_args,
-                has_fixed_positional_count, has_kw_only_args, all_args, argtuple_error_label, code)
+                has_fixed_positional_count, has_kw_only_args, all_args, argtuple_error_label,
+                keyword_index, code)
         else:
             # Here we do not accept kw-args but we are passed a non-empty kw-dict.
             # We call ParseOptionalKeywords which will raise an appropriate error if
             # the kw-args dict passed is non-empty (which it will be, since kw_unpacking_condition is true)
             code.globalstate.use_utility_code(
                 UtilityCode.load_cached("ParseKeywords", "FunctionArguments.c"))
-            code.putln('if (likely(__Pyx_ParseOptionalKeywords(%s, %s, %s, %s, %s, %s, %s) < 0)) %s' % (
+            code.putln('if (likely(__Pyx_ParseOptionalKeywords(%s, %s, %s, 0, %s, %s, %s, %s) < 0)) %s' % (
                 Naming.kwds_cname,
                 Naming.kwvalues_cname,
                 Naming.pykwdlist_cname,
@@ -4269,9 +4294,72 @@ class DefNodeWrapper(FuncDefNode):
                 default_value = arg.calculate_default_value_code(code)
                 code.putln('values[%d] = %s;' % (i, arg.type.as_pyobject(default_value)))
 
+    def generate_keyword_index_function(self, args, code):
+        """
+        Generate a function that finds a keyword name in the argument name
+        list with a switch over the length and the characters of the names,
+        so that its cost does not depend on the number of arguments.
+        Returns the name of the function.
+        """
+        func_cname = Naming.kwindex_prefix + self.target.entry.func_cname[len(Naming.pywrap_prefix):]
+        names = [(i, [ord(c) for c in arg.entry.name]) for i, arg in enumerate(args)]
+
+        lines = [
+            "static Py_ssize_t %s(PyObject *key, PyObject **argnames[]) {" % func_cname,
+            "    Py_ssize_t length;",
+            "    int kind;",
+            "    void *data;",
+            "    if (unlikely(!PyUnicode_CheckExact(key))) return -2;",
+            "    if (unlikely(__Pyx_PyUnicode_READY(key) == -1)) { PyErr_Clear(); return -2; }",
+            "    length = __Pyx_PyUnicode_GET_LENGTH(key);",
+            "    kind = __Pyx_PyUnicode_KIND(key);",
+            "    data = __Pyx_PyUnicode_DATA(key);",
+            "    (void) kind; (void) data;",
+            "    switch (length) {",
+        ]
+        by_length = {}
+        for index, name in names:
+            by_length.setdefault(len(name), []).append((index, name))
+        for length in sorted(by_length):
+            lines.append("    case %d:" % length)
+            self._generate_keyword_index_switch(by_length[length], lines, "        ")
+        lines += [
+            "    }",
+            "    return -1;",
+            "}",
+        ]
+
+        code.globalstate.use_utility_code(UtilityCode(
+            name=func_cname,
+            proto="static Py_ssize_t %s(PyObject *key, PyObject **argnames[]); /*proto*/" % func_cname,
+            impl="\n".join(lines),
+            requires=[UtilityCode.load_cached("KeywordIndex", "FunctionArguments.c")],
+        ))
+        return func_cname
+
+    def _generate_keyword_index_switch(self, names, lines, indent):
+        # All names have the same length.  Switch over the character that
+        # splits them into the most groups until a single name is left.
+        if len(names) == 1:
+            lines.append("%sreturn __Pyx_MatchKeywordName(key, argnames, %d);" % (indent, names[0][0]))
+            return
+        length = len(names[0][1])
+        position = max(range(length), key=lambda i: len(set(name[i] for _, name in names)))
+        by_char = {}
+        for index, name in names:
+            by_char.setdefault(name[position], []).append((index, name))
+        lines.append("%sswitch (__Pyx_PyUnicode_READ(kind, data, %d)) {" % (indent, position))
+        for char in sorted(by_char):
+            lines.append("%scase %d:%s" % (
+                indent, char, "  /* '%s' */" % chr(char) if 0x20 < char < 0x7f and chr(char) not in "*/\\" else ""))
+            self._generate_keyword_index_switch(by_char[char], lines, indent + "    ")
+        lines.append("%s}" % indent)
+        lines.append("%sbreak;" % indent)
+
     def generate_keyword_unpacking_code(self, min_positional_args, max_positional_args,
                                         has_fixed_positional_count,
-                                        has_kw_only_args, all_args, argtuple_error_label, code):
+                                        has_kw_only_args, all_args, argtuple_error_label,
+                                        keyword_index, code):
         # First we count how many arguments must be passed as positional
         num_required_posonly_args = num_pos_only_args = 0
         for i, arg in enumerate(all_args):
@@ -4330,12 +4418,13 @@ class DefNodeWrapper(FuncDefNode):
             for i, arg in enumerate(all_args):
                 if not arg.default:
                     last_required_arg = i
-            if last_required_arg < max_positional_args:
+            if last_required_arg < max_positional_args and not keyword_index:
                 last_required_arg = max_positional_args-1
-            if max_positional_args > num_pos_only_args:
+            use_switch = max_positional_args > num_pos_only_args and last_required_arg >= num_pos_only_args
+            if use_switch:
                 code.putln('switch (%s) {' % Naming.nargs_cname)
             for i, arg in enumerate(all_args[num_pos_only_args:last_required_arg+1], num_pos_only_args):
-                if max_positional_args > num_pos_only_args and i <= max_positional_args:
+                if use_switch and i <= max_positional_args:
                     if i != num_pos_only_args:
                         code.putln('CYTHON_FALLTHROUGH;')
                     if self.star_arg and i == max_positional_args:
@@ -4344,8 +4433,9 @@ class DefNodeWrapper(FuncDefNode):
                         code.putln('case %2d:' % i)
                 pystring_cname = code.intern_identifier(arg.entry.name)
                 if arg.default:
-                    if arg.kw_only:
-                        # optional kw-only args are handled separately below
+                    if arg.kw_only or keyword_index:
+                        # optional kw-only args are handled separately below,
+                        # and ParseOptionalKeywords() finds indexed keywords directly
                         continue
                     code.putln('if (kw_args > 0) {')
                     # don't overwrite default argument
@@ -4383,10 +4473,10 @@ class DefNodeWrapper(FuncDefNode):
                             self_name_csafe, pystring_cname))
                         code.putln(code.error_goto(self.pos))
                         code.putln('}')
-            if max_positional_args > num_pos_only_args:
+            if use_switch:
                 code.putln('}')
 
-        if has_kw_only_args:
+        if has_kw_only_args and not keyword_index:
             # unpack optional keyword-only arguments separately because
             # checking for interned strings in a dict is faster than iterating
             self.generate_optional_kwonly_args_unpacking_code(all_args, code)
@@ -4435,10 +4525,11 @@ class DefNodeWrapper(FuncDefNode):
             values_array = 'values'
         code.globalstate.use_utility_code(
             UtilityCode.load_cached("ParseKeywords", "FunctionArguments.c"))
-        code.putln('if (unlikely(__Pyx_ParseOptionalKeywords(%s, %s, %s, %s, %s, %s, %s) < 0)) %s' % (
+        code.putln('if (unlikely(__Pyx_ParseOptionalKeywords(%s, %s, %s, %s, %s, %s, %s, %s) < 0)) %s' % (
             Naming.kwds_cname,
             Naming.kwvalues_cname,
             Naming.pykwdlist_cname,
+            keyword_index or '0',
             self.starstar_arg and self.starstar_arg.entry.cname or '0',
             values_array,
             pos_arg_count,
@@ -6114,6 +6205,11 @@ class SingleAssignmentNode(AssignmentNode):
     def analyse_types(self, env, use_temp=0):
         from . import ExprNodes
 
+        if not (use_temp or self.is_assignment_expression):
+            array_assignment = MemoryViewArrayAssignmentNode.from_assignment(self, env)
+            if array_assignment is not None:
+                return array_assignment
+
         self.rhs = self.rhs.analyse_types(env)
 
         unrolled_assignment = self.unroll_rhs(env)
@@ -6314,6 +6410,311 @@ class SingleAssignmentNode(AssignmentNode):
         self.rhs.annotate(code)
 
 
+class MemoryViewArrayAssignmentNode(StatNode):
+    """
+    Element-wise assignment of an arithmetic expression over memoryview
+    slices, compiled into a single loop nest without temporary arrays:
+
+        dst[:] = a[:] * 2 + b[::2]
+
+    Memoryview operands with fewer dimensions than the target are aligned
+    with its last dimensions, and dimensions of extent 1 are broadcast.
+    Scalar operands are evaluated once before the loop.  If an operand overlaps
+    with the target without being the very same view, the result is
+    computed into a temporary buffer first, so that the assignment behaves
+    as if the right hand side had been evaluated completely beforehand.
+
+    lhs       ExprNode             memoryview slice to assign to
+    args      [ExprNode]           memoryview and scalar operands, in evaluation order
+    operands  [ExprNode]           the memoryview operands in 'args'
+    elements  [RawCNameExprNode]   current element of each memoryview operand
+    element   ExprNode             one element of the result
+    """
+
+    child_attrs = ["args", "lhs", "element"]
+
+    @classmethod
+    def from_assignment(cls, node, env):
+        """
+        Return an array assignment for the SingleAssignmentNode 'node',
+        or None if it is not an arithmetic expression over memoryviews.
+        """
+        from . import Errors, ExprNodes
+        from .TreeFragment import copy_code_tree
+
+        if not _is_memoryview_subscript(node.lhs, env):
+            return None
+        leaves = _array_expression_leaves(node.rhs)
+        if not leaves or not any(_uses_memoryview(leaf, env) for leaf in leaves):
+            return None
+
+        # Analyse a copy, so that the assignment can still be analysed
+        # normally if some operand turns out to be a Python object.
+        rhs = copy_code_tree(node.rhs)
+        args, operands, elements = [], [], []
+        Errors.hold_errors()
+        analysed_leaves = {}
+        for leaf in _array_expression_leaves(rhs):
+            analysed_leaves[id(leaf)] = leaf.analyse_types(env)
+        leaf_types = [leaf.type for leaf in analysed_leaves.values()]
+        if (any(leaf_type.is_pyobject for leaf_type in leaf_types) or
+                not any(leaf_type.is_memoryviewslice for leaf_type in leaf_types)):
+            # Not an array expression after all, e.g. "m[:] = m[0] * 2".
+            Errors.release_errors(ignore=True)
+            return None
+        Errors.release_errors()
+
+        def replace_leaves(expr):
+            if id(expr) in analysed_leaves:
+                leaf = analysed_leaves[id(expr)]
+                if leaf.type.is_memoryviewslice:
+                    args.append(leaf)
+                    operands.append(leaf)
+                    elements.append(ExprNodes.RawCNameExprNode(leaf.pos, leaf.type.dtype))
+                    return elements[-1]
+                if leaf.is_literal:
+                    return leaf
+                if not leaf.is_simple():
+                    leaf = leaf.coerce_to_temp(env)
+                args.append(leaf)
+                return ExprNodes.CloneNode(leaf)
+            for attr in expr.subexprs:
+                setattr(expr, attr, replace_leaves(getattr(expr, attr)))
+            return expr
+
+        element = replace_leaves(rhs).analyse_types(env)
+        lhs = node.lhs.analyse_target_types(env)
+        if lhs.type.is_memoryviewslice:
+            for slice_node in [lhs] + operands:
+                slice_node.type.assert_direct_dims(slice_node.pos)
+                if not slice_node.type.dtype.is_numeric:
+                    error(slice_node.pos, "Array expressions only support numeric memoryviews, got '%s'" % (
+                        slice_node.type.dtype))
+                elif slice_node.type.ndim > lhs.type.ndim:
+                    error(slice_node.pos, "Array expression operand has %d dimensions, expected at most %d" % (
+                        slice_node.type.ndim, lhs.type.ndim))
+            element = element.coerce_to(lhs.type.dtype, env)
+        elif not lhs.type.is_error:
+            error(lhs.pos, "Cannot assign an array expression to '%s'" % lhs.type)
+        return cls(node.pos, lhs=lhs, args=args, operands=operands,
+                   elements=elements, element=element)
+
+    def generate_execution_code(self, code):
+        from . import ExprNodes, MemoryView
+        code.mark_pos(self.pos)
+        for arg in self.args:
+            arg.generate_evaluation_code(code)
+        self.lhs.generate_evaluation_code(code)
+
+        code.globalstate.use_utility_code(MemoryView.array_expression_utility)
+        dst = self.lhs.result()
+        dst_type = self.lhs.type.dtype.empty_declaration_code()
+        ndim = self.lhs.type.ndim
+
+        code.begin_block()
+        # Strides of the operands in the loop, 0 for broadcast dimensions.
+        strides = [["__pyx_temp_stride_%d_%d" % (i, dim) for dim in range(ndim)]
+                   for i in range(len(self.operands))]
+        if self.operands:
+            code.putln("Py_ssize_t %s;" % ", ".join(sum(strides, [])))
+        code.putln("int __pyx_temp_overlap = 0;")
+        for operand, operand_strides in zip(self.operands, strides):
+            src = operand.result()
+            # Operands with fewer dimensions are aligned with the last dimensions of the target.
+            offset = ndim - operand.type.ndim
+            for dim, stride in enumerate(operand_strides):
+                if dim < offset:
+                    code.putln("%s = 0;" % stride)
+                    continue
+                t = (src, dim - offset)
+                code.putln("if (unlikely(%s.shape[%d] != %s.shape[%d] && %s.shape[%d] != 1)) {" % (t + (dst, dim) + t))
+                code.putln("__Pyx_RaiseMemviewArrayExtentError(%d, %s.shape[%d], %s.shape[%d]);" % (
+                    (dim, dst, dim) + t))
+                code.putln(code.error_goto(self.pos))
+                code.putln("}")
+                code.putln("%s = (%s.shape[%d] == 1) ? 0 : %s.strides[%d];" % ((stride,) + t + t))
+
+            src_type = operand.type.dtype.empty_declaration_code()
+            if src_type == dst_type and not offset:
+                itemsize = "sizeof(%s)" % dst_type
+                # The target itself (e.g. "a[:] = a[:] * 2") is safe to read element by element.
+                same_view = " && ".join(
+                    ["%s.data == %s.data" % (src, dst)] +
+                    ["(%s.shape[%d] < 2 || %s == %s.strides[%d])" % (dst, dim, stride, dst, dim)
+                     for dim, stride in enumerate(operand_strides)])
+            else:
+                itemsize = "(sizeof(%s) > sizeof(%s) ? sizeof(%s) : sizeof(%s))" % (
+                    src_type, dst_type, src_type, dst_type)
+                same_view = "0"
+            code.putln("if (!__pyx_temp_overlap && !(%s)) {" % same_view)
+            code.putln("__pyx_temp_overlap = __Pyx_MemviewArrayOverlap(&%s, %d, &%s, %d, %s);" % (
+                src, operand.type.ndim, dst, ndim, itemsize))
+            code.putln("}")
+
+        dst_strides = ["%s.strides[%d]" % (dst, dim) for dim in range(ndim)]
+        sources = [(operand.result() + ".data", operand_strides, element)
+                   for operand, operand_strides, element in zip(self.operands, strides, self.elements)]
+
+        code.putln("if (unlikely(__pyx_temp_overlap)) {")
+        buffer_strides = ["__pyx_temp_buffer_strides[%d]" % dim for dim in range(ndim)]
+        code.putln("char *__pyx_temp_buffer;")
+        code.putln("Py_ssize_t __pyx_temp_buffer_strides[%d];" % ndim)
+        code.putln("%s = sizeof(%s);" % (buffer_strides[-1], dst_type))
+        for dim in range(ndim - 2, -1, -1):
+            code.putln("%s = %s * %s.shape[%d];" % (buffer_strides[dim], buffer_strides[dim + 1], dst, dim + 1))
+        code.putln("__pyx_temp_buffer = __Pyx_MemviewArrayTempBuffer((size_t) (%s * %s.shape[0]));" % (
+            buffer_strides[0], dst))
+        code.putln("if (unlikely(!__pyx_temp_buffer)) %s" % code.error_goto(self.pos))
+
+        old_error_label = code.new_error_label()
+        self.generate_loops(code, "__pyx_temp_buffer", buffer_strides, sources, self.element)
+        buffer_element = ExprNodes.RawCNameExprNode(self.pos, self.lhs.type.dtype)
+        self.generate_loops(
+            code, dst + ".data", dst_strides,
+            [("__pyx_temp_buffer", buffer_strides, buffer_element)], buffer_element)
+        code.putln("free(__pyx_temp_buffer);")
+        if code.label_used(code.error_label):
+            done_label = code.new_label("array_expression_done")
+            code.put_goto(done_label)
+            code.put_label(code.error_label)
+            code.putln("free(__pyx_temp_buffer);")
+            code.put_goto(old_error_label)
+            code.put_label(done_label)
+        code.error_label = old_error_label
+
+        code.putln("} else {")
+        self.generate_loops(code, dst + ".data", dst_strides, sources, self.element)
+        code.putln("}")
+        code.end_block()
+
+        for node in [self.lhs] + self.args:
+            node.generate_disposal_code(code)
+            node.free_temps(code)
+
+    def generate_loops(self, code, target, target_strides, sources, element):
+        """
+        Generate a loop nest over all dimensions of the target that
+        stores 'element' at each position.  The innermost loop has a
+        specialised version for contiguous data that C compilers can
+        vectorise.
+
+        target          char* expression for the data of the target
+        target_strides  C expressions for the strides of the target
+        sources         list of (data, strides, RawCNameExprNode) for the operands
+        """
+        ndim = len(target_strides)
+        dst = self.lhs.result()
+        dst_type = self.lhs.type.dtype.empty_declaration_code()
+        last = ndim - 1
+        index = "__pyx_temp_idx_%d"
+
+        code.begin_block()
+        code.putln("Py_ssize_t %s;" % ", ".join(index % dim for dim in range(ndim)))
+        code.putln("char *__pyx_temp_target;")
+        for i in range(len(sources)):
+            code.putln("char *__pyx_temp_pointer_%d;" % i)
+
+        for dim in range(last):
+            code.putln("for (%s = 0; %s < %s.shape[%d]; %s++) {" % (
+                index % dim, index % dim, dst, dim, index % dim))
+
+        def pointer(data, strides):
+            return " + ".join([data] + ["%s * %s" % (index % dim, strides[dim]) for dim in range(last)])
+
+        code.putln("__pyx_temp_target = %s;" % pointer(target, target_strides))
+        for i, (data, strides, _) in enumerate(sources):
+            code.putln("__pyx_temp_pointer_%d = %s;" % (i, pointer(data, strides)))
+
+        contiguous = " && ".join(
+            ["%s == sizeof(%s)" % (target_strides[last], dst_type)] +
+            ["%s == sizeof(%s)" % (strides[last], source.type.empty_declaration_code())
+             for data, strides, source in sources])
+        code.globalstate.use_utility_code(UtilityCode.load_cached("VectorizeLoop", "ModuleSetupCode.c"))
+        code.putln("if (%s) {" % contiguous)
+        # Aliasing between target and operands was excluded above.
+        code.putln("CYTHON_VECTORIZE_LOOP")
+        self._generate_inner_loop(
+            code, index % last,
+            "((%s *) __pyx_temp_target)[%s]" % (dst_type, index % last),
+            [(source, "((%s *) __pyx_temp_pointer_%d)[%s]" % (source.type.empty_declaration_code(), i, index % last))
+             for i, (data, strides, source) in enumerate(sources)],
+            element)
+        code.putln("} else {")
+        self._generate_inner_loop(
+            code, index % last,
+            "(*(%s *) (__pyx_temp_target + %s * %s))" % (dst_type, index % last, target_strides[last]),
+            [(source, "(*(%s *) (__pyx_temp_pointer_%d + %s * %s))" % (
+                source.type.empty_declaration_code(), i, index % last, strides[last]))
+             for i, (data, strides, source) in enumerate(sources)],
+            element)
+        code.putln("}")
+
+        for dim in range(last):
+            code.putln("}")
+        code.end_block()
+
+    def _generate_inner_loop(self, code, index, target, sources, element):
+        code.putln("for (%s = 0; %s < %s.shape[%d]; %s++) {" % (
+            index, index, self.lhs.result(), self.lhs.type.ndim - 1, index))
+        for source, cname in sources:
+            source.set_cname(cname)
+        element.generate_evaluation_code(code)
+        code.putln("%s = %s;" % (target, element.result()))
+        element.generate_disposal_code(code)
+        element.free_temps(code)
+        code.putln("}")
+
+    def annotate(self, code):
+        for arg in self.args:
+            arg.annotate(code)
+        self.lhs.annotate(code)
+
+
+def _is_memoryview_name(node, env):
+    if not node.is_name:
+        return False
+    entry = env.lookup(node.name)
+    return entry is not None and entry.type.is_memoryviewslice
+
+
+def _is_memoryview_subscript(node, env):
+    from . import ExprNodes
+    return (isinstance(node, (ExprNodes.IndexNode, ExprNodes.SliceIndexNode)) and
+            _is_memoryview_name(node.base, env))
+
+
+def _uses_memoryview(node, env):
+    # e.g. "m", "m[1:]" or "m.T"
+    from . import ExprNodes
+    while isinstance(node, (ExprNodes.IndexNode, ExprNodes.SliceIndexNode, ExprNodes.AttributeNode)):
+        node = node.obj if node.is_attribute else node.base
+    return _is_memoryview_name(node, env)
+
+
+_array_expression_operators = frozenset(['+', '-', '*', '/', '//', '%'])
+
+
+def _array_expression_leaves(expr, leaves=None):
+    """
+    Return the operands of the arithmetic expression 'expr' in
+    evaluation order, or None if 'expr' is not an arithmetic operation.
+    """
+    from . import ExprNodes
+    is_root = leaves is None
+    if is_root:
+        leaves = []
+    if isinstance(expr, ExprNodes.NumBinopNode) and expr.operator in _array_expression_operators:
+        _array_expression_leaves(expr.operand1, leaves)
+        _array_expression_leaves(expr.operand2, leaves)
+    elif isinstance(expr, (ExprNodes.UnaryMinusNode, ExprNodes.UnaryPlusNode)):
+        _array_expression_leaves(expr.operand, leaves)
+    elif is_root:
+        return None
+    else:
+        leaves.append(expr)
+    return leaves
+
+
 class CascadedAssignmentNode(AssignmentNode):
     #  An assignment with multiple left hand sides:
     #
@@ -7725,6 +8126,10 @@ class ForFromStatNode(LoopNode, StatNode):
             loopvar_name = code.funcstate.allocate_temp(loopvar_type, False)
         else:
             loopvar_name = self.loopvar_node.result()
+        if code.globalstate.directives['vectorize'] and not self.is_py_target:
+            code.globalstate.use_utility_code(
+                UtilityCode.load_cached("VectorizeLoop", "ModuleSetupCode.c"))
+            code.putln("CYTHON_VECTORIZE_LOOP")
         if loopvar_type.is_int and not loopvar_type.signed and self.relation2[0] == '>':
             # Handle the case where the endpoint of an unsigned int iteration
             # is within step of 0.
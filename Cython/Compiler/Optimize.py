@@ -30,7 +30,7 @@ from . import Options
 
 from .Code import UtilityCode, TempitaUtilityCode
 from .StringEncoding import EncodedString, bytes_literal, encoded_string
-from .Errors import error, warning
+from .Errors import error, warning, performance_hint
 from .ParseTreeTransforms import SkipDeclarations
 
 try:
@@ -129,6 +129,29 @@ def _find_yield_statements(node):
     return yield_statements
 
 
+def _inline_generator_expression(pos, gen_expr_node, comprehension_type, orig_func):
+    """Replace the yield statements of a generator expression by appends to a
+    comprehension of the given type and return the inlined result node, or
+    None if the generator expression cannot be inlined.
+    """
+    yield_statements = _find_yield_statements(gen_expr_node.loop)
+    if not yield_statements:
+        return None
+
+    result_node = ExprNodes.InlinedGeneratorExpressionNode(
+        pos, gen_expr_node, orig_func=orig_func,
+        comprehension_type=comprehension_type)
+
+    for yield_expression, yield_stat_node in yield_statements:
+        append_node = ExprNodes.ComprehensionAppendNode(
+            yield_expression.pos,
+            expr=yield_expression,
+            target=result_node.target)
+        Visitor.recursively_replace_node(gen_expr_node, yield_stat_node, append_node)
+
+    return result_node
+
+
 class IterationTransform(Visitor.EnvTransform):
     """Transform some common for-in loop patterns into efficient C loops:
 
@@ -296,6 +319,18 @@ class IterationTransform(Visitor.EnvTransform):
                     break
                 else:
                     return self._transform_range_iteration(node, iterable, reversed=reversed)
+                performance_hint(
+                    node.target.pos,
+                    "range() loop uses Python integers because the loop variable is a Python object "
+                    "and the range() arguments are not small integer constants; "
+                    "declare the loop variable as a C integer",
+                    self.current_directives)
+            else:
+                performance_hint(
+                    node.target.pos,
+                    "range() loop is not compiled to a C loop because the loop variable has type '%s'" % (
+                        node.target.type),
+                    self.current_directives)
 
         return node
 
@@ -821,6 +856,10 @@ class IterationTransform(Visitor.EnvTransform):
             step_pos = step.pos
             if not isinstance(step.constant_result, _py_int_types):
                 # cannot determine step direction
+                performance_hint(
+                    step.pos,
+                    "range() loop is not compiled to a C loop because its step is not a constant integer",
+                    self.current_directives)
                 return node
             step_value = step.constant_result
             if step_value == 0:
@@ -1618,9 +1657,26 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
         self.visitchildren(node)
         function = node.function
         if not self._function_is_builtin_name(function):
+            if function.is_name:
+                self._inline_consumed_genexpr_args(node, function)
             return node
         return self._dispatch_to_handler(node, function, node.args)
 
+    def _inline_consumed_genexpr_args(self, node, function):
+        """Pass generator expressions into cdef functions that are declared to
+        always consume their arguments completely (@cython.exhausts_iterables)
+        as inlined list comprehensions.
+        """
+        entry = self.current_env().lookup(function.name)
+        if entry is None or not entry.is_cfunction or not entry.exhausts_iterables:
+            return
+        for i, arg in enumerate(node.args):
+            if isinstance(arg, ExprNodes.GeneratorExpressionNode):
+                result_node = _inline_generator_expression(
+                    arg.pos, arg, Builtin.list_type, 'list')
+                if result_node is not None:
+                    node.args[i] = result_node
+
     def visit_GeneralCallNode(self, node):
         self.visitchildren(node)
         function = node.function
@@ -1820,23 +1876,12 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
             loop_node = list_node.loop
 
         elif isinstance(arg, ExprNodes.GeneratorExpressionNode):
-            gen_expr_node = arg
-            loop_node = gen_expr_node.loop
-            yield_statements = _find_yield_statements(loop_node)
-            if not yield_statements:
+            loop_node = arg.loop
+            list_node = _inline_generator_expression(
+                node.pos, arg, Builtin.list_type, 'sorted')
+            if list_node is None:
                 return node
 
-            list_node = ExprNodes.InlinedGeneratorExpressionNode(
-                node.pos, gen_expr_node, orig_func='sorted',
-                comprehension_type=Builtin.list_type)
-
-            for yield_expression, yield_stat_node in yield_statements:
-                append_node = ExprNodes.ComprehensionAppendNode(
-                    yield_expression.pos,
-                    expr=yield_expression,
-                    target=list_node.target)
-                Visitor.recursively_replace_node(gen_expr_node, yield_stat_node, append_node)
-
         elif arg.is_sequence_constructor:
             # sorted([a, b, c]) or sorted((a, b, c)).  The result is always a list,
             # so starting off with a fresh one is more efficient.
@@ -1939,6 +1984,8 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
     def _optimise_min_max(self, node, args, operator):
         """Replace min(a,b,...) and max(a,b,...) by explicit comparison code.
         """
+        if len(args) == 1 and isinstance(args[0], ExprNodes.GeneratorExpressionNode):
+            return self._transform_min_max_genexpr(node, args[0], operator)
         if len(args) <= 1:
             if len(args) == 1 and args[0].is_sequence_constructor:
                 args = args[0].args
@@ -1969,9 +2016,77 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
 
         return last_result
 
+    def _transform_min_max_genexpr(self, node, gen_expr_node, operator):
+        """Transform
+
+        _result = max(p(x) for L in LL for x in L)
+
+        into
+
+        first = True
+        for L in LL:
+            for x in L:
+                item = p(x)
+                if first:
+                    result = item
+                    first = False
+                elif item > result:
+                    result = item
+        if first:
+            return max(())  # raise the usual ValueError
+        return result
+        """
+        generator_body = gen_expr_node.def_node.gbody
+        yield_expression, yield_stat_node = _find_single_yield_expression(generator_body.body)
+        if yield_expression is None:
+            return node
+        pos = yield_expression.pos
+
+        result_ref = UtilNodes.LetRefNode(ExprNodes.NoneNode(pos))
+        first_ref = UtilNodes.LetRefNode(ExprNodes.BoolNode(pos, value=True, constant_result=True))
+        item_ref = UtilNodes.LetRefNode(yield_expression)
+
+        update_node = UtilNodes.LetNode(item_ref, Nodes.IfStatNode(
+            pos, else_clause=None, if_clauses=[
+                Nodes.IfClauseNode(
+                    pos, condition=first_ref,
+                    body=Nodes.StatListNode(pos, stats=[
+                        Nodes.SingleAssignmentNode(pos, lhs=result_ref, rhs=item_ref),
+                        Nodes.SingleAssignmentNode(
+                            pos, lhs=first_ref,
+                            rhs=ExprNodes.BoolNode(pos, value=False, constant_result=False)),
+                    ])),
+                Nodes.IfClauseNode(
+                    pos, condition=ExprNodes.PrimaryCmpNode(
+                        pos, operand1=item_ref, operator=operator, operand2=result_ref),
+                    body=Nodes.SingleAssignmentNode(pos, lhs=result_ref, rhs=item_ref)),
+            ]))
+        Visitor.recursively_replace_node(gen_expr_node, yield_stat_node, update_node)
+
+        # Let the builtin raise the ValueError for an empty iterable, with its usual message.
+        empty_node = Nodes.IfStatNode(
+            node.pos, else_clause=None, if_clauses=[
+                Nodes.IfClauseNode(
+                    node.pos, condition=first_ref,
+                    body=Nodes.ReturnStatNode(
+                        node.pos, value=ExprNodes.SimpleCallNode(
+                            node.pos, function=node.function,
+                            args=[ExprNodes.TupleNode(node.pos, args=[])])))
+            ])
+        generator_body.body = UtilNodes.LetNode(result_ref, UtilNodes.LetNode(
+            first_ref, Nodes.StatListNode(node.pos, stats=[
+                generator_body.body,
+                empty_node,
+                Nodes.ReturnStatNode(node.pos, value=result_ref),
+            ])))
+
+        return ExprNodes.InlinedGeneratorExpressionNode(
+            gen_expr_node.pos, gen=gen_expr_node,
+            orig_func='min' if operator == '<' else 'max')
+
     # builtin type creation
 
-    def _DISABLED_handle_simple_function_tuple(self, node, pos_args):
+    def _handle_simple_function_tuple(self, node, pos_args):
         if not pos_args:
             return ExprNodes.TupleNode(node.pos, args=[], constant_result=())
         # This is a bit special - for iterables (including genexps),
@@ -1979,15 +2094,16 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
         # tuple incrementally while reading items, which we can't
         # easily do without explicit node support. Instead, we read
         # the items into a list and then copy them into a tuple of the
-        # final size.  This takes up to twice as much memory, but will
-        # have to do until we have real support for genexps.
+        # final size.  This takes up to twice as much memory, but
+        # avoids resuming the generator for each item.
         result = self._transform_list_set_genexpr(node, pos_args, Builtin.list_type)
         if result is not node:
             return ExprNodes.AsTupleNode(node.pos, arg=result)
         return node
 
     def _handle_simple_function_frozenset(self, node, pos_args):
-        """Replace frozenset([...]) by frozenset((...)) as tuples are more efficient.
+        """Replace frozenset([...]) by frozenset((...)) as tuples are more efficient,
+        and frozenset(genexpr) by frozenset({setcomp}).
         """
         if len(pos_args) != 1:
             return node
@@ -1995,6 +2111,11 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
             del pos_args[0]
         elif isinstance(pos_args[0], ExprNodes.ListNode):
             pos_args[0] = pos_args[0].as_tuple()
+        elif isinstance(pos_args[0], ExprNodes.GeneratorExpressionNode):
+            result_node = _inline_generator_expression(
+                node.pos, pos_args[0], Builtin.set_type, 'set')
+            if result_node is not None:
+                pos_args[0] = result_node
         return node
 
     def _handle_simple_function_list(self, node, pos_args):
@@ -2014,26 +2135,10 @@ class EarlyReplaceBuiltinCalls(Visitor.EnvTransform):
             return node
         if not isinstance(pos_args[0], ExprNodes.GeneratorExpressionNode):
             return node
-        gen_expr_node = pos_args[0]
-        loop_node = gen_expr_node.loop
-
-        yield_statements = _find_yield_statements(loop_node)
-        if not yield_statements:
-            return node
-
-        result_node = ExprNodes.InlinedGeneratorExpressionNode(
-            node.pos, gen_expr_node,
-            orig_func='set' if target_type is Builtin.set_type else 'list',
-            comprehension_type=target_type)
-
-        for yield_expression, yield_stat_node in yield_statements:
-            append_node = ExprNodes.ComprehensionAppendNode(
-                yield_expression.pos,
-                expr=yield_expression,
-                target=result_node.target)
-            Visitor.recursively_replace_node(gen_expr_node, yield_stat_node, append_node)
-
-        return result_node
+        result_node = _inline_generator_expression(
+            node.pos, pos_args[0], target_type,
+            'set' if target_type is Builtin.set_type else 'list')
+        return node if result_node is None else result_node
 
     def _handle_simple_function_dict(self, node, pos_args):
         """Replace dict( (a,b) for ... ) by an inlined { a:b for ... }
@@ -3672,30 +3777,43 @@ class OptimizeBuiltinCalls(Visitor.NodeRefCleanupMixin,
         if len(args) != 2:
             self._error_wrong_arg_count('unicode.join', node, args, "2")
             return node
-        if isinstance(args[1], ExprNodes.GeneratorExpressionNode):
-            gen_expr_node = args[1]
-            loop_node = gen_expr_node.loop
-
-            yield_statements = _find_yield_statements(loop_node)
-            if yield_statements:
-                inlined_genexpr = ExprNodes.InlinedGeneratorExpressionNode(
-                    node.pos, gen_expr_node, orig_func='list',
-                    comprehension_type=Builtin.list_type)
+        self._inline_join_genexpr(args)
 
-                for yield_expression, yield_stat_node in yield_statements:
-                    append_node = ExprNodes.ComprehensionAppendNode(
-                        yield_expression.pos,
-                        expr=yield_expression,
-                        target=inlined_genexpr.target)
+        return self._substitute_method_call(
+            node, function,
+            "PyUnicode_Join", self.PyUnicode_Join_func_type,
+            'join', is_unbound_method, args)
 
-                    Visitor.recursively_replace_node(gen_expr_node, yield_stat_node, append_node)
+    PyBytes_Join_func_type = PyrexTypes.CFuncType(
+        PyrexTypes.py_object_type, [
+            PyrexTypes.CFuncTypeArg("sep", Builtin.bytes_type, None),
+            PyrexTypes.CFuncTypeArg("seq", PyrexTypes.py_object_type, None),
+            ])
 
-                args[1] = inlined_genexpr
+    def _handle_simple_method_bytes_join(self, node, function, args, is_unbound_method):
+        """
+        bytes.join() also builds a list first => inline generator expressions
+        """
+        if len(args) != 2 or not isinstance(args[1], ExprNodes.GeneratorExpressionNode):
+            return node
+        args = list(args)
+        if not self._inline_join_genexpr(args):
+            return node
 
         return self._substitute_method_call(
             node, function,
-            "PyUnicode_Join", self.PyUnicode_Join_func_type,
-            'join', is_unbound_method, args)
+            "__Pyx_PyBytes_Join", self.PyBytes_Join_func_type,
+            'join', is_unbound_method, args,
+            utility_code=UtilityCode.load_cached("StringJoin", "StringTools.c"))
+
+    def _inline_join_genexpr(self, args):
+        if isinstance(args[1], ExprNodes.GeneratorExpressionNode):
+            inlined_genexpr = _inline_generator_expression(
+                args[1].pos, args[1], Builtin.list_type, 'list')
+            if inlined_genexpr is not None:
+                args[1] = inlined_genexpr
+                return True
+        return False
 
     PyString_Tailmatch_func_type = PyrexTypes.CFuncType(
         PyrexTypes.c_bint_type, [
@@ -75,6 +75,12 @@ annotate = False
 # this file.
 annotate_coverage_xml = None
 
+#: Write a machine-readable report of the Python interactions (C-API calls,
+#: reference counting, exception checks, GIL acquisitions and boxing) in each
+#: line and function of the source files.  Can be ``"json"`` or ``"csv"``.
+#: This has the same effect as the ``annotate_report`` argument in :func:`cythonize`.
+annotate_report = None
+
 #: This will abort the compilation on the first error occurred rather than trying
 #: to keep going and printing further error messages.
 fast_fail = False
@@ -145,7 +151,8 @@ cimport_from_pyx = False
 #: slices are passed by value and involve a lot of copying.
 buffer_max_dims = 8
 
-#: Number of function closure instances to keep in a freelist (0: no freelists)
+#: Number of function closure instances to keep in a freelist (0: no freelists).
+#: Can be overridden for single functions with the ``closure_freelist`` directive.
 closure_freelist_size = 8
 
 
@@ -221,7 +228,10 @@ _directive_defaults = {
     'np_pythran': False,
     'fast_gil': False,
     'cpp_locals': False,  # uses std::optional for C++ locals, so that they work more like Python locals
+    'vectorize': False,  # let the C compiler ignore assumed dependencies between iterations of C loops
     'legacy_implicit_noexcept': False,
+    'record_type_feedback': False,  # count the operand types of arithmetic operations on Python objects
+    'type_feedback': None,  # JSON file with recorded operand types, used to generate guarded fast paths
 
     # set __file__ and/or __path__ to known source/target path at import time (instead of not having them available)
     'set_initial_path' : None,  # SOURCEFILE or "/full/path/to/module"
@@ -234,6 +244,7 @@ _directive_defaults = {
     'warn.unused_arg': False,
     'warn.unused_result': False,
     'warn.multiple_declarators': True,
+    'warn.performance': False,  # explain why loops and expressions were not compiled to plain C
 
 # optimizations
     'optimize.inline_defnode_calls': True,
@@ -320,7 +331,9 @@ directive_types = {
     'language_level': str,  # values can be None/2/3/'3str', where None == 2+warning
     'auto_pickle': bool,
     'locals': dict,
+    'fused_specializations': dict,
     'final' : bool,  # final cdef classes and methods
+    'exhausts_iterables' : bool,  # cdef functions that always consume their arguments completely
     'collection_type': one_of('sequence'),
     'nogil' : bool,
     'internal' : bool,  # cdef class visibility in the module dict
@@ -339,6 +352,8 @@ directive_types = {
     'exceptval': type,  # actually (type, check=True/False), but has its own parser
     'set_initial_path': str,
     'freelist': int,
+    'closure_freelist': int,
+    'type_feedback': str,
     'c_string_type': one_of('bytes', 'bytearray', 'str', 'unicode'),
     'c_string_encoding': normalise_encoding_name,
     'trashcan': bool,
@@ -356,6 +371,7 @@ directive_scopes = {  # defaults to available everywhere
     # 'module', 'function', 'class', 'with statement'
     'auto_pickle': ('module', 'cclass'),
     'final' : ('cclass', 'function'),
+    'exhausts_iterables' : ('function',),
     'collection_type': ('cclass',),
     'nogil' : ('function', 'with statement'),
     'inline' : ('function',),
@@ -364,6 +380,7 @@ directive_scopes = {  # defaults to available everywhere
     'returns' : ('function',),
     'exceptval' : ('function',),
     'locals' : ('function',),
+    'fused_specializations' : ('function',),
     'staticmethod' : ('function',),  # FIXME: analysis currently lacks more specific function scope
     'no_gc_clear' : ('cclass',),
     'no_gc' : ('cclass',),
@@ -378,6 +395,7 @@ directive_scopes = {  # defaults to available everywhere
     'test_assert_c_code_has' : ('module',),
     'test_fail_if_c_code_has' : ('module',),
     'freelist': ('cclass',),
+    'closure_freelist': ('module', 'function'),
     'emit_code_comments': ('module',),
     # Avoid scope-specific to/from_py_functions for c_string.
     'c_string_type': ('module',),
@@ -396,6 +414,9 @@ directive_scopes = {  # defaults to available everywhere
     'cpp_locals': ('module', 'function', 'cclass'),  # I don't think they make sense in a with_statement
     'ufunc': ('function',),
     'legacy_implicit_noexcept': ('module', ),
+    'vectorize': ('module', 'function', 'with statement'),
+    'record_type_feedback': ('module',),
+    'type_feedback': ('module',),
 }
 
 
@@ -404,7 +425,7 @@ directive_scopes = {  # defaults to available everywhere
 immediate_decorator_directives = {
     'cfunc', 'ccall', 'cclass', 'dataclasses.dataclass', 'ufunc',
     # function signature directives
-    'inline', 'exceptval', 'returns',
+    'inline', 'exceptval', 'returns', 'exhausts_iterables',
     # class directives
     'freelist', 'no_gc', 'no_gc_clear', 'type_version_tag', 'final',
     'auto_pickle', 'internal', 'collection_type', 'total_ordering',
@@ -687,7 +708,10 @@ class CompilationOptions(object):
             elif key in ['timestamps']:
                 # the cache cares about the content of files, not about the timestamps of sources
                 continue
-            elif key in ['cache']:
+            elif key in ['profile_compiler']:
+                # profiling the compiler does not change what it generates
+                continue
+            elif key in ['cache', 'pxd_cache']:
                 # hopefully caching has no influence on the compilation result
                 continue
             elif key in ['compiler_directives']:
@@ -711,7 +735,8 @@ class CompilationOptions(object):
                 # the (temporary) directory where we collect dependencies
                 # has no influence on the C output
                 continue
-            elif key in ['use_listing_file', 'generate_pxi', 'annotate', 'annotate_coverage_xml']:
+            elif key in ['use_listing_file', 'generate_pxi', 'annotate', 'annotate_coverage_xml',
+                         'annotate_report']:
                 # all output files are contained in the cache so the types of
                 # files generated must be part of the fingerprint
                 data[key] = value
@@ -765,6 +790,7 @@ default_options = dict(
     depfile=None,
     annotate=None,
     annotate_coverage_xml=None,
+    annotate_report=None,
     generate_pxi=0,
     capi_reexport_cincludes=0,
     working_path="",
@@ -786,6 +812,8 @@ default_options = dict(
     output_dir=None,
     build_dir=None,
     cache=None,
+    pxd_cache=None,
+    profile_compiler=None,
     create_extension=None,
     np_pythran=False,
     legacy_implicit_noexcept=None,
@@ -3271,6 +3271,48 @@ class MarkClosureVisitor(CythonTransform):
         return node
 
 
+class _ClosureEscapeChecker(TreeVisitor):
+    """
+    Checks whether the closure scope of a function can outlive the function call.
+    It cannot if it is only used by generator expressions that are consumed inline,
+    as in "sum(x * k for x in seq)", because the generator is gone before the
+    function returns.
+    """
+    def __init__(self):
+        super(_ClosureEscapeChecker, self).__init__()
+        self.escapes = False
+        self.in_genexpr = False
+        self.inlined_genexprs = set()
+
+    def __call__(self, func_node):
+        self.visitchildren(func_node, attrs=['body'])
+        return self.escapes
+
+    def visit_Node(self, node):
+        if not self.escapes:
+            self.visitchildren(node)
+
+    def visit_InlinedGeneratorExpressionNode(self, node):
+        self.inlined_genexprs.add(id(node.gen))
+        self.visitchildren(node)
+
+    def visit_GeneratorExpressionNode(self, node):
+        if self.in_genexpr or id(node) not in self.inlined_genexprs:
+            self.escapes = True
+            return
+        self.in_genexpr = True
+        self.visitchildren(node.def_node)
+        self.in_genexpr = False
+
+    def visit_GeneratorBodyDefNode(self, node):
+        self.visitchildren(node)
+
+    def visit_FuncDefNode(self, node):
+        self.escapes = True
+
+    visit_LambdaNode = visit_ClassDefNode = visit_FuncDefNode
+
+
 class CreateClosureClasses(CythonTransform):
     # Output closure classes in module scope for all functions
     # that really need it.
@@ -3356,16 +3398,25 @@ class CreateClosureClasses(CythonTransform):
         if node.is_async_def or node.is_generator:
             # Generators need their closure intact during cleanup as they resume to handle GeneratorExit
             class_scope.directives['no_gc_clear'] = True
-        if Options.closure_freelist_size:
-            class_scope.directives['freelist'] = Options.closure_freelist_size
+        elif (all(self._can_store_on_stack(entry) for _, entry in in_closure)
+                and not _ClosureEscapeChecker()(node)):
+            # Only inlined generator expressions use the closure, which end before the function.
+            class_scope.is_stack_allocated = True
+        freelist_size = func_scope.directives.get('closure_freelist', Options.closure_freelist_size)
+        if freelist_size and not class_scope.is_stack_allocated:
+            class_scope.directives['freelist'] = freelist_size
 
         if from_closure:
             assert cscope.is_closure_scope
-            class_scope.declare_var(pos=node.pos,
-                                    name=Naming.outer_scope_cname,
-                                    cname=Naming.outer_scope_cname,
-                                    type=cscope.scope_class.type,
-                                    is_cdef=True)
+            outer_scope_entry = class_scope.declare_var(
+                pos=node.pos,
+                name=Naming.outer_scope_cname,
+                cname=Naming.outer_scope_cname,
+                type=cscope.scope_class.type,
+                is_cdef=True)
+            if cscope.scope_class.type.scope.is_stack_allocated:
+                # The outer function outlives us and owns its scope.
+                outer_scope_entry.borrowed = True
             node.needs_outer_scope = True
         for name, entry in in_closure:
             closure_entry = class_scope.declare_var(
@@ -3380,6 +3431,12 @@ class CreateClosureClasses(CythonTransform):
         # Do it here because other classes are already checked
         target_module_scope.check_c_class(func_scope.scope_class)
 
+    @staticmethod
+    def _can_store_on_stack(entry):
+        # The stack allocated scope is cleaned up by decref-ing its Python object attributes.
+        type = entry.type
+        return type.is_pyobject or not (type.needs_refcounting or type.needs_cpp_construction)
+
     def visit_LambdaNode(self, node):
         if not isinstance(node.def_node, Nodes.DefNode):
             # fused function, an error has been previously issued
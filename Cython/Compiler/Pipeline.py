@@ -370,6 +370,8 @@ def run_pipeline(pipeline, source, printtree=True):
         timings = threadlocal.cython_pipeline_timings
     except AttributeError:
         timings = threadlocal.cython_pipeline_timings = {}
+    # set by Main.run_pipeline() for the --profile-compiler option
+    profile = getattr(threadlocal, 'cython_compiler_profile', None)
 
     def run(phase, data):
         return phase(data)
@@ -394,9 +396,12 @@ def run_pipeline(pipeline, source, printtree=True):
                         exec("def %s(phase, data): return phase(data)" % phase_name, exec_ns)
                         run = _pipeline_entry_points[phase_name] = exec_ns[phase_name]
 
-                t = time()
-                data = run(phase, data)
-                t = time() - t
+                if profile is not None:
+                    data, t = profile.run_stage(source, phase_name, run, phase, data)
+                else:
+                    t = time()
+                    data = run(phase, data)
+                    t = time() - t
 
                 try:
                     old_t, count = timings[phase_name]
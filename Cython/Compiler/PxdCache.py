@@ -0,0 +1,209 @@
+#
+#   On-disk cache of parsed .pxd files
+#
+
+from __future__ import absolute_import
+
+import hashlib
+import os
+import platform
+import sys
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from .. import __version__
+from .. import Utils
+from . import Future
+from .Scanning import FileSourceDescriptor
+from .Symtab import Scope, Entry
+
+
+class PxdTreeCache(object):
+    """
+    Stores the parse trees of .pxd files in a directory, keyed by the
+    content of the file and everything else that influences the parser,
+    so that repeated compiler runs that cimport the same declarations
+    (numpy, libc, libcpp, shared project .pxd files, ...) can skip the
+    scanner and parser for them.
+
+    Only the result of the parser is cached.  The declaration analysis
+    still runs in each compilation, because the resulting scopes are
+    tightly bound to the Context that created them.
+
+    Trees that depend on other files (via 'include') or that changed the
+    parser state of the Context (language level, future imports) are not
+    cached.  Warnings that were issued while parsing a file are not
+    repeated when its tree is loaded from the cache.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def fingerprint(self, context, source_desc, full_module_name):
+        """
+        Return the key under which the tree of 'source_desc' is cached,
+        or None if the file cannot be read.
+        """
+        try:
+            m = hashlib.sha1(__version__.encode('UTF-8'))
+            with open(source_desc.filename, 'rb') as f:
+                m.update(f.read())
+        except EnvironmentError:
+            return None
+        compile_time_env = getattr(context.options, 'compile_time_env', None) or {}
+        m.update(repr((
+            full_module_name,
+            sys.version_info[:2],
+            platform.uname(),
+            parser_state(context),
+            sorted(compile_time_env.items()),
+        )).encode('UTF-8'))
+        return m.hexdigest()
+
+    def _cache_path(self, key):
+        return os.path.join(self.cache_dir, key + '.pickle')
+
+    def load(self, key, source_desc):
+        """
+        Return the cached tree for 'key' or None if there is none.
+        Source descriptors in the tree are replaced by 'source_desc'.
+        """
+        path = self._cache_path(key)
+        source_descs = {source_desc.filename: source_desc}
+
+        def persistent_load(pid):
+            kind, filename, path_description = pid
+            try:
+                return source_descs[filename]
+            except KeyError:
+                desc = source_descs[filename] = FileSourceDescriptor(filename, path_description)
+                return desc
+
+        try:
+            with open(path, 'rb') as f:
+                return load_tree(f, persistent_load)
+        except EnvironmentError:
+            return None
+        except Exception:
+            # Broken or incompatible cache entry => re-parse and overwrite it.
+            return None
+
+    def store(self, key, tree):
+        """
+        Write the tree to the cache.  Failures are ignored since the tree
+        can always be re-parsed.
+        """
+        def persistent_id(obj):
+            if isinstance(obj, FileSourceDescriptor):
+                return ('file', obj.filename, obj.path_description)
+            return None
+
+        try:
+            Utils.safe_makedirs(self.cache_dir)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except EnvironmentError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                dump_tree(tree, f, persistent_id)
+            path = self._cache_path(key)
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                # Windows does not replace existing files, but another
+                # process already stored the same tree in that case.
+                if not os.path.exists(path):
+                    raise
+        except Exception:
+            pass
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _global_types():
+    """
+    Map the ids of the type singletons in PyrexTypes and Builtin to
+    the module and name under which they can be found.
+    """
+    from . import PyrexTypes, Builtin
+    types = {}
+    for module in (PyrexTypes, Builtin):
+        for name, value in vars(module).items():
+            if isinstance(value, PyrexTypes.BaseType):
+                types.setdefault(id(value), ('type', module.__name__, name))
+    return types
+
+
+def dump_tree(tree, f, persistent_id):
+    """
+    Pickle a freshly parsed tree into the file 'f'.
+
+    The compiler compares types by identity, so the global type objects
+    that the parser uses are stored by name.  Trees that reference other
+    compiler state (scopes, entries, non-global types) cannot be pickled.
+    'persistent_id' is called first for each object and can return a
+    replacement id for it, e.g. for source descriptors.
+    """
+    from .PyrexTypes import BaseType
+    global_types = _global_types()
+
+    def _persistent_id(obj):
+        pid = persistent_id(obj)
+        if pid is not None:
+            return pid
+        if isinstance(obj, BaseType):
+            try:
+                return global_types[id(obj)]
+            except KeyError:
+                raise pickle.PicklingError("cannot pickle trees that reference type %s" % obj)
+        if isinstance(obj, (Scope, Entry)):
+            raise pickle.PicklingError("cannot pickle trees that reference %s" % obj)
+        return None
+
+    pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = _persistent_id
+    pickler.dump(tree)
+
+
+def load_tree(f, persistent_load):
+    """
+    Unpickle a tree from the file 'f' that was written by dump_tree().
+    'persistent_load' is called for the ids that the 'persistent_id'
+    function of dump_tree() returned.
+    """
+    def _persistent_load(pid):
+        if pid[0] == 'type':
+            return getattr(sys.modules[pid[1]], pid[2])
+        return persistent_load(pid)
+
+    unpickler = pickle.Unpickler(f)
+    unpickler.persistent_load = _persistent_load
+    return unpickler.load()
+
+
+def parser_state(context):
+    """
+    Return the parts of the Context that influence the parser and that
+    the parser can change.
+    """
+    return (
+        context.language_level,
+        sorted(name for name, feature in vars(Future).items()
+               if not name.startswith('_') and feature in context.future_directives),
+        context.cpp,
+        context.legacy_implicit_noexcept,
+    )
+
+
+def get_pxd_cache(options):
+    cache_dir = getattr(options, 'pxd_cache', None)
+    if not cache_dir:
+        return None
+    if cache_dir is True:
+        cache_dir = os.path.join(Utils.get_cython_cache_dir(), 'pxd')
+    return PxdTreeCache(cache_dir)
@@ -6,7 +6,7 @@
 from __future__ import absolute_import
 
 import cython
-cython.declare(make_lexicon=object, lexicon=object,
+cython.declare(load_lexicon=object, lexicon=object,
                print_function=object, error=object, warning=object,
                os=object, platform=object)
 
@@ -19,7 +19,7 @@ from .. import Utils
 from ..Plex.Scanners import Scanner
 from ..Plex.Errors import UnrecognizedInput
 from .Errors import error, warning, hold_errors, release_errors, CompileError
-from .Lexicon import any_string_prefix, make_lexicon, IDENT
+from .Lexicon import any_string_prefix, load_lexicon, IDENT
 from .Future import print_function
 
 debug_scanner = 0
@@ -33,7 +33,7 @@ lexicon = None
 def get_lexicon():
     global lexicon
     if not lexicon:
-        lexicon = make_lexicon()
+        lexicon = load_lexicon()
     return lexicon
 
 
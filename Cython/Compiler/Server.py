@@ -0,0 +1,267 @@
+#
+#   Compiler server: keeps a warm compiler process around for build systems
+#   that invoke Cython once per source file.
+#
+#   Start the server with
+#
+#       cython --server=ADDRESS
+#
+#   and compile through it with
+#
+#       python -m Cython.Compiler.Server ADDRESS [cython options] sources...
+#
+#   ADDRESS is either "host:port" or the path of a local (Unix) socket.
+#   Both sides always authenticate the connection.  The key is taken from
+#   the environment variable CYTHON_SERVER_AUTHKEY if it is set.  Otherwise,
+#   the server generates a random key and writes it into a file that only
+#   its user can read, and clients on the same machine read it from there.
+#   The file is CYTHON_SERVER_AUTHKEY_FILE if set, or a file named after
+#   ADDRESS in the "server" directory of the Cython cache directory, so
+#   server and clients must use the same ADDRESS string.  A socket file
+#   is also only accessible to the user that started the server.
+#
+#   Only modules that have no influence on the generated code are kept
+#   across requests: the imported compiler modules, the scanner lexicon
+#   and the parsed utility code files.  Each request gets a new Context
+#   (compiling several modules in one Context leaks state between them)
+#   and sees the current state of the file system, so changes to sources,
+#   .pxd or include files are always picked up.
+#
+
+from __future__ import absolute_import, print_function
+
+import os
+import re
+import sys
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+# The client side must stay cheap to import, so only the standard library
+# is imported at module level.
+from multiprocessing.connection import Listener, Client
+
+
+def parse_address(address):
+    """
+    Convert an address given on the command line into the form that
+    multiprocessing.connection expects.
+
+    >>> parse_address('localhost:8123')
+    ('localhost', 8123)
+    >>> parse_address('/tmp/cython.sock')
+    '/tmp/cython.sock'
+    """
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def authkey_file(address):
+    """
+    Return the path of the file in which the server stores the key for
+    authenticating the connections to 'address'.
+    """
+    path = os.environ.get('CYTHON_SERVER_AUTHKEY_FILE')
+    if path:
+        return path
+    from ..Utils import get_cython_cache_dir
+    return os.path.join(get_cython_cache_dir(), 'server', re.sub(r'[^\w.-]', '_', address) + '.authkey')
+
+
+def _create_authkey(address):
+    """
+    Return the key that the server uses, and the key file that it wrote
+    (or None if the key is taken from the environment).
+    """
+    authkey = os.environ.get('CYTHON_SERVER_AUTHKEY')
+    if authkey:
+        return authkey.encode('UTF-8'), None
+    import binascii
+    authkey = binascii.hexlify(os.urandom(32))
+    path = authkey_file(address)
+    key_dir = os.path.dirname(path)
+    if key_dir and not os.path.isdir(key_dir):
+        os.makedirs(key_dir, 0o700)
+    if os.path.exists(path):
+        # Replace the file instead of keeping its permissions.
+        os.remove(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(authkey)
+    return authkey, path
+
+
+def _get_authkey(address):
+    authkey = os.environ.get('CYTHON_SERVER_AUTHKEY')
+    if authkey:
+        return authkey.encode('UTF-8')
+    path = authkey_file(address)
+    try:
+        with open(path, 'rb') as f:
+            return f.read().strip()
+    except EnvironmentError:
+        raise RuntimeError(
+            "Cannot read the key of the compiler server at %s from %s, is the server running?" % (
+                address, path))
+
+
+def _run_compiler(args):
+    from ..Utils import clear_function_caches
+    from .Main import run_command_line
+
+    if any(arg.startswith('--server') for arg in args):
+        print("cython: cannot start a server from a server request", file=sys.stderr)
+        return 1
+    # File lookups are cached per process, but files may have been
+    # created or removed since the last request.
+    clear_function_caches()
+    try:
+        return run_command_line(args)
+    except SystemExit as exc:
+        code = exc.code
+        if code is None:
+            return 0
+        if isinstance(code, int):
+            return code
+        print(code, file=sys.stderr)
+        return 1
+
+
+def handle_request(cwd, args):
+    """
+    Run the compiler for one client request and return the exit status
+    and the captured output.
+    """
+    from . import Options, DebugFlags
+    global_settings = [(module, dict(vars(module))) for module in (Options, DebugFlags)]
+    directive_defaults = Options.get_directive_defaults().copy()
+
+    stdout, stderr = StringIO(), StringIO()
+    old_cwd = os.getcwd()
+    old_stdout, old_stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        os.chdir(cwd)
+        status = _run_compiler(args)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout, sys.stderr = old_stdout, old_stderr
+        os.chdir(old_cwd)
+        # Command line options are stored in module globals, reset them.
+        for module, settings in global_settings:
+            module.__dict__.update(settings)
+        Options._directive_defaults.clear()
+        Options._directive_defaults.update(directive_defaults)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def is_valid_request(request):
+    """
+    Check that 'request' is a shutdown request or a compilation request
+    with a working directory and a list of command line arguments.
+    """
+    if not isinstance(request, dict):
+        return False
+    if request.get('shutdown'):
+        return True
+    string_types = (str, type(u''))
+    return (
+        isinstance(request.get('cwd'), string_types) and
+        isinstance(request.get('args'), list) and
+        all(isinstance(arg, string_types) for arg in request['args']))
+
+
+def serve(address, verbose=False):
+    """
+    Compile requests from clients until a shutdown request arrives.
+    """
+    from .Main import warm_up
+    warm_up()
+    authkey, key_path = _create_authkey(address)
+    old_umask = os.umask(0o077)  # a socket file is only accessible to this user
+    try:
+        listener = Listener(parse_address(address), authkey=authkey)
+    finally:
+        os.umask(old_umask)
+    if verbose:
+        print("Cython compiler server listening on %s" % address)
+    try:
+        while True:
+            try:
+                connection = listener.accept()
+            except Exception as exc:
+                # failed authentication or broken client connection
+                if verbose:
+                    print("Rejected connection: %s" % exc, file=sys.stderr)
+                continue
+            try:
+                request = connection.recv()
+                if not is_valid_request(request):
+                    connection.send((2, '', 'cython: invalid server request\n'))
+                elif request.get('shutdown'):
+                    connection.send((0, '', ''))
+                    break
+                else:
+                    if verbose:
+                        print("Compiling %s" % ' '.join(request['args']))
+                    connection.send(handle_request(request['cwd'], request['args']))
+            except Exception as exc:
+                # broken client connection or undecodable request
+                if verbose:
+                    print("Failed request: %r" % exc, file=sys.stderr)
+            finally:
+                connection.close()
+    finally:
+        listener.close()
+        if key_path is not None and os.path.exists(key_path):
+            os.remove(key_path)
+
+
+def compile_remote(address, args, cwd=None):
+    """
+    Let the compiler server at 'address' run the 'cython' command with the
+    given command line arguments in the directory 'cwd'.
+    Returns a tuple (exit_status, stdout, stderr).
+    """
+    connection = Client(parse_address(address), authkey=_get_authkey(address))
+    try:
+        connection.send({'cwd': cwd or os.getcwd(), 'args': list(args)})
+        return connection.recv()
+    finally:
+        connection.close()
+
+
+def shutdown_remote(address):
+    connection = Client(parse_address(address), authkey=_get_authkey(address))
+    try:
+        connection.send({'shutdown': True})
+        connection.recv()
+    finally:
+        connection.close()
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    if not args or args[0] in ('-h', '--help'):
+        print("Usage: python -m Cython.Compiler.Server ADDRESS [--shutdown | cython options and sources]")
+        return 0 if args else 2
+    address, args = args[0], args[1:]
+    if args == ['--shutdown']:
+        shutdown_remote(address)
+        return 0
+    status, stdout, stderr = compile_remote(address, args)
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -166,6 +166,8 @@ class Entry(object):
     #                             Used for identifying imports from typing/dataclasses etc
     # pytyping_modifiers          Python type modifiers like "typing.ClassVar" but also "dataclasses.InitVar"
     # enum_int_value  None or int  If known, the int that corresponds to this enum value
+    # exhausts_iterables boolean  C function always consumes its object arguments completely
+    #                             (exhausts_iterables directive)
 
     # TODO: utility_code and utility_code_definition serves the same purpose...
 
@@ -242,6 +244,7 @@ class Entry(object):
     known_standard_library_import = None
     pytyping_modifiers = None
     enum_int_value = None
+    exhausts_iterables = False
 
     def __init__(self, name, cname, type, pos = None, init = None):
         self.name = name
@@ -2248,6 +2251,7 @@ class CClassScope(ClassScope):
     #  has_memoryview_attrs  boolean  Any memory view attributes?
     #  has_cpp_class_attrs   boolean  Any (non-pointer) C++ attributes?
     #  has_cyclic_pyobject_attrs    boolean  Any PyObject attributes that may need GC?
+    #  is_stack_allocated    boolean  Closure scope that lives on the C stack of its function
     #  property_entries      [Entry]
     #  defined               boolean  Defined in .pxd file
     #  implemented           boolean  Defined in .pyx file
@@ -2255,6 +2259,7 @@ class CClassScope(ClassScope):
 
     is_c_class_scope = 1
     is_closure_class_scope = False
+    is_stack_allocated = False
 
     has_pyobject_attrs = False
     has_memoryview_attrs = False
@@ -2340,6 +2345,8 @@ class CClassScope(ClassScope):
         memoryview_slices = []
 
         for entry in self.var_entries:
+            if entry.borrowed:
+                continue
             if entry.type.is_pyobject:
                 if include_weakref or (self.is_closure_class_scope or entry.name != "__weakref__"):
                     if include_gc_simple or not entry.type.is_gc_simple:
@@ -179,6 +179,14 @@ class CmdLineParserTest(TestCase):
         ])
         self.assertEqual(Options.annotate, 'fullc')
 
+    def test_annotate_report(self):
+        options, sources = parse_command_line([
+            '--annotate-report=csv',
+            'source.pyx',
+        ])
+        self.assertEqual(Options.annotate_report, 'csv')
+        self.assertFalse(Options.annotate)
+
     def test_short_w(self):
         options, sources = parse_command_line([
             '-w', 'my_working_path',
@@ -315,6 +323,17 @@ class CmdLineParserTest(TestCase):
         self.check_default_global_options()
         self.check_default_options(options, ['compiler_directives'])
 
+    def test_explain_slow(self):
+        options, sources = parse_command_line([
+            '-X', 'cdivision=True',
+            '--explain-slow',
+            'source.pyx'
+        ])
+        self.assertEqual(options.compiler_directives['cdivision'], True)
+        self.assertEqual(options.compiler_directives['warn.performance'], True)
+        self.check_default_global_options()
+        self.check_default_options(options, ['compiler_directives'])
+
     def test_old_style_globals(self):
         options, sources = parse_command_line([
             '--old-style-globals',
@@ -533,6 +552,31 @@ class CmdLineParserTest(TestCase):
         self.check_default_global_options()
         self.check_default_options(options, ['module_name'])
 
+    def test_pxd_cache(self):
+        options, sources = parse_command_line([
+            '--pxd-cache',
+            'source.pyx'
+        ])
+        self.assertIs(options.pxd_cache, True)
+        self.check_default_global_options()
+        self.check_default_options(options, ['pxd_cache'])
+        options, sources = parse_command_line([
+            '--pxd-cache-dir=/pxd/cache/dir',
+            'source.pyx'
+        ])
+        self.assertEqual(options.pxd_cache, '/pxd/cache/dir')
+        self.check_default_global_options()
+        self.check_default_options(options, ['pxd_cache'])
+
+    def test_profile_compiler(self):
+        options, sources = parse_command_line([
+            '--profile-compiler=report.json',
+            'source.pyx'
+        ])
+        self.assertEqual(options.profile_compiler, 'report.json')
+        self.check_default_global_options()
+        self.check_default_options(options, ['profile_compiler'])
+
     def test_errors(self):
         def error(args, regex=None):
             old_stderr = sys.stderr
@@ -0,0 +1,89 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import Main
+from ..CompilerProfile import aggregate, write_report
+
+
+class TestCompilerProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(
+            prefix='profile-test',
+            dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.report = os.path.join(self.temp_dir, 'report.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def compile(self, name, code):
+        source = os.path.join(self.temp_dir, name)
+        with open(source, 'w') as f:
+            f.write(code)
+        return Main.compile(source, language_level=3, profile_compiler=self.report)
+
+    def read_report(self):
+        with io.open(self.report, encoding='UTF-8') as f:
+            return json.load(f)
+
+    def test_report(self):
+        result = self.compile('a.pyx', 'from libc.math cimport sin\ndef f(double x):\n    return sin(x)\n')
+        self.assertEqual(result.num_errors, 0)
+        self.assertEqual(result.compiler_profile['module'], 'a')
+
+        report = self.read_report()
+        self.assertEqual([module['module'] for module in report['modules']], ['a'])
+        stages = report['modules'][0]['stages']
+        top_level = [stage['stage'] for stage in stages if not stage['depth']]
+        self.assertEqual(top_level[0], 'parse')
+        self.assertIn('AnalyseDeclarationsTransform', top_level)
+        self.assertIn('generate_pyx_code_stage', top_level)
+        self.assertIn('libc/math.pxd', set(stage['pipeline'] for stage in stages if stage['depth']))
+        parse = stages[[stage['stage'] for stage in stages].index('parse')]
+        self.assertTrue(parse['nodes'] > 1, parse)
+
+        self.assertEqual(
+            sorted(summary['stage'] for summary in report['stages']),
+            sorted(set(top_level)))
+        times = [summary['time'] for summary in report['stages']]
+        self.assertEqual(times, sorted(times, reverse=True))
+
+    def test_report_is_merged(self):
+        self.compile('b.pyx', 'x = 1\n')
+        self.compile('c.pyx', 'y = 2\n')
+        report = self.read_report()
+        self.assertEqual([module['module'] for module in report['modules']], ['b', 'c'])
+        self.assertEqual(report['stages'][0]['calls'], 2)
+
+        self.compile('c.pyx', 'y = 3\n')
+        report = self.read_report()
+        self.assertEqual([module['module'] for module in report['modules']], ['b', 'c'])
+
+    def test_broken_report_is_replaced(self):
+        with open(self.report, 'w') as f:
+            f.write('{"modules": ')
+        self.compile('d.pyx', 'x = 1\n')
+        report = self.read_report()
+        self.assertEqual([module['module'] for module in report['modules']], ['d'])
+
+    def test_aggregate(self):
+        def stage(name, t, depth=0):
+            return {'stage': name, 'depth': depth, 'time': t, 'memory_allocated': 10, 'memory_peak': t * 100}
+        modules = [
+            {'module': 'a', 'time': 4.0, 'stages': [stage('parse', 1.0), stage('parse', 0.5, 1), stage('analyse', 3.0)]},
+            {'module': 'b', 'time': 4.0, 'stages': [stage('parse', 2.0), stage('analyse', 2.0)]},
+        ]
+        summary = aggregate(modules)
+        self.assertEqual([s['stage'] for s in summary], ['analyse', 'parse'])
+        self.assertEqual(summary[1]['calls'], 2)
+        self.assertEqual(summary[1]['time'], 3.0)
+        self.assertEqual(summary[1]['share'], 3.0 / 8.0)
+        self.assertEqual(summary[1]['memory_allocated'], 20)
+        self.assertEqual(summary[1]['memory_peak'], 200)
+
+        write_report(self.report, modules)
+        self.assertEqual(self.read_report()['stages'], summary)
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import Builtin, Errors
+from ..Main import Context
+from ..Options import CompilationOptions, default_options, get_directive_defaults
+from ..Scanning import FileSourceDescriptor
+from ..Symtab import ModuleScope
+from ..Visitor import TreeVisitor
+
+
+class TypeCollector(TreeVisitor):
+    def __init__(self):
+        super(TypeCollector, self).__init__()
+        self.types = []
+
+    def visit_Node(self, node):
+        if 'type' in node.__dict__:
+            self.types.append(node.type)
+        self.visitchildren(node)
+
+
+class TestPxdCache(unittest.TestCase):
+
+    def setUp(self):
+        Errors.init_thread()
+        self.temp_dir = tempfile.mkdtemp(
+            prefix='pxd-cache-test',
+            dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.pxd_file = os.path.join(self.temp_dir, 'decls.pxd')
+        with open(self.pxd_file, 'w') as f:
+            f.write('cdef inline numbers():\n    return [x * 2 for x in range(3)]\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def parse_pxd(self):
+        # a fresh Context for each parse, as in a new compiler run
+        options = CompilationOptions(default_options, pxd_cache=self.cache_dir)
+        context = Context([self.temp_dir], get_directive_defaults(), language_level=3, options=options)
+        scope = ModuleScope('decls', None, context)
+        source_desc = FileSourceDescriptor(self.pxd_file)
+        return context.parse(source_desc, scope, pxd=True, full_module_name='decls')
+
+    def test_cached_tree_uses_global_types(self):
+        parsed_types = TypeCollector()
+        parsed_types.visit(self.parse_pxd())
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertIn(Builtin.list_type, parsed_types.types)
+
+        cached_types = TypeCollector()
+        cached_types.visit(self.parse_pxd())
+        self.assertEqual(len(cached_types.types), len(parsed_types.types))
+        for cached_type, parsed_type in zip(cached_types.types, parsed_types.types):
+            self.assertIs(cached_type, parsed_type)
@@ -1,10 +1,14 @@
 from __future__ import unicode_literals
 
+import os
+import pickle
+import shutil
+import string
+import tempfile
 import unittest
 from io import StringIO
-import string
 
-from .. import Scanning
+from .. import Lexicon, Scanning
 from ..Symtab import ModuleScope
 from ..TreeFragment import StringParseContext
 from ..Errors import init_thread
@@ -129,7 +133,108 @@ class TestScanning(unittest.TestCase):
             scanner.error("Oooops")
         self.assertEqual((scanner.sy, scanner.systring), (sy1, systring1))
 
-
+    def test_non_ascii_identifiers(self):
+        code = "ab \u00e4b \u03c0 \u53d8\u91cf\u0660 \u00e4\n"
+        source = Scanning.StringSourceDescriptor("fake code", code)
+        scanner = Scanning.PyrexScanner(
+            StringIO(code), source, scope=ModuleScope("fake_module", None, None),
+            context=StringParseContext("fake context"))
+        tokens = []
+        while scanner.sy != "NEWLINE":
+            tokens.append((scanner.sy, scanner.systring))
+            scanner.next()
+        self.assertEqual(tokens, [
+            ("IDENT", "ab"), ("IDENT", "\u00e4b"), ("IDENT", "\u03c0"),
+            ("IDENT", "\u53d8\u91cf\u0660"), ("IDENT", "\u00e4")])
+
+
+class TestLexiconTables(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.tables_file = os.path.join(self.temp_dir, 'Lexicon.tables')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def dump(self, lexicon):
+        # actions compare by identity
+        return repr(lexicon.to_tables())
+
+    def test_load_tables(self):
+        Lexicon.write_lexicon_tables(self.tables_file)
+        with open(self.tables_file, 'rb') as f:
+            fingerprint, tables = pickle.load(f)
+        self.assertEqual(fingerprint, Lexicon.lexicon_fingerprint())
+
+        lexicon = Lexicon.load_lexicon(self.tables_file)
+        # loaded without building the lexicon
+        self.assertIsNone(lexicon.machine)
+        self.assertEqual(self.dump(lexicon), self.dump(Lexicon.make_lexicon()))
+        self.assertEqual(self.dump(lexicon), repr(tables))
+
+    def test_stale_tables(self):
+        Lexicon.write_lexicon_tables(self.tables_file)
+        with open(self.tables_file, 'rb') as f:
+            fingerprint, tables = pickle.load(f)
+        # drop all states => a lexicon built from these tables could not scan anything
+        tables = (tables[0], tables[1][:1]) + tables[2:]
+        with open(self.tables_file, 'wb') as f:
+            pickle.dump(("outdated", tables), f)
+
+        lexicon = Lexicon.load_lexicon(self.tables_file)
+        self.assertIsNotNone(lexicon.machine)
+        self.assertEqual(self.dump(lexicon), self.dump(Lexicon.make_lexicon()))
+
+    def test_inconsistent_tables(self):
+        Lexicon.write_lexicon_tables(self.tables_file)
+        with open(self.tables_file, 'rb') as f:
+            fingerprint, tables = pickle.load(f)
+        tables = (tables[0], tables[1][:1]) + tables[2:]
+        with open(self.tables_file, 'wb') as f:
+            pickle.dump((fingerprint, tables), f)
+
+        lexicon = Lexicon.load_lexicon(self.tables_file)
+        self.assertIsNotNone(lexicon.machine)
+        self.assertEqual(self.dump(lexicon), self.dump(Lexicon.make_lexicon()))
+
+    def test_missing_tables(self):
+        lexicon = Lexicon.load_lexicon(self.tables_file)
+        self.assertEqual(self.dump(lexicon), self.dump(Lexicon.make_lexicon()))
+
+
+class TestStateTableMachine(unittest.TestCase):
+    def test_transitions(self):
+        lexicon = Lexicon.make_lexicon()
+        machine, tables = lexicon.machine, lexicon.tables
+        state_index = dict((id(state), i) for i, state in enumerate(machine.states))
+
+        def expected_transition(state, c):
+            if len(c) != 1:
+                target = state[c]
+            elif c in state:
+                target = state[c]
+            else:
+                for code0, code1, target in state['ranges']:
+                    if code0 <= ord(c) < code1:
+                        break
+                else:
+                    target = state['else']
+            return -1 if target is None else state_index[id(target)]
+
+        chars = list(string.printable) + [
+            '\u00a0', '\u00b2', '\u00e4', '\u03c0', '\u0660', '\u2028', '\u53d8', '\uffff',
+            'bol', 'eol', 'eof']
+        for c in chars:
+            char_class = tables.char_class(c)
+            for i, state in enumerate(machine.states):
+                self.assertEqual(
+                    tables.transitions[i * tables.num_classes + char_class],
+                    expected_transition(state, c),
+                    "state %d, %r" % (i, c))
+
+        self.assertEqual(tables.actions, [state['action'] for state in machine.states])
+        for name, state in machine.initial_states.items():
+            self.assertEqual(tables.get_initial_state(name), state_index[id(state)])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import unittest
+from multiprocessing.connection import Client
+
+from .. import Options
+from ..Server import (
+    _get_authkey, authkey_file, compile_remote, handle_request, is_valid_request, parse_address,
+    serve, shutdown_remote)
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(
+            prefix='server-test',
+            dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_source(self, name, code):
+        with open(os.path.join(self.temp_dir, name), 'w') as f:
+            f.write(code)
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address('localhost:1234'), ('localhost', 1234))
+        self.assertEqual(parse_address('/tmp/cython.sock'), '/tmp/cython.sock')
+        self.assertEqual(parse_address(r'\\.\pipe\cython'), r'\\.\pipe\cython')
+
+    def test_compile(self):
+        self.write_source('a.pyx', 'def f(x):\n    return x + 1\n')
+        cwd = os.getcwd()
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', 'a.pyx'])
+        self.assertEqual(status, 0, stderr)
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'a.c')))
+
+    def test_compile_error(self):
+        self.write_source('b.pyx', 'def f(:\n    pass\n')
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', 'b.pyx'])
+        self.assertEqual(status, 1)
+        self.assertIn("b.pyx:1:6", stderr)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'b.c')))
+
+    def test_missing_source(self):
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', 'missing.pyx'])
+        self.assertEqual(status, 1)
+        self.assertIn("missing.pyx", stderr)
+
+    def test_options_are_reset(self):
+        self.write_source('c.pyx', 'x = 1\n')
+        annotate = Options.annotate
+        docstrings = Options.docstrings
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', '-a', '-D', 'c.pyx'])
+        self.assertEqual(status, 0, stderr)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'c.html')))
+        self.assertEqual(Options.annotate, annotate)
+        self.assertEqual(Options.docstrings, docstrings)
+
+    def test_pxd_change_is_seen(self):
+        self.write_source('d.pxd', 'cdef enum:\n    VALUE = 1\n')
+        self.write_source('e.pyx', 'cimport d\nvalue = d.VALUE\n')
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', 'e.pyx'])
+        self.assertEqual(status, 0, stderr)
+        self.write_source('d.pxd', 'cdef enum:\n    OTHER_VALUE = 1\n')
+        status, stdout, stderr = handle_request(self.temp_dir, ['-3', 'e.pyx'])
+        self.assertEqual(status, 1)
+        self.assertIn("VALUE", stderr)
+
+    def test_is_valid_request(self):
+        self.assertTrue(is_valid_request({'cwd': self.temp_dir, 'args': ['-3', 'a.pyx']}))
+        self.assertTrue(is_valid_request({'shutdown': True}))
+        self.assertFalse(is_valid_request(None))
+        self.assertFalse(is_valid_request(['-3', 'a.pyx']))
+        self.assertFalse(is_valid_request({'args': ['-3', 'a.pyx']}))
+        self.assertFalse(is_valid_request({'cwd': self.temp_dir}))
+        self.assertFalse(is_valid_request({'cwd': self.temp_dir, 'args': '-3 a.pyx'}))
+        self.assertFalse(is_valid_request({'cwd': self.temp_dir, 'args': [3]}))
+
+    @unittest.skipIf(sys.platform == 'win32', "requires Unix sockets")
+    def test_serve(self):
+        self.write_source('f.pyx', 'x = 1\n')
+        address = os.path.join(self.temp_dir, 'server.sock')
+        key_path = os.path.join(self.temp_dir, 'server.authkey')
+        environ = dict(os.environ)
+        os.environ.pop('CYTHON_SERVER_AUTHKEY', None)
+        os.environ['CYTHON_SERVER_AUTHKEY_FILE'] = key_path
+        try:
+            self.assertEqual(authkey_file(address), key_path)
+            server = threading.Thread(target=serve, args=(address,))
+            server.daemon = True
+            server.start()
+            for _ in range(600):
+                if os.path.exists(address):
+                    break
+                server.join(0.1)
+            self.assertTrue(os.path.exists(address))
+            self.assertEqual(stat.S_IMODE(os.stat(key_path).st_mode), 0o600)
+            self.assertEqual(stat.S_IMODE(os.stat(address).st_mode) & 0o077, 0)
+
+            # Malformed requests get an error reply and do not stop the server.
+            for request in [None, {'cwd': self.temp_dir}, {'args': ['f.pyx']}]:
+                connection = Client(address, authkey=_get_authkey(address))
+                try:
+                    connection.send(request)
+                    status, stdout, stderr = connection.recv()
+                finally:
+                    connection.close()
+                self.assertEqual(status, 2)
+                self.assertIn("invalid server request", stderr)
+
+            status, stdout, stderr = compile_remote(address, ['-3', 'f.pyx'], cwd=self.temp_dir)
+            self.assertEqual(status, 0, stderr)
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'f.c')))
+
+            shutdown_remote(address)
+            server.join(60)
+            self.assertFalse(server.is_alive())
+            self.assertFalse(os.path.exists(key_path))
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
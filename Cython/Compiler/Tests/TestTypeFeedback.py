@@ -0,0 +1,47 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..Scanning import StringSourceDescriptor
+from ..TypeFeedback import dominant_types, guarded_operation
+
+
+class TestTypeFeedback(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(
+            prefix='feedback-test',
+            dir='TEST_TMP' if os.path.isdir('TEST_TMP') else None)
+        self.feedback_file = os.path.join(self.temp_dir, 'feedback.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def write_feedback(self, data):
+        with open(self.feedback_file, 'w') as f:
+            json.dump(data, f)
+
+    def test_dominant_types(self):
+        self.assertEqual(dominant_types({'float,float': 95, 'int,int': 5}), ('float', 'float'))
+        self.assertEqual(dominant_types({'float,float': 50, 'int,int': 50}), None)
+        self.assertEqual(dominant_types({}), None)
+
+    def test_guarded_operation(self):
+        self.write_feedback({
+            'pkg.mod:mod.pyx:1:5': {'float,float': 10},
+            'pkg.mod:mod.pyx:2:5': {'int,int': 10},
+            'pkg.mod:mod.pyx:3:5': {'int,float': 10},
+            'pkg.mod:mod.pyx:4:5': {'str,str': 10},
+            'pkg.mod:mod.pyx:5:5': {'?': 10},
+            'other.mod:mod.pyx:6:5': {'int,int': 10},
+        })
+        source = StringSourceDescriptor('mod.pyx', '')
+        self.assertEqual(guarded_operation('pkg.mod', (source, 1, 5), '+', self.feedback_file), ('Float', 'Add'))
+        self.assertEqual(guarded_operation('pkg.mod', (source, 2, 5), '*', self.feedback_file), ('Int', 'Multiply'))
+        self.assertEqual(guarded_operation('pkg.mod', (source, 2, 5), '/', self.feedback_file), None)
+        for line in (3, 4, 5, 6):
+            self.assertEqual(guarded_operation('pkg.mod', (source, line, 5), '+', self.feedback_file), None)
+        self.assertEqual(guarded_operation('other.mod', (source, 6, 5), '+', self.feedback_file), ('Int', 'Add'))
+        self.assertEqual(guarded_operation('other.mod', (source, 1, 5), '+', self.feedback_file), None)
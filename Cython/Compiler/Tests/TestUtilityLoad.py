@@ -1,4 +1,6 @@
+import re
 import unittest
+from functools import partial
 
 from Cython.Compiler import Code, UtilityCode
 
@@ -92,3 +94,33 @@ class TestCythonUtilityLoader(TestTempitaUtilityLoader):
 
     test_load = TestUtilityLoader.test_load
     test_load_tempita = TestTempitaUtilityLoader.test_load
+
+
+class TestCythonUtilityTreeCache(unittest.TestCase):
+    """
+    Test reusing the parse trees of CythonUtilityCodes
+    """
+
+    code = u"cdef list f(int n):\n    return [i for i in range(n)]\n"
+
+    def parse(self, utility):
+        context = UtilityCode.CythonUtilityCodeContext(utility.name)
+        context.prefix = utility.prefix
+        return context, utility._parse(context)
+
+    def test_parse_is_cached(self):
+        from Cython.Compiler import Builtin, TreePath
+
+        utility = UtilityCode.CythonUtilityCode(self.code, name="TestTreeCache")
+        context1, tree1 = self.parse(utility)
+        context2, tree2 = self.parse(utility)
+
+        self.assertIsNot(tree1, tree2)
+        strip_ids = partial(re.compile(r'0x[0-9a-fA-F]+').sub, '')
+        self.assertEqual(strip_ids(tree1.dump()), strip_ids(tree2.dump()))
+        self.assertIs(tree2.scope, context2.find_module(utility.name))
+        self.assertIsNot(tree1.scope, tree2.scope)
+
+        comprehension, = TreePath.find_all(tree2, "//ComprehensionNode")
+        self.assertIs(comprehension.type, Builtin.list_type)
+        self.assertEqual(comprehension.pos[0].get_lines(), tree1.pos[0].get_lines())
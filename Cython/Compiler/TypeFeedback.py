@@ -0,0 +1,112 @@
+#
+#   Runtime type feedback for arithmetic on Python objects
+#
+
+from __future__ import absolute_import
+
+import json
+import os
+
+# Arithmetic operators for which guarded fast paths are available.
+feedback_operators = {
+    '+': 'Add',
+    '-': 'Subtract',
+    '*': 'Multiply',
+}
+
+# Operand types (by their runtime type name) that have a fast path.
+feedback_types = {
+    'int': 'Int',
+    'float': 'Float',
+}
+
+# Share of the observed operations that the dominant operand types must cover.
+dominance_threshold = 0.9
+
+_feedback_cache = {}
+
+
+def position_key(module_name, pos):
+    """
+    Return the key under which the operation at source position 'pos' in
+    the module 'module_name' is recorded, e.g. "pkg.module:module.pyx:12:8".
+    The module name keeps modules with the same file name apart, and
+    include files that several modules use.
+    """
+    source_desc, line, col = pos
+    return u"%s:%s:%d:%d" % (module_name, os.path.basename(source_desc.get_description()), line, col)
+
+
+def dominant_types(counts):
+    """
+    Return the pair of operand type names that covers the most operations
+    in 'counts' (a mapping from "type1,type2" to a count), or None if no pair
+    reaches the dominance threshold.
+    """
+    total = sum(counts.values())
+    if not total:
+        return None
+    types, count = max(counts.items(), key=lambda item: (item[1], item[0]))
+    if count < total * dominance_threshold:
+        return None
+    return tuple(types.split(','))
+
+
+def load_type_feedback(path):
+    """
+    Read a feedback file written by save_type_feedback() and return a dict
+    that maps position keys to the dominant pair of operand type names.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+    cached = _feedback_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path) as f:
+        data = json.load(f)
+    feedback = {}
+    for key, counts in data.items():
+        types = dominant_types(counts)
+        if types is not None:
+            feedback[key] = types
+    _feedback_cache[path] = (mtime, feedback)
+    return feedback
+
+
+def guarded_operation(module_name, pos, operator, feedback_file):
+    """
+    Return the (type, operation) names of a guarded fast path for the binary
+    operation at 'pos' in the module 'module_name', or None if the feedback
+    has no usable observation.
+    """
+    operation = feedback_operators.get(operator)
+    if operation is None:
+        return None
+    types = load_type_feedback(feedback_file).get(position_key(module_name, pos))
+    if types is None or len(types) != 2 or types[0] != types[1] or types[0] not in feedback_types:
+        return None
+    return feedback_types[types[0]], operation
+
+
+def save_type_feedback(modules, path):
+    """
+    Write the type feedback that the given modules (compiled with the
+    'record_type_feedback' directive) collected so far into a JSON file,
+    adding to the counts that the file already contains.
+    """
+    if not isinstance(modules, (list, tuple)):
+        modules = [modules]
+    data = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+    for module in modules:
+        for key, counts in module.__pyx_type_feedback__().items():
+            site = data.setdefault(key, {})
+            for types, count in counts.items():
+                site[types] = site.get(types, 0) + count
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
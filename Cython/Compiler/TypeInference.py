@@ -1,6 +1,6 @@
 from __future__ import absolute_import
 
-from .Errors import error, message
+from .Errors import error, message, performance_hint
 from . import ExprNodes
 from . import Nodes
 from . import Builtin
@@ -515,6 +515,11 @@ class SimpleAssignmentTypeInferer(object):
         while reinfer():
             pass
 
+        if scope.directives['warn.performance']:
+            for entry in inferred:
+                if entry.type is py_object_type:
+                    explain_object_type(entry, inferred_types(entry), scope)
+
         if verbose:
             for entry in inferred:
                 message(entry.pos, "inferred '%s' to be of type '%s'" % (
@@ -598,5 +603,33 @@ def safe_spanning_type(types, might_overflow, scope):
     return py_object_type
 
 
+def explain_object_type(entry, types, scope):
+    """
+    Explain why the variable 'entry' with the assigned value 'types' was
+    inferred to be a generic Python object, if C types were involved.
+    """
+    c_types = [t for t in types if not t.is_pyobject]
+    if not c_types:
+        return
+    py_types = [t for t in types if t.is_pyobject and t is not py_object_type]
+
+    def type_names(types):
+        return ', '.join(sorted(set(map(str, types))))
+
+    if (entry.might_overflow and scope.directives['infer_types'] is None and
+            all(t.is_int or t.is_enum for t in c_types)):
+        reason = ("arithmetic on its C integer values (%s) might overflow; "
+                  "declare its type or enable the 'infer_types' directive") % type_names(c_types)
+    elif len(c_types) < len(types):
+        reason = "it is assigned both C values (%s) and Python objects%s" % (
+            type_names(c_types), " (%s)" % type_names(py_types) if py_types else "")
+    elif PyrexTypes.c_bint_type in types:
+        reason = "it is assigned both 'bint' and other values (%s)" % type_names(types)
+    else:
+        reason = "no C type can safely hold all of its assigned values (%s)" % type_names(types)
+    performance_hint(entry.pos, "'%s' is inferred as a Python object because %s" % (entry.name, reason),
+                     scope.directives)
+
+
 def get_type_inferer():
     return SimpleAssignmentTypeInferer()
@@ -324,6 +324,7 @@ class LetNode(Nodes.StatNode, LetNodeMixin):
 
     def analyse_expressions(self, env):
         self.temp_expression = self.temp_expression.analyse_expressions(env)
+        self.lazy_temp.update_expression(self.temp_expression)  # overwrite in case it changed
         self.body = self.body.analyse_expressions(env)
         return self
 
@@ -1,6 +1,14 @@
 from __future__ import absolute_import
 
+from io import BytesIO
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
 from .TreeFragment import parse_from_strings, StringParseContext
+from .Scanning import StringSourceDescriptor
 from . import Symtab
 from . import Naming
 from . import Code
@@ -123,8 +131,7 @@ class CythonUtilityCode(Code.UtilityCodeBase):
         context.prefix = self.prefix
         context.cython_scope = cython_scope
         #context = StringParseContext(self.name)
-        tree = parse_from_strings(
-            self.name, self.impl, context=context, allow_struct_enum_decorator=True)
+        tree = self._parse(context)
         pipeline = Pipeline.create_pipeline(context, 'pyx', exclude_classes=excludes)
 
         if entries_only:
@@ -194,6 +201,31 @@ class CythonUtilityCode(Code.UtilityCodeBase):
         self.tree = tree
         return tree
 
+    def _parse(self, context):
+        """
+        Parse the utility code.  The pipeline modifies the tree, so a pickled
+        copy of each parse tree is kept and unpickled for later compilations
+        in the same process (and in forked worker processes).
+        """
+        key = (self.name, self.impl, context.cpp, context.legacy_implicit_noexcept)
+        try:
+            pickled_tree = _parsed_tree_cache[key]
+        except KeyError:
+            pass
+        else:
+            return _unpickle_tree(pickled_tree, context, self.name)
+
+        from .PxdCache import parser_state
+        state_before = parser_state(context)
+        tree = parse_from_strings(
+            self.name, self.impl, context=context, allow_struct_enum_decorator=True)
+        if parser_state(context) == state_before:
+            try:
+                _parsed_tree_cache[key] = _pickle_tree(tree)
+            except pickle.PicklingError:
+                pass
+        return tree
+
     def put_code(self, output):
         pass
 
@@ -256,6 +288,40 @@ class CythonUtilityCode(Code.UtilityCodeBase):
         return utility_code_directives
 
 
+_parsed_tree_cache = {}
+
+
+def _pickle_tree(tree):
+    """
+    Pickle a freshly parsed tree.  Its scope and source descriptor are
+    replaced by new ones when unpickling.
+    """
+    from .PxdCache import dump_tree
+
+    def persistent_id(obj):
+        if obj is tree.scope:
+            return ('scope',)
+        if isinstance(obj, StringSourceDescriptor):
+            return ('source',)
+        return None
+
+    f = BytesIO()
+    dump_tree((tree, tree.pos[0].codelines), f, persistent_id)
+    return f.getvalue()
+
+
+def _unpickle_tree(pickled_tree, context, name):
+    from .PxdCache import load_tree
+    scope = context.find_module(name, need_pxd=False)
+    source_desc = StringSourceDescriptor(name, u'')
+
+    def persistent_load(pid):
+        return scope if pid[0] == 'scope' else source_desc
+
+    tree, source_desc.codelines = load_tree(BytesIO(pickled_tree), persistent_load)
+    return tree
+
+
 def declare_declarations_in_scope(declaration_string, env, private_type=True,
                                   *args, **kwargs):
     """
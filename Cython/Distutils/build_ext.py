@@ -44,6 +44,9 @@ class build_ext(_build_ext, object):
              "generate debug information for cygdb"),
         ('cython-compile-time-env', None,
             "cython compile time environment"),
+        ('cython-pgo-train=', None,
+            "build with profile guided optimisation: build instrumented extensions, "
+            "run this shell command to train them, then rebuild them for the profile"),
         ]
 
     boolean_options = _build_ext.boolean_options + [
@@ -62,6 +65,7 @@ class build_ext(_build_ext, object):
         self.cython_gen_pxi = 0
         self.cython_gdb = False
         self.cython_compile_time_env = None
+        self.cython_pgo_train = None
 
     def finalize_options(self):
         super(build_ext, self).finalize_options()
@@ -76,6 +80,73 @@ class build_ext(_build_ext, object):
     def get_extension_attr(self, extension, option_name, default=False):
         return getattr(self, option_name) or getattr(extension, option_name, default)
 
+    def build_extensions(self):
+        if self.cython_pgo_train:
+            self.build_pgo_extensions(self.cython_pgo_train)
+        else:
+            super(build_ext, self).build_extensions()
+
+    def build_pgo_extensions(self, train_command):
+        """
+        Build the extensions with profile guided optimisation: build them
+        with instrumentation, run the training command to collect a runtime
+        profile for each extension, then rebuild them using the profiles.
+        """
+        from Cython.Build.ProfileGuided import get_pgo_flags
+        import shutil
+
+        orig_flags = [(ext.extra_compile_args or [], ext.extra_link_args or []) for ext in self.extensions]
+        profile_dirs = [os.path.join(os.path.abspath(self.build_temp), 'pgo', ext.name)
+                        for ext in self.extensions]
+        try:
+            for step_name in ('gen', 'use'):
+                for ext, profile_dir, (compile_args, link_args) in zip(self.extensions, profile_dirs, orig_flags):
+                    if step_name == 'gen' and os.path.isdir(profile_dir):
+                        # Do not mix in profiles of earlier builds.
+                        shutil.rmtree(profile_dir)
+                    flags = get_pgo_flags(self.compiler, step_name, profile_dir)
+                    if flags is None:
+                        self.warn("building '%s' without profile guided optimisation" % ext.name)
+                        flags = []
+                    ext.extra_compile_args = compile_args + flags
+                    ext.extra_link_args = link_args + flags
+                    if step_name == 'use':
+                        # Make sure that the instrumented module gets rebuilt.
+                        ext_path = self.get_ext_fullpath(ext.name)
+                        if os.path.exists(ext_path):
+                            os.remove(ext_path)
+                super(build_ext, self).build_extensions()
+                if step_name == 'gen':
+                    self.run_pgo_training(train_command)
+        finally:
+            for ext, (compile_args, link_args) in zip(self.extensions, orig_flags):
+                ext.extra_compile_args = compile_args
+                ext.extra_link_args = link_args
+
+    def run_pgo_training(self, train_command):
+        """
+        Run the training command in a shell, with the directories of the
+        instrumented extensions at the front of its PYTHONPATH.
+        """
+        import subprocess
+        from distutils.errors import DistutilsExecError
+
+        path = []
+        for ext in self.extensions:
+            base_dir = os.path.dirname(os.path.abspath(self.get_ext_fullpath(ext.name)))
+            for _ in range(ext.name.count('.')):
+                base_dir = os.path.dirname(base_dir)
+            if base_dir not in path:
+                path.append(base_dir)
+        env = dict(os.environ)
+        if env.get('PYTHONPATH'):
+            path.append(env['PYTHONPATH'])
+        env['PYTHONPATH'] = os.pathsep.join(path)
+
+        self.announce("running PGO training command: %s" % train_command, level=2)
+        if subprocess.call(train_command, shell=True, env=env) != 0:
+            raise DistutilsExecError("PGO training command failed: %s" % train_command)
+
     def build_extension(self, ext):
         from Cython.Build.Dependencies import cythonize
 
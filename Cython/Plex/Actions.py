@@ -29,6 +29,9 @@ class Return(Action):
     def perform(self, token_stream, text):
         return self.value
 
+    def __reduce__(self):
+        return (Return, (self.value,))
+
     def __repr__(self):
         return "Return(%r)" % self.value
 
@@ -44,6 +47,9 @@ class Call(Action):
     def perform(self, token_stream, text):
         return self.function(token_stream, text)
 
+    def __reduce__(self):
+        return (Call, (self.function,))
+
     def __repr__(self):
         return "Call(%s)" % self.function.__name__
 
@@ -63,6 +69,9 @@ class Method(Action):
         # self.kwargs is almost always unused => avoid call overhead
         return method(text, **self.kwargs) if self.kwargs is not None else method(text)
 
+    def __reduce__(self):
+        return (_make_method, (self.name, self.kwargs))
+
     def __repr__(self):
         kwargs = (
             ', '.join(sorted(['%s=%r' % item for item in self.kwargs.items()]))
@@ -70,6 +79,10 @@ class Method(Action):
         return "Method(%s%s%s)" % (self.name, ', ' if kwargs else '', kwargs)
 
 
+def _make_method(name, kwargs):
+    return Method(name, **(kwargs or {}))
+
+
 class Begin(Action):
     """
     Begin(state_name) is a Plex action which causes the Scanner to
@@ -83,6 +96,9 @@ class Begin(Action):
     def perform(self, token_stream, text):
         token_stream.begin(self.state_name)
 
+    def __reduce__(self):
+        return (Begin, (self.state_name,))
+
     def __repr__(self):
         return "Begin(%s)" % self.state_name
 
@@ -97,6 +113,9 @@ class Ignore(Action):
     def perform(self, token_stream, text):
         return None
 
+    def __reduce__(self):
+        return 'IGNORE'
+
     def __repr__(self):
         return "IGNORE"
 
@@ -114,6 +133,9 @@ class Text(Action):
     def perform(self, token_stream, text):
         return text
 
+    def __reduce__(self):
+        return 'TEXT'
+
     def __repr__(self):
         return "TEXT"
 
@@ -144,6 +144,7 @@ class Lexicon(object):
             dfa.dump(debug)
 
         self.machine = dfa
+        self.tables = Machines.StateTableMachine(dfa)
 
     def add_token_to_machine(self, machine, initial_state, token_spec, token_number):
         try:
@@ -177,3 +178,22 @@ class Lexicon(object):
 
     def get_initial_state(self, name):
         return self.machine.get_initial_state(name)
+
+    def to_tables(self):
+        """
+        Return the state table machine that the Scanner uses as plain
+        (picklable) data, from which from_tables() can rebuild the
+        Lexicon without repeating the NFA to DFA conversion.
+        """
+        return self.tables.to_tables()
+
+    @classmethod
+    def from_tables(cls, tables):
+        """
+        Rebuild a Lexicon from the result of to_tables().  It only has the
+        state table machine for the Scanner, its 'machine' is None.
+        """
+        lexicon = cls.__new__(cls)
+        lexicon.machine = None
+        lexicon.tables = Machines.StateTableMachine.from_tables(tables)
+        return lexicon
@@ -7,6 +7,9 @@ Classes for building NFAs and DFAs
 from __future__ import absolute_import
 
 import cython
+from array import array
+from bisect import bisect_right
+
 from .Transitions import TransitionMap
 
 maxint = 2**31-1  # sentinel value
@@ -19,6 +22,21 @@ if not cython.compiled:
 
 LOWEST_PRIORITY = -maxint
 
+# The states of a FastMachine map the characters below this limit directly
+# to the next state and keep larger characters as a list of character ranges.
+# Expanding all ranges, e.g. of the Unicode identifier characters, would
+# cost a lot of time and memory.
+char_table_limit = 128
+
+# the non-character events in the states of a FastMachine
+special_events = ('bol', 'eol', 'eof', 'else')
+
+# the fixed character classes of a StateTableMachine
+NO_INPUT_CLASS = 0  # the empty string at the end of the input
+BOL_CLASS = 1
+EOL_CLASS = 2
+EOF_CLASS = 3
+
 
 class Machine(object):
     """A collection of Nodes representing an NFA or DFA."""
@@ -148,6 +166,7 @@ class FastMachine(object):
         result = self.new_state_template.copy()
         result['number'] = number
         result['action'] = action
+        result['ranges'] = []
         self.states.append(result)
         return result
 
@@ -161,9 +180,11 @@ class FastMachine(object):
             if code0 == -maxint:
                 state['else'] = new_state
             elif code1 != maxint:
-                while code0 < code1:
+                while code0 < code1 and code0 < char_table_limit:
                     state[unichr(code0)] = new_state
                     code0 += 1
+                if code0 < code1:
+                    state['ranges'].append((code0, code1, new_state))
         else:
             state[event] = new_state
 
@@ -191,6 +212,7 @@ class FastMachine(object):
     def dump_transitions(self, state, file):
         chars_leading_to_state = {}
         special_to_state = {}
+        large_ranges_leading_to_state = {}
         for (c, s) in state.items():
             if len(c) == 1:
                 chars = chars_leading_to_state.get(id(s), None)
@@ -200,11 +222,16 @@ class FastMachine(object):
                 chars.append(c)
             elif len(c) <= 4:
                 special_to_state[c] = s
+        for code0, code1, s in state['ranges']:
+            large_ranges_leading_to_state.setdefault(id(s), []).append((unichr(code0), unichr(code1 - 1)))
         ranges_to_state = {}
         for state in self.states:
             char_list = chars_leading_to_state.get(id(state), None)
-            if char_list:
-                ranges = self.chars_to_ranges(char_list)
+            large_ranges = large_ranges_leading_to_state.get(id(state), None)
+            if char_list or large_ranges:
+                ranges = self.chars_to_ranges(char_list or [])
+                if large_ranges:
+                    ranges += tuple(large_ranges)
                 ranges_to_state[ranges] = state
         for ranges in sorted(ranges_to_state):
             key = self.ranges_to_string(ranges)
@@ -240,3 +267,181 @@ class FastMachine(object):
             return repr(c1)
         else:
             return "%s..%s" % (repr(c1), repr(c2))
+
+
+class StateTableMachine(object):
+    """
+    A deterministic machine in the form of arrays that the Scanner can
+    index directly, built from a FastMachine:
+
+      actions         [state] -> Action or None
+      transitions     [state * num_classes + char_class] -> next state or -1
+      ascii_classes   [character code] -> char_class, for ASCII characters
+
+    Characters that lead to the same next state in every state share a
+    class.  The classes of other characters are looked up by char_class().
+    The end of the input (the empty string) and the BOL, EOL and EOF events
+    have the fixed classes NO_INPUT_CLASS, BOL_CLASS, EOL_CLASS and EOF_CLASS.
+    """
+
+    def __init__(self, machine):
+        states = machine.states
+        state_index = {}
+        for i, state in enumerate(states):
+            state_index[id(state)] = i
+        num_states = len(states)
+
+        def column(targets):
+            return tuple([-1 if target is None else state_index[id(target)] for target in targets])
+
+        columns = [(-1,) * num_states] + [
+            column([state[event] for state in states]) for event in special_events[:3]]
+        class_of_column = {}
+
+        def get_class(targets):
+            key = column(targets)
+            char_class = class_of_column.get(key)
+            if char_class is None:
+                char_class = class_of_column[key] = len(columns)
+                columns.append(key)
+            return char_class
+
+        self.ascii_classes = array('i', [
+            get_class([state.get(unichr(code)) or state['else'] for state in states])
+            for code in range(char_table_limit)])
+
+        # Non-ASCII characters are split into segments at the bounds of all
+        # character ranges.  Only the states with character ranges make a
+        # difference between the segments, the others use their 'else' state.
+        bounds = set([char_table_limit])
+        for state in states:
+            for code0, code1, _ in state['ranges']:
+                bounds.add(code0)
+                bounds.add(code1)
+        ranged_states = [
+            (i, sorted(state['ranges'], key=range_start))
+            for i, state in enumerate(states) if state['ranges']]
+        positions = [0] * len(ranged_states)
+        else_targets = [state['else'] for state in states]
+        class_of_range_targets = {}
+        range_bounds = []
+        range_classes = []
+        for start in sorted(bounds):
+            range_targets = []
+            for k, (i, ranges) in enumerate(ranged_states):
+                pos = positions[k]
+                while pos < len(ranges) and ranges[pos][1] <= start:
+                    pos += 1
+                positions[k] = pos
+                if pos < len(ranges) and ranges[pos][0] <= start:
+                    range_targets.append(ranges[pos][2])
+                else:
+                    range_targets.append(else_targets[i])
+            key = column(range_targets)
+            char_class = class_of_range_targets.get(key)
+            if char_class is None:
+                targets = else_targets[:]
+                for (i, _), target in zip(ranged_states, range_targets):
+                    targets[i] = target
+                char_class = class_of_range_targets[key] = get_class(targets)
+            if not range_classes or range_classes[-1] != char_class:
+                range_bounds.append(start)
+                range_classes.append(char_class)
+        self.range_bounds = range_bounds
+        self.range_classes = range_classes
+
+        self.num_classes = num_classes = len(columns)
+        transitions = array('i', [-1]) * (num_states * num_classes)
+        for char_class, targets in enumerate(columns):
+            for i, target in enumerate(targets):
+                transitions[i * num_classes + char_class] = target
+        self.transitions = transitions
+
+        self.actions = [state['action'] for state in states]
+        self.initial_states = {}
+        for name, state in machine.initial_states.items():
+            self.initial_states[name] = state_index[id(state)]
+        self._init_char_classes()
+
+    def _init_char_classes(self):
+        self.char_classes = char_classes = {
+            u'': NO_INPUT_CLASS,
+            'bol': BOL_CLASS,
+            'eol': EOL_CLASS,
+            'eof': EOF_CLASS,
+        }
+        for code, char_class in enumerate(self.ascii_classes):
+            char_classes[unichr(code)] = char_class
+
+    def to_tables(self):
+        """
+        Return the machine as plain (picklable) data that from_tables()
+        accepts.  The arrays are stored as their raw bytes, which are
+        quick to load but only valid for the same int size and byte order:
+
+            (initial_states, actions, num_classes, transitions, ascii_classes,
+             range_bounds, range_classes)
+        """
+        return (
+            self.initial_states, self.actions, self.num_classes,
+            _array_to_bytes(self.transitions), _array_to_bytes(self.ascii_classes),
+            self.range_bounds, self.range_classes)
+
+    @classmethod
+    def from_tables(cls, tables):
+        """
+        Build a machine from the result of to_tables().
+        """
+        (initial_states, actions, num_classes, transitions, ascii_classes,
+         range_bounds, range_classes) = tables
+        machine = cls.__new__(cls)
+        machine.initial_states = initial_states
+        machine.actions = actions
+        machine.num_classes = num_classes
+        machine.transitions = _array_from_bytes(transitions)
+        machine.ascii_classes = _array_from_bytes(ascii_classes)
+        machine.range_bounds = range_bounds
+        machine.range_classes = range_classes
+        if (len(machine.transitions) != len(actions) * num_classes or
+                len(machine.ascii_classes) != char_table_limit or
+                len(range_bounds) != len(range_classes)):
+            raise ValueError("Inconsistent state machine tables")
+        machine._init_char_classes()
+        return machine
+
+    def get_initial_state(self, name):
+        return self.initial_states[name]
+
+    def char_class(self, c):
+        """
+        Return the class of a character or of one of the special events.
+        """
+        char_class = self.char_classes.get(c)
+        if char_class is None:
+            code = ord(c)
+            if code < char_table_limit:
+                char_class = self.ascii_classes[code]
+            else:
+                char_class = self.range_classes[bisect_right(self.range_bounds, code) - 1]
+            self.char_classes[c] = char_class
+        return char_class
+
+
+def range_start(char_range):
+    return char_range[0]
+
+
+def _array_to_bytes(int_array):
+    try:
+        return int_array.tobytes()
+    except AttributeError:
+        return int_array.tostring()  # Py2
+
+
+def _array_from_bytes(data):
+    int_array = array('i')
+    try:
+        int_array.frombytes(data)
+    except AttributeError:
+        int_array.fromstring(data)  # Py2
+    return int_array
@@ -3,6 +3,8 @@ from __future__ import absolute_import
 import cython
 
 from Cython.Plex.Actions cimport Action
+# allows memoryviews of array.array in Python 2
+cimport cpython.array
 
 cdef class Scanner:
 
@@ -19,11 +21,18 @@ cdef class Scanner:
     cdef tuple current_scanner_position_tuple
     cdef public tuple last_token_position_tuple
     cdef public text
-    cdef public initial_state # int?
+    cdef public Py_ssize_t initial_state
+    cdef readonly tables
+    cdef list actions
+    cdef const int[:] transitions
+    cdef const int[:] ascii_classes
+    cdef dict char_classes
+    cdef Py_ssize_t num_classes
     cdef public state_name
     cdef public list queue
     cdef public bint trace
     cdef public cur_char
+    cdef Py_ssize_t cur_char_class
     cdef public long input_state
 
     cdef public level
@@ -39,7 +48,9 @@ cdef class Scanner:
 
     @cython.final
     @cython.locals(cur_pos=Py_ssize_t, cur_line=Py_ssize_t, cur_line_start=Py_ssize_t,
-                   input_state=long, next_pos=Py_ssize_t, state=dict,
+                   input_state=long, next_pos=Py_ssize_t, state=Py_ssize_t, new_state=Py_ssize_t,
+                   char_class=Py_ssize_t, b_char_class=Py_ssize_t, num_classes=Py_ssize_t, code=long,
+                   actions=list, char_classes=dict, transitions='const int[:]', ascii_classes='const int[:]',
                    buf_start_pos=Py_ssize_t, buf_len=Py_ssize_t, buf_index=Py_ssize_t,
                    trace=bint, discard=Py_ssize_t, data=unicode, buffer=unicode)
     cdef run_machine_inlined(self)
@@ -9,13 +9,14 @@ from __future__ import absolute_import
 
 import cython
 
-cython.declare(BOL=object, EOL=object, EOF=object, NOT_FOUND=object)  # noqa:E402
+cython.declare(BOL=object, EOL=object, EOF=object,
+               NO_INPUT_CLASS=cython.Py_ssize_t, BOL_CLASS=cython.Py_ssize_t,
+               EOL_CLASS=cython.Py_ssize_t, EOF_CLASS=cython.Py_ssize_t)  # noqa:E402
 
 from . import Errors
+from .Machines import NO_INPUT_CLASS, BOL_CLASS, EOL_CLASS, EOF_CLASS
 from .Regexps import BOL, EOL, EOF
 
-NOT_FOUND = object()
-
 
 class Scanner(object):
     """
@@ -69,7 +70,7 @@ class Scanner(object):
     #  last_token_position_tuple = ("", 0, 0)  # tuple of filename, line number and position in line
 
     #  text = None           # text of last token read
-    #  initial_state = None  # Node
+    #  initial_state = 0     # state number in the StateTableMachine
     #  state_name = ''       # Name of initial state
     #  queue = None          # list of tokens and positions to be returned
     #  trace = 0
@@ -101,15 +102,22 @@ class Scanner(object):
         self.state_name = None
 
         self.lexicon = lexicon
+        self.tables = tables = lexicon.tables
+        self.actions = tables.actions
+        self.transitions = tables.transitions
+        self.ascii_classes = tables.ascii_classes
+        self.char_classes = tables.char_classes
+        self.num_classes = tables.num_classes
         self.stream = stream
         self.name = name
         self.queue = []
-        self.initial_state = None
+        self.initial_state = 0
         self.begin('')
         self.next_pos = 0
         self.cur_pos = 0
         self.cur_line_start = 0
         self.cur_char = BOL
+        self.cur_char_class = BOL_CLASS
         self.input_state = 1
         if initial_pos is not None:
             self.cur_line, self.cur_line_start = initial_pos[1], -initial_pos[2]
@@ -169,6 +177,8 @@ class Scanner(object):
                     return (u'', None)
             raise Errors.UnrecognizedInput(self, self.state_name)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def run_machine_inlined(self):
         """
         Inlined version of run_machine for speed.
@@ -178,35 +188,38 @@ class Scanner(object):
         cur_line = self.cur_line
         cur_line_start = self.cur_line_start
         cur_char = self.cur_char
+        char_class = self.cur_char_class
+        actions = self.actions
+        transitions = self.transitions
+        ascii_classes = self.ascii_classes
+        char_classes = self.char_classes
+        num_classes = self.num_classes
         input_state = self.input_state
         next_pos = self.next_pos
         buffer = self.buffer
         buf_start_pos = self.buf_start_pos
         buf_len = len(buffer)
-        b_action, b_cur_pos, b_cur_line, b_cur_line_start, b_cur_char, b_input_state, b_next_pos = \
-            None, 0, 0, 0, u'', 0, 0
+        b_action, b_cur_pos, b_cur_line, b_cur_line_start, b_cur_char, b_char_class, b_input_state, b_next_pos = \
+            None, 0, 0, 0, u'', 0, 0, 0
 
         trace = self.trace
         while 1:
             if trace:
                 print("State %d, %d/%d:%s -->" % (
-                    state['number'], input_state, cur_pos, repr(cur_char)))
+                    state, input_state, cur_pos, repr(cur_char)))
 
             # Begin inlined self.save_for_backup()
-            action = state['action']
+            action = actions[state]
             if action is not None:
-                b_action, b_cur_pos, b_cur_line, b_cur_line_start, b_cur_char, b_input_state, b_next_pos = \
-                    action, cur_pos, cur_line, cur_line_start, cur_char, input_state, next_pos
+                b_action, b_cur_pos, b_cur_line, b_cur_line_start, b_cur_char, b_char_class, b_input_state, b_next_pos = \
+                    action, cur_pos, cur_line, cur_line_start, cur_char, char_class, input_state, next_pos
             # End inlined self.save_for_backup()
 
-            c = cur_char
-            new_state = state.get(c, NOT_FOUND)
-            if new_state is NOT_FOUND:
-                new_state = c and state.get('else')
+            new_state = transitions[state * num_classes + char_class]
 
-            if new_state:
+            if new_state >= 0:
                 if trace:
-                    print("State %d" % new_state['number'])
+                    print("State %d" % new_state)
                 state = new_state
                 # Begin inlined: self.next_char()
                 if input_state == 1:
@@ -233,25 +246,39 @@ class Scanner(object):
                     # End inlined: c = self.read_char()
                     if c == u'\n':
                         cur_char = EOL
+                        char_class = EOL_CLASS
                         input_state = 2
                     elif not c:
                         cur_char = EOL
+                        char_class = EOL_CLASS
                         input_state = 4
                     else:
                         cur_char = c
+                        if cython.compiled:
+                            code = ord(c)
+                            char_class = ascii_classes[code] if code < 128 else -1  # Machines.char_table_limit
+                        else:
+                            # a dict lookup is faster than ord() and indexing in Python
+                            char_class = char_classes.get(c, -1)
+                        if char_class < 0:
+                            char_class = self.tables.char_class(c)
                 elif input_state == 2:  # after EoL (1) -> BoL (3)
                     cur_char = u'\n'
+                    char_class = ascii_classes[10]
                     input_state = 3
                 elif input_state == 3:  # start new code line
                     cur_line += 1
                     cur_line_start = cur_pos = next_pos
                     cur_char = BOL
+                    char_class = BOL_CLASS
                     input_state = 1
                 elif input_state == 4:  # after final line (1) -> EoF (5)
                     cur_char = EOF
+                    char_class = EOF_CLASS
                     input_state = 5
                 else:  # input_state == 5  (EoF)
                     cur_char = u''
+                    char_class = NO_INPUT_CLASS
                     # End inlined self.next_char()
             else:  # not new_state
                 if trace:
@@ -259,9 +286,9 @@ class Scanner(object):
                 # Begin inlined: action = self.back_up()
                 if b_action is not None:
                     (action, cur_pos, cur_line, cur_line_start,
-                     cur_char, input_state, next_pos) = \
+                     cur_char, char_class, input_state, next_pos) = \
                         (b_action, b_cur_pos, b_cur_line, b_cur_line_start,
-                         b_cur_char, b_input_state, b_next_pos)
+                         b_cur_char, b_char_class, b_input_state, b_next_pos)
                 else:
                     action = None
                 break  # while 1
@@ -271,6 +298,7 @@ class Scanner(object):
         self.cur_line = cur_line
         self.cur_line_start = cur_line_start
         self.cur_char = cur_char
+        self.cur_char_class = char_class
         self.input_state = input_state
         self.next_pos = next_pos
         if trace:
@@ -287,25 +315,32 @@ class Scanner(object):
             c = self.read_char()
             if c == u'\n':
                 self.cur_char = EOL
+                self.cur_char_class = EOL_CLASS
                 self.input_state = 2
             elif not c:
                 self.cur_char = EOL
+                self.cur_char_class = EOL_CLASS
                 self.input_state = 4
             else:
                 self.cur_char = c
+                self.cur_char_class = self.tables.char_class(c)
         elif input_state == 2:
             self.cur_char = u'\n'
+            self.cur_char_class = self.ascii_classes[10]
             self.input_state = 3
         elif input_state == 3:
             self.cur_line += 1
             self.cur_line_start = self.cur_pos = self.next_pos
             self.cur_char = BOL
+            self.cur_char_class = BOL_CLASS
             self.input_state = 1
         elif input_state == 4:
             self.cur_char = EOF
+            self.cur_char_class = EOF_CLASS
             self.input_state = 5
         else:  # input_state = 5
             self.cur_char = u''
+            self.cur_char_class = NO_INPUT_CLASS
         if self.trace:
             print("--> [%d] %d %r" % (input_state, self.cur_pos, self.cur_char))
 
@@ -328,8 +363,7 @@ class Scanner(object):
 
     def begin(self, state_name):
         """Set the current state of the scanner to the named state."""
-        self.initial_state = (
-            self.lexicon.get_initial_state(state_name))
+        self.initial_state = self.tables.get_initial_state(state_name)
         self.state_name = state_name
 
     def produce(self, value, text=None):
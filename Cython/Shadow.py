@@ -89,6 +89,9 @@ def _empty_decorator(x):
 def locals(**arg_types):
     return _empty_decorator
 
+def fused_specializations(**fused_types):
+    return _empty_decorator
+
 def test_assert_path_exists(*paths):
     return _empty_decorator
 
@@ -111,7 +114,7 @@ cclass = ccall = cfunc = _EmptyDecoratorAndManager()
 annotation_typing = returns = wraparound = boundscheck = initializedcheck = \
     nonecheck = embedsignature = cdivision = cdivision_warnings = \
     always_allows_keywords = profile = linetrace = infer_types = \
-    unraisable_tracebacks = freelist = \
+    unraisable_tracebacks = freelist = closure_freelist = vectorize = \
         lambda _: _EmptyDecoratorAndManager()
 
 exceptval = lambda _=None, check=True: _EmptyDecoratorAndManager()
@@ -123,7 +126,8 @@ optimize = _Optimization()
 embedsignature.format = overflowcheck.fold = optimize.use_switch = \
     optimize.unpack_method_calls = lambda arg: _EmptyDecoratorAndManager()
 
-final = internal = type_version_tag = no_gc_clear = no_gc = total_ordering = _empty_decorator
+final = internal = type_version_tag = no_gc_clear = no_gc = total_ordering = \
+    exhausts_iterables = _empty_decorator
 
 binding = lambda _: _empty_decorator
 
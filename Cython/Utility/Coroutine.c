@@ -404,6 +404,21 @@ typedef struct __pyx_CoroutineObject {
     char is_running;
 } __pyx_CoroutineObject;
 
+// Generators and coroutines are often created and discarded at a high rate,
+// so we keep a few deallocated objects around for reuse.  Objects that were
+// already finalised cannot be reused because the GC keeps that state.
+#ifndef CYTHON_COROUTINE_FREELIST_SIZE
+  #define CYTHON_COROUTINE_FREELIST_SIZE 8
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TP_FINALIZE && PY_VERSION_HEX >= 0x030900B1 && CYTHON_COROUTINE_FREELIST_SIZE > 0
+  #define __Pyx_Coroutine_USE_FREELIST
+  static __pyx_CoroutineObject *__pyx_Coroutine_freelist[CYTHON_COROUTINE_FREELIST_SIZE];
+  static int __pyx_Coroutine_freecount = 0;
+  #if CYTHON_FREELIST_STATS
+  static Py_ssize_t __pyx_Coroutine_freelist_hits = 0, __pyx_Coroutine_freelist_misses = 0;
+  #endif
+#endif
+
 static __pyx_CoroutineObject *__Pyx__Coroutine_New(
     PyTypeObject *type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
     PyObject *name, PyObject *qualname, PyObject *module_name); /*proto*/
@@ -484,8 +499,17 @@ static int __pyx_Generator_init(PyObject *module); /*proto*/
 // -> empty, only delegates to separate file
 
 
+//////////////////// CoroutineBase.cleanup ////////////////////
+
+#ifdef __Pyx_Coroutine_USE_FREELIST
+while (__pyx_Coroutine_freecount > 0) {
+    PyObject_GC_Del(__pyx_Coroutine_freelist[--__pyx_Coroutine_freecount]);
+}
+#endif
+
 //////////////////// CoroutineBase ////////////////////
 //@substitute: naming
+//@requires: ModuleSetupCode.c::FreelistStats
 //@requires: Exceptions.c::PyErrFetchRestore
 //@requires: Exceptions.c::PyThreadStateGet
 //@requires: Exceptions.c::SwapException
@@ -1237,6 +1261,18 @@ static void __Pyx_Coroutine_dealloc(PyObject *self) {
     }
 #endif
     __Pyx_Coroutine_clear(self);
+#ifdef __Pyx_Coroutine_USE_FREELIST
+    if (likely(__pyx_Coroutine_freecount < CYTHON_COROUTINE_FREELIST_SIZE) &&
+            Py_TYPE(self)->tp_basicsize == sizeof(__pyx_CoroutineObject) &&
+            !PyObject_GC_IsFinalized(self)) {
+        // Keep the memory but release the type reference, as PyObject_INIT() takes a new one on reuse.
+        PyTypeObject *type = Py_TYPE(self);
+        __pyx_Coroutine_freelist[__pyx_Coroutine_freecount++] = gen;
+        if (__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE))
+            Py_DECREF(type);
+        return;
+    }
+#endif
     __Pyx_PyHeapTypeObject_GC_Del(gen);
 }
 
@@ -1455,7 +1491,19 @@ __Pyx_Coroutine_get_frame(__pyx_CoroutineObject *self, void *context)
 static __pyx_CoroutineObject *__Pyx__Coroutine_New(
             PyTypeObject* type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
             PyObject *name, PyObject *qualname, PyObject *module_name) {
-    __pyx_CoroutineObject *gen = PyObject_GC_New(__pyx_CoroutineObject, type);
+    __pyx_CoroutineObject *gen;
+#ifdef __Pyx_Coroutine_USE_FREELIST
+    if (likely(__pyx_Coroutine_freecount > 0) && likely(type->tp_basicsize == sizeof(__pyx_CoroutineObject))) {
+        __Pyx_FREELIST_STAT(__pyx_Coroutine_freelist_hits);
+        gen = __pyx_Coroutine_freelist[--__pyx_Coroutine_freecount];
+        (void) PyObject_INIT((PyObject*)gen, type);
+    } else {
+        __Pyx_FREELIST_STAT(__pyx_Coroutine_freelist_misses);
+        gen = PyObject_GC_New(__pyx_CoroutineObject, type);
+    }
+#else
+    gen = PyObject_GC_New(__pyx_CoroutineObject, type);
+#endif
     if (unlikely(!gen))
         return NULL;
     return __Pyx__Coroutine_NewInit(gen, body, code, closure, name, qualname, module_name);
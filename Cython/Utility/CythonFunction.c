@@ -96,6 +96,7 @@ static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *c
 static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_VARARGS_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
 #if CYTHON_BACKPORT_VECTORCALL
 #define __Pyx_CyFunction_func_vectorcall(f) (((__pyx_CyFunctionObject*)f)->func_vectorcall)
 #else
@@ -108,6 +109,7 @@ static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject
 //@requires: CommonStructures.c::FetchCommonType
 //@requires: ObjectHandling.c::PyMethodNew
 //@requires: ObjectHandling.c::PyVectorcallFastCallDict
+//@requires: ObjectHandling.c::TupleAndListFromArray
 //@requires: ModuleSetupCode.c::IncludeStructmemberH
 //@requires: ObjectHandling.c::PyObjectGetAttrStr
 
@@ -582,7 +584,7 @@ static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *
         break;
     // case METH_VARARGS is not used
     case METH_VARARGS | METH_KEYWORDS:
-        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_VARARGS_KEYWORDS;
         break;
     default:
         PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
@@ -750,8 +752,9 @@ static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, P
 #if CYTHON_METH_FASTCALL
     // Prefer vectorcall if available. This is not the typical case, as
     // CPython would normally use vectorcall directly instead of tp_call.
+    // METH_VARARGS functions can use the args tuple that we already have.
      __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
-    if (vc) {
+    if (vc && !(((PyCFunctionObject*)cyfunc)->m_ml->ml_flags & METH_VARARGS)) {
 #if CYTHON_ASSUME_SAFE_MACROS
         return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
 #else
@@ -940,6 +943,53 @@ static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject
 
     return ((__Pyx_PyCMethod)(void(*)(void))def->ml_meth)(self, cls, args, (size_t)nargs, kwnames);
 }
+
+// Functions that take only "*args" keep the METH_VARARGS signature since they need the
+// args tuple anyway.  Building it here directly avoids the generic tp_call path, which
+// creates a tuple and then slices off "self" for methods of cdef classes.
+static PyObject * __Pyx_CyFunction_Vectorcall_VARARGS_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyMethodDef* def = ((PyCFunctionObject*)cyfunc)->m_ml;
+#if CYTHON_BACKPORT_VECTORCALL
+    Py_ssize_t nargs = (Py_ssize_t)nargsf;
+#else
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+#endif
+    PyObject *self, *argstuple, *kwargs = NULL, *result;
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+        break;
+    default:
+        return NULL;
+    }
+
+    argstuple = __Pyx_PyTuple_FromArray(args, nargs);
+    if (unlikely(!argstuple)) return NULL;
+    if (kwnames && PyTuple_GET_SIZE(kwnames)) {
+        Py_ssize_t i;
+        kwargs = PyDict_New();
+        if (unlikely(!kwargs)) goto bad;
+        for (i = 0; i < PyTuple_GET_SIZE(kwnames); i++) {
+            if (unlikely(PyDict_SetItem(kwargs, PyTuple_GET_ITEM(kwnames, i), args[nargs + i]) < 0))
+                goto bad;
+        }
+    }
+    result = ((PyCFunctionWithKeywords)(void(*)(void))def->ml_meth)(self, argstuple, kwargs);
+    Py_DECREF(argstuple);
+    Py_XDECREF(kwargs);
+    return result;
+bad:
+    Py_DECREF(argstuple);
+    Py_XDECREF(kwargs);
+    return NULL;
+}
 #endif
 
 #if CYTHON_USE_TYPE_SPECS
@@ -1155,10 +1205,21 @@ static int __Pyx_CyFunction_InitClassCell(PyObject *cyfunctions, PyObject *class
 
 //////////////////// FusedFunction.proto ////////////////////
 
+// The specializations that were selected for the argument types of previous calls
+// are remembered, so that repeated calls do not need to run the signature matching.
+#ifndef CYTHON_FUSED_DISPATCH_CACHE
+  #define CYTHON_FUSED_DISPATCH_CACHE (!CYTHON_COMPILING_IN_LIMITED_API)
+#endif
+#ifndef CYTHON_FUSED_DISPATCH_CACHE_SIZE
+  #define CYTHON_FUSED_DISPATCH_CACHE_SIZE 64
+#endif
+
 typedef struct {
     __pyx_CyFunctionObject func;
     PyObject *__signatures__;
     PyObject *self;
+    // {argument key: (defaults tuple, specialized function)}, shared with the bound methods
+    PyObject *dispatch_cache;
 } __pyx_FusedFunctionObject;
 
 static PyObject *__pyx_FusedFunction_New(PyMethodDef *ml, int flags,
@@ -1189,6 +1250,7 @@ __pyx_FusedFunction_New(PyMethodDef *ml, int flags,
         __pyx_FusedFunctionObject *fusedfunc = (__pyx_FusedFunctionObject *) op;
         fusedfunc->__signatures__ = NULL;
         fusedfunc->self = NULL;
+        fusedfunc->dispatch_cache = NULL;
         PyObject_GC_Track(op);
     }
     return op;
@@ -1200,6 +1262,7 @@ __pyx_FusedFunction_dealloc(__pyx_FusedFunctionObject *self)
     PyObject_GC_UnTrack(self);
     Py_CLEAR(self->self);
     Py_CLEAR(self->__signatures__);
+    Py_CLEAR(self->dispatch_cache);
     __Pyx__CyFunction_dealloc((__pyx_CyFunctionObject *) self);
 }
 
@@ -1210,6 +1273,7 @@ __pyx_FusedFunction_traverse(__pyx_FusedFunctionObject *self,
 {
     Py_VISIT(self->self);
     Py_VISIT(self->__signatures__);
+    Py_VISIT(self->dispatch_cache);
     return __Pyx_CyFunction_traverse((__pyx_CyFunctionObject *) self, visit, arg);
 }
 
@@ -1218,6 +1282,7 @@ __pyx_FusedFunction_clear(__pyx_FusedFunctionObject *self)
 {
     Py_CLEAR(self->self);
     Py_CLEAR(self->__signatures__);
+    Py_CLEAR(self->dispatch_cache);
     return __Pyx_CyFunction_clear((__pyx_CyFunctionObject *) self);
 }
 
@@ -1284,6 +1349,17 @@ __pyx_FusedFunction_descr_get(PyObject *self, PyObject *obj, PyObject *type)
     Py_XINCREF(func->__signatures__);
     meth->__signatures__ = func->__signatures__;
 
+#if CYTHON_FUSED_DISPATCH_CACHE
+    // Bound methods are created on each attribute lookup, so they must share the cache.
+    if (func->__signatures__ && !func->dispatch_cache) {
+        func->dispatch_cache = PyDict_New();
+        if (unlikely(!func->dispatch_cache))
+            PyErr_Clear();
+    }
+    Py_XINCREF(func->dispatch_cache);
+    meth->dispatch_cache = func->dispatch_cache;
+#endif
+
     Py_XINCREF(func->func.defaults_tuple);
     meth->func.defaults_tuple = func->func.defaults_tuple;
 
@@ -1390,6 +1466,101 @@ __pyx_FusedFunction_callfunction(PyObject *func, PyObject *args, PyObject *kw)
     }
 }
 
+#if CYTHON_FUSED_DISPATCH_CACHE
+static PyObject *
+__pyx_FusedFunction_BufferKey(PyObject *arg)
+{
+    // Everything that the signature matching looks at for buffer arguments:
+    // the item type and size, the number of dimensions and the memory layout.
+    Py_buffer view;
+    PyObject *key;
+    int layout;
+
+    if (unlikely(PyObject_GetBuffer(arg, &view, PyBUF_RECORDS_RO) == -1))
+        return NULL;
+    layout = (view.readonly ? 1 : 0) |
+             (PyBuffer_IsContiguous(&view, 'C') ? 2 : 0) |
+             (PyBuffer_IsContiguous(&view, 'F') ? 4 : 0);
+    key = Py_BuildValue("(Osini)", (PyObject *) Py_TYPE(arg), view.format ? view.format : "B",
+                        view.ndim, view.itemsize, layout);
+    PyBuffer_Release(&view);
+    return key;
+}
+
+static PyObject *
+__pyx_FusedFunction_DispatchKey(PyObject *args, PyObject *kw)
+{
+    // Returns NULL without an exception set if the call cannot use the cache.
+    Py_ssize_t i, argc;
+    PyObject *key;
+
+    if (kw && PyDict_Size(kw))
+        return NULL;
+    argc = PyTuple_GET_SIZE(args);
+    key = PyTuple_New(argc);
+    if (unlikely(!key))
+        goto bad;
+    for (i = 0; i < argc; i++) {
+        PyObject *arg = PyTuple_GET_ITEM(args, i);
+        PyObject *item;
+        if (PyObject_CheckBuffer(arg)) {
+            item = __pyx_FusedFunction_BufferKey(arg);
+            if (unlikely(!item))
+                goto bad;
+        } else {
+            item = (PyObject *) Py_TYPE(arg);
+            Py_INCREF(item);
+        }
+        PyTuple_SET_ITEM(key, i, item);
+    }
+    return key;
+bad:
+    Py_XDECREF(key);
+    PyErr_Clear();
+    return NULL;
+}
+
+static PyObject *
+__pyx_FusedFunction_DispatchCacheGet(__pyx_FusedFunctionObject *func, PyObject *key)
+{
+    PyObject *entry, *defaults;
+    if (!func->dispatch_cache)
+        return NULL;
+    entry = PyDict_GetItem(func->dispatch_cache, key);
+    if (!entry)
+        return NULL;
+    // Arguments that were not passed are matched from the defaults, which can be replaced.
+    defaults = func->func.defaults_tuple ? func->func.defaults_tuple : Py_None;
+    if (PyTuple_GET_ITEM(entry, 0) != defaults)
+        return NULL;
+    return __Pyx_NewRef(PyTuple_GET_ITEM(entry, 1));
+}
+
+static void
+__pyx_FusedFunction_DispatchCacheSet(__pyx_FusedFunctionObject *func, PyObject *key, PyObject *result)
+{
+    PyObject *entry;
+    if (!func->dispatch_cache) {
+        func->dispatch_cache = PyDict_New();
+        if (unlikely(!func->dispatch_cache))
+            goto bad;
+    } else if (PyDict_Size(func->dispatch_cache) >= CYTHON_FUSED_DISPATCH_CACHE_SIZE) {
+        PyDict_Clear(func->dispatch_cache);
+    }
+    entry = PyTuple_Pack(2, func->func.defaults_tuple ? func->func.defaults_tuple : Py_None, result);
+    if (unlikely(!entry))
+        goto bad;
+    if (unlikely(PyDict_SetItem(func->dispatch_cache, key, entry) < 0)) {
+        Py_DECREF(entry);
+        goto bad;
+    }
+    Py_DECREF(entry);
+    return;
+bad:
+    PyErr_Clear();
+}
+#endif
+
 // Note: the 'self' from method binding is passed in in the args tuple,
 //       whereas PyCFunctionObject's m_self is passed in as the first
 //       argument to the C function. For extension methods we need
@@ -1435,26 +1606,46 @@ __pyx_FusedFunction_call(PyObject *func, PyObject *args, PyObject *kw)
 
     if (binding_func->__signatures__) {
         PyObject *tup;
+#if CYTHON_FUSED_DISPATCH_CACHE
+        PyObject *key = __pyx_FusedFunction_DispatchKey(args, kw);
+        if (key) {
+            new_func = (__pyx_FusedFunctionObject *) __pyx_FusedFunction_DispatchCacheGet(binding_func, key);
+            if (new_func) {
+                Py_DECREF(key);
+                goto call;
+            }
+        }
+#endif
         if (is_staticmethod && binding_func->func.flags & __Pyx_CYFUNCTION_CCLASS) {
             // FIXME: this seems wrong, but we must currently pass the signatures dict as 'self' argument
             tup = PyTuple_Pack(3, args,
                                kw == NULL ? Py_None : kw,
                                binding_func->func.defaults_tuple);
-            if (unlikely(!tup)) goto bad;
-            new_func = (__pyx_FusedFunctionObject *) __Pyx_CyFunction_CallMethod(
-                func, binding_func->__signatures__, tup, NULL);
+            if (likely(tup))
+                new_func = (__pyx_FusedFunctionObject *) __Pyx_CyFunction_CallMethod(
+                    func, binding_func->__signatures__, tup, NULL);
         } else {
             tup = PyTuple_Pack(4, binding_func->__signatures__, args,
                                kw == NULL ? Py_None : kw,
                                binding_func->func.defaults_tuple);
-            if (unlikely(!tup)) goto bad;
-            new_func = (__pyx_FusedFunctionObject *) __pyx_FusedFunction_callfunction(func, tup, NULL);
+            if (likely(tup))
+                new_func = (__pyx_FusedFunctionObject *) __pyx_FusedFunction_callfunction(func, tup, NULL);
         }
-        Py_DECREF(tup);
+        Py_XDECREF(tup);
 
+#if CYTHON_FUSED_DISPATCH_CACHE
+        if (key) {
+            if (likely(new_func))
+                __pyx_FusedFunction_DispatchCacheSet(binding_func, key, (PyObject *) new_func);
+            Py_DECREF(key);
+        }
+#endif
         if (unlikely(!new_func))
             goto bad;
 
+#if CYTHON_FUSED_DISPATCH_CACHE
+call:
+#endif
         __Pyx_CyFunction_SetClassObj(new_func, __Pyx_CyFunction_GetClassObj(binding_func));
 
         func = (PyObject *) new_func;
@@ -200,11 +200,31 @@ invalid_keyword:
 
 //////////////////// ParseKeywords.proto ////////////////////
 
+// Looks up a keyword name in the argument name list of a function without iterating over it.
+// Returns the index of the name, -1 if it is not an argument name, or -2 if the key must be
+// looked up by comparing it to each name (e.g. for str subclasses).
+typedef Py_ssize_t (*__Pyx_KeywordIndexFunc)(PyObject *key, PyObject **argnames[]);
+
 static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues,
-    PyObject **argnames[],
+    PyObject **argnames[], __Pyx_KeywordIndexFunc find_keyword,
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
     const char* function_name); /*proto*/
 
+//////////////////// KeywordIndex.proto ////////////////////
+
+static CYTHON_INLINE Py_ssize_t __Pyx_MatchKeywordName(PyObject *key, PyObject **argnames[], Py_ssize_t index); /*proto*/
+
+//////////////////// KeywordIndex ////////////////////
+//@requires: StringTools.c::UnicodeEquals
+
+// Used by the generated keyword index functions to compare a keyword (exact str)
+// with the only argument name that it can match.
+static CYTHON_INLINE Py_ssize_t __Pyx_MatchKeywordName(PyObject *key, PyObject **argnames[], Py_ssize_t index) {
+    PyObject *name = *argnames[index];
+    if (likely(key == name)) return index;
+    return (__Pyx_PyUnicode_Equals(key, name, Py_EQ) == 1) ? index : -1;
+}
+
 //////////////////// ParseKeywords ////////////////////
 //@requires: RaiseDoubleKeywords
 
@@ -223,12 +243,16 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues
 //  arguments that were passed and that must therefore not appear
 //  amongst the keywords as well.
 //
+//  If find_keyword is not NULL, it is used to look up the keyword names
+//  in argnames instead of comparing them to each argument name.
+//
 //  This method does not check for required keyword arguments.
 
 static int __Pyx_ParseOptionalKeywords(
     PyObject *kwds,
     PyObject *const *kwvalues,
     PyObject **argnames[],
+    __Pyx_KeywordIndexFunc find_keyword,
     PyObject *kwds2,
     PyObject *values[],
     Py_ssize_t num_pos_args,
@@ -252,6 +276,16 @@ static int __Pyx_ParseOptionalKeywords(
             if (!PyDict_Next(kwds, &pos, &key, &value)) break;
         }
 
+        if (find_keyword) {
+            Py_ssize_t index = find_keyword(key, argnames);
+            if (likely(index >= 0)) {
+                if (unlikely(argnames + index < first_kw_arg)) goto arg_passed_twice;
+                values[index] = value;
+                continue;
+            }
+            if (index == -1) goto unknown_keyword;
+        }
+
         name = first_kw_arg;
         while (*name && (**name != key)) name++;
         if (*name) {
@@ -320,6 +354,7 @@ static int __Pyx_ParseOptionalKeywords(
         } else
             goto invalid_keyword_type;
 
+unknown_keyword:
         if (kwds2) {
             if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
         } else {
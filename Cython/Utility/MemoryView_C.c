@@ -737,6 +737,57 @@ __pyx_slices_overlap({{memviewslice_name}} *slice1,
 }
 
 
+////////// MemviewArrayExpression.proto //////////
+
+static void __Pyx_RaiseMemviewArrayExtentError(int dim, Py_ssize_t extent1, Py_ssize_t extent2); /*proto*/
+static char *__Pyx_MemviewArrayTempBuffer(size_t size); /*proto*/
+static int __Pyx_MemviewArrayOverlap({{memviewslice_name}} *slice1, int ndim1,
+                                     {{memviewslice_name}} *slice2, int ndim2,
+                                     size_t itemsize); /*proto*/
+
+////////// MemviewArrayExpression //////////
+
+/* All functions may be called without the GIL. */
+
+static void __Pyx_RaiseMemviewArrayExtentError(int dim, Py_ssize_t extent1, Py_ssize_t extent2) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE gilstate = PyGILState_Ensure();
+    #endif
+    PyErr_Format(PyExc_ValueError,
+                 "got differing extents in dimension %d (got %" CYTHON_FORMAT_SSIZE_T "d and %" CYTHON_FORMAT_SSIZE_T "d)",
+                 dim, extent1, extent2);
+    #ifdef WITH_THREAD
+    PyGILState_Release(gilstate);
+    #endif
+}
+
+static char *__Pyx_MemviewArrayTempBuffer(size_t size) {
+    char *buffer = (char *) malloc(size ? size : 1);
+    if (unlikely(!buffer)) {
+        #ifdef WITH_THREAD
+        PyGILState_STATE gilstate = PyGILState_Ensure();
+        #endif
+        PyErr_NoMemory();
+        #ifdef WITH_THREAD
+        PyGILState_Release(gilstate);
+        #endif
+    }
+    return buffer;
+}
+
+/* Like __pyx_slices_overlap(), but for slices with different numbers of dimensions */
+static int __Pyx_MemviewArrayOverlap({{memviewslice_name}} *slice1, int ndim1,
+                                     {{memviewslice_name}} *slice2, int ndim2,
+                                     size_t itemsize) {
+    void *start1, *end1, *start2, *end2;
+
+    __pyx_get_array_memory_extents(slice1, &start1, &end1, ndim1, itemsize);
+    __pyx_get_array_memory_extents(slice2, &start2, &end2, ndim2, itemsize);
+
+    return (start1 < end2) && (start2 < end1);
+}
+
+
 ////////// MemviewSliceCheckContig.proto //////////
 
 #define __pyx_memviewslice_is_contig_{{contig_type}}{{ndim}}(slice) \
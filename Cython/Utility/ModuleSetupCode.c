@@ -1248,6 +1248,60 @@ static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict,
 #endif
 
 
+/////////////// VectorizeLoop.proto ///////////////
+
+// Placed in front of C loops with the 'vectorize' directive.  Tells the C compiler
+// to ignore assumed dependencies between the loop iterations (e.g. through possibly
+// aliased memoryview buffers), which otherwise often prevent the auto-vectorisation.
+// Can be overridden by the user, e.g. with '-DCYTHON_VECTORIZE_LOOP=_Pragma("omp simd")'.
+#ifndef CYTHON_VECTORIZE_LOOP
+#if defined(__INTEL_COMPILER)
+    #define CYTHON_VECTORIZE_LOOP _Pragma("ivdep")
+#elif defined(__clang__) && (__clang_major__ > 3 || (__clang_major__ == 3 && __clang_minor__ >= 8))
+    #define CYTHON_VECTORIZE_LOOP _Pragma("clang loop vectorize(assume_safety)")
+#elif defined(__GNUC__) && !defined(__clang__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 9))
+    #define CYTHON_VECTORIZE_LOOP _Pragma("GCC ivdep")
+#elif defined(_MSC_VER) && _MSC_VER >= 1700
+    #define CYTHON_VECTORIZE_LOOP __pragma(loop(ivdep))
+#else
+    #define CYTHON_VECTORIZE_LOOP
+#endif
+#endif
+
+
+/////////////// FreelistStats.proto ///////////////
+
+// Compile with '-DCYTHON_FREELIST_STATS=1' to count how often the freelists of
+// extension types, closures and coroutines can serve an allocation (hits) and
+// how often they are empty (misses).  The counts are available at runtime from
+// the module function '__pyx_freelist_stats__()'.
+#ifndef CYTHON_FREELIST_STATS
+  #define CYTHON_FREELIST_STATS 0
+#endif
+#if CYTHON_FREELIST_STATS
+  #define __Pyx_FREELIST_STAT(counter)  (++(counter))
+#else
+  #define __Pyx_FREELIST_STAT(counter)  ((void)0)
+#endif
+
+#if CYTHON_FREELIST_STATS
+static int __Pyx_AddFreelistStats(PyObject *stats, const char *name, Py_ssize_t hits, Py_ssize_t misses); /*proto*/
+#endif
+
+/////////////// FreelistStats ///////////////
+
+#if CYTHON_FREELIST_STATS
+static int __Pyx_AddFreelistStats(PyObject *stats, const char *name, Py_ssize_t hits, Py_ssize_t misses) {
+    int result;
+    PyObject *counts = Py_BuildValue("(nn)", hits, misses);
+    if (unlikely(!counts)) return -1;
+    result = PyDict_SetItemString(stats, name, counts);
+    Py_DECREF(counts);
+    return result;
+}
+#endif
+
+
 /////////////// PyModInitFuncType.proto ///////////////
 
 #ifndef CYTHON_NO_PYINIT_EXPORT
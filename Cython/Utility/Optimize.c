@@ -1570,3 +1570,34 @@ static {{c_ret_type}} {{cfunc_name}}(PyObject *op1, PyObject *op2, double floatv
     {{endif}}
 }
 #endif
+
+/////////////// PyGuardedBinop.proto ///////////////
+
+{{py: func_name = '__Pyx_Py%s_%s%sGuarded' % (type, 'InPlace' if inplace else '', op)}}
+static CYTHON_INLINE PyObject* {{func_name}}(PyObject *op1, PyObject *op2); /*proto*/
+
+/////////////// PyGuardedBinop ///////////////
+
+// Fast path for an arithmetic operation whose operands were always of the same
+// exact type when the module was run with 'record_type_feedback'.
+
+{{py: func_name = '__Pyx_Py%s_%s%sGuarded' % (type, 'InPlace' if inplace else '', op)}}
+{{py: c_op = {'Add': '+', 'Subtract': '-', 'Multiply': '*'}[op] }}
+static CYTHON_INLINE PyObject* {{func_name}}(PyObject *op1, PyObject *op2) {
+    {{if type == 'Float'}}
+    if (likely(PyFloat_CheckExact(op1) && PyFloat_CheckExact(op2))) {
+        return PyFloat_FromDouble(__pyx_PyFloat_AsDouble(op1) {{c_op}} __pyx_PyFloat_AsDouble(op2));
+    }
+    {{else}}
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1) && PyLong_CheckExact(op2) &&
+               __Pyx_PyLong_IsCompact(op1) && __Pyx_PyLong_IsCompact(op2))) {
+        // compact values have a single digit, so the result cannot overflow
+        const PY_LONG_LONG a = (PY_LONG_LONG) __Pyx_PyLong_CompactValue(op1);
+        const PY_LONG_LONG b = (PY_LONG_LONG) __Pyx_PyLong_CompactValue(op2);
+        return PyLong_FromLongLong(a {{c_op}} b);
+    }
+    #endif
+    {{endif}}
+    return PyNumber_{{'InPlace' if inplace else ''}}{{op}}(op1, op2);
+}
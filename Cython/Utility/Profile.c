@@ -381,3 +381,101 @@ bad:
 }
 
 #endif /* CYTHON_PROFILE */
+
+
+/////////////// TypeFeedback.proto ///////////////
+
+// Counts the operand types of arithmetic operations on Python objects in modules
+// that are compiled with the 'record_type_feedback' directive.  Each operation
+// has a static site that adds itself to a list on first use.
+
+#define __PYX_TYPE_FEEDBACK_SLOTS 4
+
+typedef struct __Pyx_TypeFeedbackSite {
+    const char *position;
+    struct __Pyx_TypeFeedbackSite *next;
+    int registered;
+    PyTypeObject *types[__PYX_TYPE_FEEDBACK_SLOTS][2];
+    Py_ssize_t counts[__PYX_TYPE_FEEDBACK_SLOTS];
+    Py_ssize_t other;
+} __Pyx_TypeFeedbackSite;
+
+static void __Pyx_RecordTypeFeedback(__Pyx_TypeFeedbackSite *site, PyObject *op1, PyObject *op2); /*proto*/
+static PyObject *__Pyx_TypeFeedback_Report(PyObject *self, PyObject *unused); /*proto*/
+
+/////////////// TypeFeedback ///////////////
+//@requires: ObjectHandling.c::FormatTypeName
+
+static __Pyx_TypeFeedbackSite *__pyx_type_feedback_sites = NULL;
+
+static void __Pyx_RecordTypeFeedback(__Pyx_TypeFeedbackSite *site, PyObject *op1, PyObject *op2) {
+    PyTypeObject *type1 = Py_TYPE(op1), *type2 = Py_TYPE(op2);
+    int i;
+    if (unlikely(!site->registered)) {
+        site->registered = 1;
+        site->next = __pyx_type_feedback_sites;
+        __pyx_type_feedback_sites = site;
+    }
+    for (i = 0; i < __PYX_TYPE_FEEDBACK_SLOTS; i++) {
+        if (site->types[i][0] == type1 && site->types[i][1] == type2) {
+            site->counts[i]++;
+            return;
+        }
+        if (!site->types[i][0]) {
+            // keep the types alive while they are referenced from the site
+            Py_INCREF((PyObject*) type1);
+            Py_INCREF((PyObject*) type2);
+            site->types[i][0] = type1;
+            site->types[i][1] = type2;
+            site->counts[i] = 1;
+            return;
+        }
+    }
+    site->other++;
+}
+
+static int __Pyx_TypeFeedback_AddCount(PyObject *counts, PyObject *key, Py_ssize_t count) {
+    int result;
+    PyObject *value = PyInt_FromSsize_t(count);
+    if (unlikely(!value)) return -1;
+    result = PyDict_SetItem(counts, key, value);
+    Py_DECREF(value);
+    return result;
+}
+
+static PyObject *__Pyx_TypeFeedback_Report(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *unused) {
+    __Pyx_TypeFeedbackSite *site;
+    PyObject *report = PyDict_New();
+    if (unlikely(!report)) return NULL;
+    for (site = __pyx_type_feedback_sites; site; site = site->next) {
+        int i, result;
+        PyObject *counts = PyDict_New();
+        if (unlikely(!counts)) goto bad;
+        result = PyDict_SetItemString(report, site->position, counts);
+        Py_DECREF(counts);
+        if (unlikely(result < 0)) goto bad;
+        for (i = 0; i < __PYX_TYPE_FEEDBACK_SLOTS && site->types[i][0]; i++) {
+            PyObject *key;
+            __Pyx_TypeName type1_name = __Pyx_PyType_GetName(site->types[i][0]);
+            __Pyx_TypeName type2_name = __Pyx_PyType_GetName(site->types[i][1]);
+            key = PyUnicode_FromFormat(__Pyx_FMT_TYPENAME "," __Pyx_FMT_TYPENAME, type1_name, type2_name);
+            __Pyx_DECREF_TypeName(type1_name);
+            __Pyx_DECREF_TypeName(type2_name);
+            if (unlikely(!key)) goto bad;
+            result = __Pyx_TypeFeedback_AddCount(counts, key, site->counts[i]);
+            Py_DECREF(key);
+            if (unlikely(result < 0)) goto bad;
+        }
+        if (site->other) {
+            PyObject *key = PyUnicode_FromString("?");
+            if (unlikely(!key)) goto bad;
+            result = __Pyx_TypeFeedback_AddCount(counts, key, site->other);
+            Py_DECREF(key);
+            if (unlikely(result < 0)) goto bad;
+        }
+    }
+    return report;
+bad:
+    Py_DECREF(report);
+    return NULL;
+}
@@ -515,6 +515,53 @@ def captured_fd(stream=2, encoding=None):
         os.close(orig_stream)
 
 
+@try_finally_contextmanager
+def file_lock(path, blocking=True):
+    """
+    Hold an exclusive lock on the lock file 'path' (created if needed),
+    waiting for other processes that currently hold it.  The lock is
+    advisory and only excludes other users of file_lock().
+
+    With 'blocking=False', the lock is only taken if it is free.  The
+    context manager yields whether this process holds the lock.
+    """
+    lock_file = open(path, 'a+b')
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                    locked = True
+                    break
+                except (IOError, OSError):
+                    if not blocking:
+                        locked = False
+                        break
+                    # LK_LOCK gives up after 10 seconds, keep waiting
+        else:
+            import fcntl
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                locked = True
+            except (IOError, OSError):
+                if blocking:
+                    raise
+                locked = False
+        try:
+            yield locked
+        finally:
+            if locked:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
 def get_encoding_candidates():
     candidates = [sys.getdefaultencoding()]
     for stream in (sys.stdout, sys.stdin, sys.__stdout__, sys.__stdin__):
@@ -172,8 +172,56 @@ def handle_dependencies(pyxfilename):
                     _test_files.append(file)
 
 
+def get_build_cache_key(name, pyxfilename, extension_mod, setup_args, language_level=None):
+    """
+    Return a hash over everything that the build of the module depends on:
+    the content of the sources and of the files that they include or cimport,
+    the .pyxdep and .pyxbld files, the build settings and the Python and
+    Cython versions.
+    """
+    import hashlib
+    from importlib.machinery import EXTENSION_SUFFIXES
+    from Cython import __version__ as cython_version
+    from Cython.Build.Dependencies import create_dependency_tree
+
+    base = os.path.splitext(pyxfilename)[0]
+    files = set()
+    for source in extension_mod.sources + list(extension_mod.depends or ()) + [pyxfilename]:
+        files.add(source)
+        if os.path.splitext(source)[1] in (PYX_EXT, PY_EXT):
+            files.update(create_dependency_tree(quiet=True).all_dependencies(source))
+    for special_file in (base + PYXDEP_EXT, base + PYXBLD_EXT):
+        if os.path.exists(special_file):
+            files.add(special_file)
+    if os.path.exists(base + PYXDEP_EXT):
+        with open(base + PYXDEP_EXT) as fid:
+            for depend in fid:
+                if depend.strip():
+                    files.update(glob.glob(os.path.join(os.path.dirname(pyxfilename), depend.strip())))
+
+    settings = dict(vars(extension_mod))
+    settings.pop('sources', None)
+    settings.pop('depends', None)
+    key = hashlib.sha1()
+    key.update(repr((
+        name, language_level, sorted(settings.items()), sorted(setup_args.items()),
+        sys.version, sys.platform, EXTENSION_SUFFIXES[0], cython_version,
+    )).encode('utf-8'))
+    for path in sorted(files):
+        key.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            key.update(hashlib.sha1(f.read()).digest())
+    return key.hexdigest()
+
+
 def build_module(name, pyxfilename, pyxbuild_dir=None, inplace=False, language_level=None):
     assert os.path.exists(pyxfilename), "Path does not exist: %s" % pyxfilename
+    if pyxargs.build_cache and not inplace:
+        return build_cached_module(pyxargs.build_cache, name, pyxfilename, pyxbuild_dir, language_level)
+    return _build_module(name, pyxfilename, pyxbuild_dir, inplace, language_level)
+
+
+def _build_module(name, pyxfilename, pyxbuild_dir=None, inplace=False, language_level=None):
     handle_dependencies(pyxfilename)
 
     extension_mod, setup_args = get_distutils_extension(name, pyxfilename, language_level)
@@ -217,6 +265,127 @@ def build_module(name, pyxfilename, pyxbuild_dir=None, inplace=False, language_l
     return so_path
 
 
+def build_cached_module(build_cache, name, pyxfilename, pyxbuild_dir=None, language_level=None):
+    """
+    Return the compiled module from the content addressed build cache,
+    building and storing it first if needed.  Interpreters that share the
+    cache build each module only once and never see partially written files.
+    """
+    from Cython.Utils import file_lock, safe_makedirs
+    from importlib.machinery import EXTENSION_SUFFIXES
+
+    extension_mod, setup_args = get_distutils_extension(name, pyxfilename, language_level)
+    sargs = pyxargs.setup_args.copy()
+    sargs.update(setup_args)
+    key = get_build_cache_key(name, pyxfilename, extension_mod, sargs, language_level)
+    so_path = os.path.join(build_cache, key[:2], "%s.%s%s" % (name, key, EXTENSION_SUFFIXES[0]))
+    if os.path.exists(so_path):
+        _debug("Found %s in the build cache", name)
+        return so_path
+
+    safe_makedirs(os.path.dirname(so_path))
+    with file_lock(so_path + '.lock'):
+        # Another interpreter might have built the module while we were waiting.
+        if not os.path.exists(so_path):
+            built_path = _build_module(name, pyxfilename, pyxbuild_dir, language_level=language_level)
+            temp_path = '%s.%d.tmp' % (so_path, os.getpid())
+            import shutil
+            shutil.copy2(built_path, temp_path)
+            os.rename(temp_path, so_path)
+    try:
+        os.remove(so_path + '.lock')
+    except OSError:
+        pass
+    return so_path
+
+
+# parallel builds
+
+_prefetched_dirs = set()
+
+
+def find_package_modules(package_dir, package_name, extension=PYX_EXT):
+    """
+    Return (module name, file name) pairs for the modules with the given
+    extension in the package directory and its subpackages.
+    """
+    modules = []
+    for filename in sorted(os.listdir(package_dir)):
+        path = os.path.join(package_dir, filename)
+        if os.path.isdir(path):
+            if any(os.path.exists(os.path.join(path, "__init__" + ext)) for ext in (PY_EXT, PYX_EXT)):
+                subpackage = package_name + "." + filename if package_name else filename
+                modules.extend(find_package_modules(path, subpackage, extension))
+            continue
+        module_name, ext = os.path.splitext(filename)
+        if ext != extension:
+            continue
+        if module_name == "__init__":
+            if package_name:
+                modules.append((package_name, path))
+        else:
+            modules.append((package_name + "." + module_name if package_name else module_name, path))
+    return modules
+
+
+def _prefetch_module(args):
+    global pyxargs
+    pyxargs, name, pyxfilename, pyxbuild_dir, inplace, language_level = args
+    try:
+        build_module(name, pyxfilename, pyxbuild_dir, inplace, language_level)
+    except Exception as failure_exc:
+        # The import will fail again and report the error.
+        _debug("Failed to prefetch module %s: %r", name, failure_exc)
+
+
+def prefetch_modules(modules, pyxbuild_dir=None, inplace=False, language_level=None, processes=None):
+    """
+    Build the given (module name, file name) pairs in parallel worker processes.
+    This only happens if multiprocessing forks its worker processes.
+    """
+    if len(modules) <= 1:
+        return
+    import multiprocessing
+    from Cython.Build.Dependencies import _init_multiprocessing_helper, _forks_worker_processes
+    parent_process = getattr(multiprocessing, 'parent_process', None)
+    if parent_process is not None and parent_process() is not None:
+        # Never start a pool from inside a worker process.
+        return
+    if not _forks_worker_processes(multiprocessing):
+        # Spawned workers re-import the '__main__' module, which would usually
+        # import the module that triggered the prefetch again.  The modules get
+        # built one after the other on import instead.
+        _debug("Not prefetching modules without the 'fork' start method")
+        return
+    # Load the compiler once here instead of once in every worker.
+    from Cython.Compiler.Main import warm_up
+    warm_up()
+    worker_args = pyxargs.__class__()
+    worker_args.__dict__.update(vars(pyxargs))
+    worker_args.reload_support = False
+    _debug("Prefetching %d modules", len(modules))
+    pool = multiprocessing.Pool(processes, initializer=_init_multiprocessing_helper)
+    try:
+        pool.map(_prefetch_module, [
+            (worker_args, name, pyxfilename, pyxbuild_dir, inplace, language_level)
+            for name, pyxfilename in modules], chunksize=1)
+        pool.close()
+    except KeyboardInterrupt:
+        pool.terminate()
+        raise
+    pool.join()
+
+
+def prefetch_package(package_dir, package_name, pyxbuild_dir=None, inplace=False, language_level=None,
+                     processes=None, extension=PYX_EXT):
+    package_dir = os.path.abspath(package_dir)
+    if package_dir in _prefetched_dirs:
+        return
+    _prefetched_dirs.add(package_dir)
+    prefetch_modules(find_package_modules(package_dir, package_name, extension),
+                     pyxbuild_dir, inplace, language_level, processes)
+
+
 # import hooks
 
 class PyxImportMetaFinder(MetaPathFinder):
@@ -311,6 +480,16 @@ class PyxImportLoader(ExtensionFileLoader):
 
     def create_module(self, spec):
         try:
+            if pyxargs.prefetch is True:
+                # Build the whole package (or the package that this module belongs to) at once.
+                if spec.submodule_search_locations:
+                    package_name = spec.name
+                else:
+                    package_name = spec.name.rpartition('.')[0]
+                if package_name:
+                    prefetch_package(os.path.dirname(spec.origin), package_name,
+                                     self._pyxbuild_dir, self._inplace, self._language_level,
+                                     pyxargs.processes, os.path.splitext(spec.origin)[1])
             so_path = build_module(spec.name, pyxfilename=spec.origin, pyxbuild_dir=self._pyxbuild_dir,
                                    inplace=self._inplace, language_level=self._language_level)
             self.path = so_path
@@ -346,6 +525,9 @@ class PyxArgs(object):
     build_dir=True
     build_in_temp=True
     setup_args={}   #None
+    build_cache=None
+    prefetch=None
+    processes=None
 
 
 def _have_importers():
@@ -364,7 +546,7 @@ def _have_importers():
 def install(pyximport=True, pyimport=False, build_dir=None, build_in_temp=True,
             setup_args=None, reload_support=False,
             load_py_module_on_import_failure=False, inplace=False,
-            language_level=None):
+            language_level=None, build_cache=None, prefetch=None, processes=None):
     """ Main entry point for pyxinstall.
 
     Call this to install the ``.pyx`` import hook in
@@ -413,6 +595,22 @@ def install(pyximport=True, pyimport=False, build_dir=None, build_in_temp=True,
     :param language_level: The source language level to use: 2 or 3.
         The default is to use the language level of the current Python
         runtime for .py files and Py2 for ``.pyx`` files.
+
+    :param build_cache: A directory in which the compiled modules are stored
+        under a hash of their sources, dependencies and build settings.
+        Several interpreters can share it concurrently, and modules with an
+        unchanged hash are loaded without running the build at all.
+        Pass ``True`` to use a ``pyximport`` directory in Cython's cache
+        directory.  Ignored for ``inplace`` builds.
+
+    :param prefetch: Pass ``True`` to compile all modules of a package in
+        parallel worker processes when the first of them gets imported,
+        or a list of ``(package directory, package name)`` pairs to compile
+        these packages right away.  Use ``''`` as package name for top-level
+        modules.
+
+    :param processes: The number of worker processes for ``prefetch``.
+        Defaults to the number of CPUs.
     """
     if setup_args is None:
         setup_args = {}
@@ -426,6 +624,12 @@ def install(pyximport=True, pyimport=False, build_dir=None, build_in_temp=True,
     pyxargs.setup_args = (setup_args or {}).copy()
     pyxargs.reload_support = reload_support
     pyxargs.load_py_module_on_import_failure = load_py_module_on_import_failure
+    if build_cache is True:
+        from Cython.Utils import get_cython_cache_dir
+        build_cache = os.path.join(get_cython_cache_dir(), 'pyximport')
+    pyxargs.build_cache = build_cache
+    pyxargs.prefetch = prefetch
+    pyxargs.processes = processes
 
     has_py_importer, has_pyx_importer = _have_importers()
     py_importer, pyx_importer = None, None
@@ -442,6 +646,10 @@ def install(pyximport=True, pyimport=False, build_dir=None, build_in_temp=True,
                                            language_level=language_level)
         sys.meta_path.append(pyx_importer)
 
+    if prefetch and prefetch is not True:
+        for package_dir, package_name in prefetch:
+            prefetch_package(package_dir, package_name, build_dir, inplace, language_level, processes)
+
     return py_importer, pyx_importer
 
 
@@ -50,7 +50,7 @@ pxd_include_patterns = [
 
 setup_args['package_data'] = {
     'Cython.Plex'     : ['*.pxd'],
-    'Cython.Compiler' : ['*.pxd'],
+    'Cython.Compiler' : ['*.pxd', 'Lexicon.tables'],
     'Cython.Runtime'  : ['*.pyx', '*.pxd'],
     'Cython.Utility'  : ['*.pyx', '*.pxd', '*.c', '*.h', '*.cpp'],
     'Cython'          : [ p[7:] for p in pxd_include_patterns ],
@@ -237,7 +237,18 @@ packages = [
 ]
 
 
+def build_lexicon_tables():
+    # The scanner loads its state machine from this file instead of
+    # building it at runtime (see Cython/Compiler/Lexicon.py).
+    from Cython.Compiler.Lexicon import write_lexicon_tables
+    try:
+        write_lexicon_tables()
+    except EnvironmentError as exc:
+        sys.stderr.write("Unable to write the lexicon tables, the scanner will build them at runtime: %s\n" % exc)
+
+
 def run_build():
+    build_lexicon_tables()
     if compile_cython_itself and (is_cpython or cython_compile_more or cython_compile_minimal):
         compile_cython_modules(cython_profile, cython_coverage, cython_compile_minimal, cython_compile_more, cython_with_refnanny)
 
@@ -0,0 +1,32 @@
+# mode: error
+# tag: fused
+
+cimport cython
+
+ctypedef fused number:
+    int
+    long
+    double
+
+
+@cython.fused_specializations(number=float)
+def not_a_member(number x):
+    return x
+
+@cython.fused_specializations(floating=double)
+def not_a_fused_type(number x):
+    return x
+
+@cython.fused_specializations(number=(int, double))
+cdef number twice(number x):
+    return x * 2
+
+twice[long](1)
+
+
+_ERRORS = u"""
+12:37: 'float' is not a specialization of fused type 'number'
+16:39: 'floating' is not a fused type of this function
+24:5: This specialization of 'twice' is excluded by cython.fused_specializations()
+24:0: Invalid use of fused types, type cannot be specialized
+"""
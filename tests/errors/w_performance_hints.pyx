@@ -0,0 +1,43 @@
+# cython: warn.performance=True
+# mode: compile
+# tag: warnings
+
+def python_range_loop(n):
+    for i in range(n):
+        pass
+
+def variable_step(int n, step):
+    cdef int i
+    for i in range(0, n, step):
+        pass
+
+def mixed_assignments(flag):
+    x = 1
+    if flag:
+        x = []
+    return x
+
+def might_overflow(int a):
+    y = a
+    y = y * 2
+    return y
+
+def boxed_operand(double d, obj):
+    return d * obj
+
+cdef double typed_code(double* values, int n):
+    cdef int i
+    cdef double s = 0
+    for i in range(n):
+        s += values[i] * 2
+    return s
+
+
+_WARNINGS = """
+6:8: performance hint: range() loop uses Python integers because the loop variable is a Python object and the range() arguments are not small integer constants; declare the loop variable as a C integer
+11:25: performance hint: range() loop is not compiled to a C loop because its step is not a constant integer
+15:4: performance hint: 'x' is inferred as a Python object because it is assigned both C values (long) and Python objects (list object)
+21:4: performance hint: 'y' is inferred as a Python object because arithmetic on its C integer values (int) might overflow; declare its type or enable the 'infer_types' directive
+22:10: performance hint: '*' operation on a C long and an untyped Python object is evaluated in Python; declare the type of the other operand to get C arithmetic
+26:13: performance hint: '*' operation on a C double and an untyped Python object is evaluated in Python; declare the type of the other operand to get C arithmetic
+"""
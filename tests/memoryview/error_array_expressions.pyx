@@ -0,0 +1,24 @@
+# mode: error
+# tag: memoryview
+
+from cython cimport view
+
+cdef double[:] one_d
+cdef double[:, :] two_d
+cdef int[:] ints
+cdef object[:] objects
+cdef double[::view.indirect] indirect
+
+one_d[:] = two_d * 2
+objects[:] = objects + 1
+one_d[:] = indirect + one_d
+ints[0] = one_d[:] * 2
+
+
+_ERRORS = u'''
+12:11: Array expression operand has 2 dimensions, expected at most 1
+13:7: Array expressions only support numeric memoryviews, got 'Python object'
+13:13: Array expressions only support numeric memoryviews, got 'Python object'
+14:11: All dimensions must be direct
+15:4: Cannot assign an array expression to 'int'
+'''
@@ -0,0 +1,206 @@
+# mode: run
+# tag: memoryview
+
+# Element-wise arithmetic expressions over memoryview slices.
+
+from array import array
+
+cimport cython
+from cython.view cimport array as cvarray
+
+
+def darray(values):
+    return array('d', values)
+
+
+def matrix(rows, cols, start=0):
+    m = cvarray((rows, cols), itemsize=sizeof(double), format='d')
+    cdef double[:, :] view = m
+    for i in range(rows):
+        for j in range(cols):
+            view[i, j] = start + i * cols + j
+    return m
+
+
+def rows(double[:, :] m):
+    return [[m[i, j] for j in range(m.shape[1])] for i in range(m.shape[0])]
+
+
+def add_scaled(double[:] out, double[:] a, double[:] b):
+    """
+    >>> out = darray([0] * 4)
+    >>> add_scaled(out, darray([1, 2, 3, 4]), darray([10, 20, 30, 40]))
+    >>> list(out)
+    [12.0, 24.0, 36.0, 48.0]
+    """
+    out[:] = a[:] * 2 + b
+
+
+def scalar_operands(double[:] out, double[:] a, double factor, int offset):
+    """
+    >>> out = darray([0] * 3)
+    >>> scalar_operands(out, darray([1, 2, 3]), 0.5, 1)
+    >>> list(out)
+    [-1.5, -2.0, -2.5]
+    """
+    out[...] = -(a * factor + offset)
+
+
+def mixed_types(double[:] out, int[:] a, float[:] b):
+    """
+    >>> out = darray([0] * 3)
+    >>> mixed_types(out, array('i', [1, 2, 3]), array('f', [0.5, 0.25, 0.125]))
+    >>> list(out)
+    [1.5, 2.25, 3.125]
+    """
+    out[:] = a[:] + b[:]
+
+
+def int_result(int[:] out, int[:] a):
+    """
+    >>> out = array('i', [0] * 4)
+    >>> int_result(out, array('i', [-7, -1, 3, 8]))
+    >>> list(out)
+    [-1, 1, 1, 4]
+    """
+    out[:] = a // 3 + a % 3
+
+
+def strided(double[:] out, double[:] a):
+    """
+    >>> out = darray([0] * 6)
+    >>> strided(out, darray(range(6)))
+    >>> list(out)
+    [1.0, 0.0, 5.0, 0.0, 9.0, 0.0]
+    """
+    out[::2] = a[::2] + a[1::2]
+
+
+def broadcast_2d(double[:, :] out, double[:, :] a, double[:, :] row, double[:] vector):
+    """
+    >>> out = matrix(2, 3)
+    >>> broadcast_2d(out, matrix(2, 3), matrix(1, 3, 10), matrix(3, 1)[:, 0])
+    >>> rows(out)
+    [[10.0, 13.0, 16.0], [13.0, 16.0, 19.0]]
+    """
+    out[:, :] = a + row[:, :] + vector
+
+
+def transposed(double[:, :] out, double[:, :] a):
+    """
+    >>> out = matrix(2, 2)
+    >>> transposed(out, matrix(2, 2, 1))
+    >>> rows(out)
+    [[2.0, 5.0], [5.0, 8.0]]
+    """
+    out[:, :] = a + a.T
+
+
+def shape_mismatch(double[:] out, double[:] a):
+    """
+    >>> shape_mismatch(darray([0] * 3), darray([1, 2]))
+    Traceback (most recent call last):
+    ValueError: got differing extents in dimension 0 (got 3 and 2)
+    >>> out = darray([0] * 3)
+    >>> shape_mismatch(out, darray([5]))
+    >>> list(out)
+    [10.0, 10.0, 10.0]
+    """
+    out[:] = a * 2
+
+
+def in_place(double[:] a):
+    """
+    >>> a = darray([1, 2, 3])
+    >>> in_place(a)
+    >>> list(a)
+    [3.0, 5.0, 7.0]
+    """
+    a[:] = a * 2 + 1
+
+
+def overlapping_2d(double[:, :] a):
+    """
+    >>> a = matrix(2, 2)
+    >>> overlapping_2d(a)
+    >>> rows(a)
+    [[0.0, 4.0], [2.0, 6.0]]
+    """
+    a[:, :] = a.T * 2
+
+
+def overlapping(double[:] a):
+    """
+    >>> a = darray([1, 2, 3, 4])
+    >>> overlapping(a)
+    >>> list(a)
+    [1.0, 11.0, 12.0, 13.0]
+    """
+    a[1:] = a[:-1] + 10
+
+
+def overlapping_reversed(double[:] a):
+    """
+    >>> a = darray([1, 2, 3, 4])
+    >>> overlapping_reversed(a)
+    >>> list(a)
+    [5.0, 5.0, 5.0, 5.0]
+    """
+    a[:] = a + a[::-1]
+
+
+def uses_element_of_target(double[:] a):
+    """
+    >>> a = darray([2, 4, 6])
+    >>> uses_element_of_target(a)
+    >>> list(a)
+    [1.0, 2.0, 3.0]
+    """
+    a[:] = a / a[0]
+
+
+def zero_division(double[:] out, double[:] a, double[:] b):
+    """
+    >>> out = darray([0] * 2)
+    >>> zero_division(out, darray([1, 2]), darray([1, 0]))
+    Traceback (most recent call last):
+    ZeroDivisionError: float division
+    >>> zero_division(out, out, darray([1, 0]))
+    Traceback (most recent call last):
+    ZeroDivisionError: float division
+    """
+    out[:] = a[::-1] / b
+
+
+@cython.cdivision(True)
+def without_gil(double[::1] out, double[::1] a, double[::1] b):
+    """
+    >>> out = darray([0] * 3)
+    >>> without_gil(out, darray([1, 2, 3]), darray([3, 2, 1]))
+    >>> list(out)
+    [0.25, 2.0, 6.75]
+    >>> without_gil(out, darray([1, 2]), darray([3, 2, 1]))
+    Traceback (most recent call last):
+    ValueError: got differing extents in dimension 0 (got 3 and 2)
+    """
+    with nogil:
+        out[:] = a * a * a / (a + b)
+
+
+def python_operand(double[:] out, double[:] a, factor):
+    """
+    >>> python_operand(darray([0] * 2), darray([1, 2]), 2)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    TypeError: ...
+    """
+    out[:] = a * factor
+
+
+def scalar_copy(double[:] out, double[:] a):
+    """
+    >>> out = darray([0] * 2)
+    >>> scalar_copy(out, darray([3, 4]))
+    >>> list(out)
+    [6.0, 6.0]
+    """
+    out[:] = a[0] * 2
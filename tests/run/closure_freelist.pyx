@@ -0,0 +1,97 @@
+# mode: run
+# tag: closures, generators
+# distutils: define_macros=CYTHON_FREELIST_STATS=1
+
+cimport cython
+
+
+def stats_for(func_name):
+    stats = globals()['__pyx_freelist_stats__']()
+    for name, counts in stats.items():
+        if name.endswith('_' + func_name):
+            return counts
+    return None
+
+
+def default_closure(x):
+    def inner():
+        return x
+    return inner()
+
+
+@cython.closure_freelist(2)
+def sized_closure(x):
+    return lambda: x
+
+
+@cython.closure_freelist(0)
+def no_freelist(x):
+    return (lambda: x)()
+
+
+def gen(n):
+    for i in range(n):
+        yield i
+
+
+def test_closures():
+    """
+    >>> test_closures()
+    """
+    for i in range(10):
+        assert default_closure(i) == i
+        assert sized_closure(i)() == i
+        assert no_freelist(i) == i
+
+    hits, misses = stats_for('default_closure')
+    assert hits >= 9, (hits, misses)
+    hits, misses = stats_for('sized_closure')
+    assert hits >= 9, (hits, misses)
+
+    # only two of three released closures fit into the freelist
+    closures = [sized_closure(i) for i in range(3)]
+    del closures
+    hits_before, misses_before = stats_for('sized_closure')
+    closures = [sized_closure(i) for i in range(3)]
+    hits, misses = stats_for('sized_closure')
+    assert (hits - hits_before, misses - misses_before) == (2, 1), (hits, misses)
+    assert stats_for('no_freelist') is None
+
+
+def test_generators():
+    """
+    >>> test_generators()
+    [0, 1, 2]
+    """
+    for _ in range(10):
+        result = list(gen(3))
+    hits, misses = stats_for('gen')
+    assert hits >= 9, (hits, misses)
+
+    # Generator objects are only reused in CPython 3.9+.  The generator type is shared
+    # between modules, so its deallocator may fill the freelist of another module.
+    stats = globals()['__pyx_freelist_stats__']()
+    if 'coroutine' in stats:
+        hits, misses = stats['coroutine']
+        assert hits + misses >= 10, (hits, misses)
+    return result
+
+
+def test_unfinished_generators():
+    """
+    >>> test_unfinished_generators()
+    ['finally', 'finally', 'finally']
+    """
+    log = []
+    def paused():
+        try:
+            yield 1
+            yield 2
+        finally:
+            log.append('finally')
+
+    for _ in range(3):
+        g = paused()
+        next(g)
+        del g
+    return log
@@ -0,0 +1,103 @@
+# mode: run
+# tag: closures, genexpr
+# cython: test_assert_c_code_has = __pyx_cur_scope_struct
+
+# Closure scopes that are only used by inlined generator expressions
+# live on the C stack of their function.
+
+import gc
+
+
+def any_greater(seq, limit):
+    """
+    >>> any_greater([1, 2, 3], 2)
+    True
+    >>> any_greater([1, 2, 3], 3)
+    False
+    """
+    return any(x > limit for x in seq)
+
+
+def all_in_range(seq, int low, high):
+    """
+    >>> all_in_range([1, 2, 3], 0, 5)
+    True
+    >>> all_in_range([1, 2, 3], 2, 5)
+    False
+    """
+    return all(low <= x < high for x in seq)
+
+
+def sorted_by_offset(seq, offset):
+    """
+    >>> sorted_by_offset([3, 1, 2], 1)
+    [2, 3, 4]
+    """
+    return sorted(x + offset for x in seq)
+
+
+def collect_in_genexpr(seq, limit):
+    """
+    >>> collect_in_genexpr([1, 2, 3], 2)
+    True
+    """
+    return any(gc.collect() >= 0 and x > limit for x in seq)
+
+
+def raise_in_genexpr(seq, divisor):
+    """
+    >>> raise_in_genexpr([1, 2], 1)
+    False
+    >>> raise_in_genexpr([1, 2], 0)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ZeroDivisionError: ...
+    """
+    return any(x // divisor > 5 for x in seq)
+
+
+def unbound_variable(seq):
+    """
+    >>> unbound_variable([1])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    NameError: ...limit...
+    """
+    limit = 1
+    del limit
+    return any(x > limit for x in seq)
+
+
+def assign_in_genexpr(seq, limit):
+    """
+    >>> assign_in_genexpr([1, 5, 2], 3)
+    (True, 5)
+    """
+    last = None
+    found = any((last := x) > limit for x in seq)
+    return found, last
+
+
+def escaping_genexpr(seq, limit):
+    """
+    >>> list(escaping_genexpr([1, 2, 3], 1))
+    [2, 3]
+    """
+    return (x for x in seq if x > limit)
+
+
+def escaping_lambda(seq, limit):
+    """
+    >>> escaping_lambda([1, 2, 3], 1)(5)
+    [True, True, True]
+    """
+    found = any(x > limit for x in seq)
+    return lambda value: [value > limit, found, True]
+
+
+def nested_scopes(seq, limit):
+    """
+    >>> nested_scopes([1, 2, 3], 1)
+    True
+    """
+    def inner():
+        return any(x > limit for x in seq)
+    return inner()
@@ -0,0 +1,80 @@
+# mode: run
+# tag: fused
+
+# The specializations selected for the argument types of a call are cached.
+# Calls that alternate between argument types must still select the right one.
+
+cimport cython
+
+ctypedef fused number:
+    int
+    double
+
+ctypedef fused contiguous_or_float:
+    double[::1]
+    float[:]
+
+
+def describe(number x, y=None):
+    """
+    >>> [describe(x) for x in (1, 1.5, 2, 2.5)]
+    ['int', 'double', 'int', 'double']
+    >>> describe(1, y=2), describe(x=1.5)
+    ('int', 'double')
+    >>> describe('abc')
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    >>> describe('abc')
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    """
+    return cython.typeof(x)
+
+
+def with_default(number x=1):
+    """
+    >>> with_default(), with_default(1.5), with_default()
+    ('int', 'double', 'int')
+    >>> with_default.__defaults__ = (1.5,)
+    >>> with_default(), with_default(1)
+    ('double', 'int')
+    """
+    return cython.typeof(x)
+
+
+def buffers(contiguous_or_float values):
+    """
+    >>> from array import array
+    >>> d = array('d', [1.0, 2.0, 3.0])
+    >>> f = array('f', [1.0, 2.0, 3.0])
+    >>> [buffers(x) for x in (d, f, d, f)]
+    ['double[::1]', 'float[:]', 'double[::1]', 'float[:]']
+    >>> buffers(memoryview(f)[::2])
+    'float[:]'
+    >>> buffers(memoryview(d)[::2])
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    >>> buffers(memoryview(d)[::2])
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    >>> buffers(d)
+    'double[::1]'
+    """
+    return cython.typeof(values)
+
+
+cdef class C:
+    """
+    >>> c = C()
+    >>> [c.method(x) for x in (1, 1.5, 2)]
+    [(1, 'int'), (1, 'double'), (1, 'int')]
+    >>> C.method(C(), 1.5)
+    (1, 'double')
+    """
+    cdef int value
+
+    def __init__(self):
+        self.value = 1
+
+    def method(self, number x):
+        return self.value, cython.typeof(x)
@@ -0,0 +1,72 @@
+# mode: run
+# tag: fused
+# cython: test_assert_c_code_has = __pyx_fuse_1_1__pyx_f_21fused_specializations_scale
+# cython: test_fail_if_c_code_has = __pyx_fuse_0_0__pyx_f_21fused_specializations_scale
+# cython: test_fail_if_c_code_has = __pyx_fuse_1__pyx_f_21fused_specializations_twice
+
+cimport cython
+
+ctypedef fused number:
+    int
+    long
+    double
+
+ctypedef fused factor_t:
+    float
+    double
+
+
+@cython.fused_specializations(number=(long, double), factor_t=double)
+cpdef scale(number x, factor_t factor):
+    """
+    >>> scale(2, 1.5)
+    3.0
+    >>> sorted(scale.__signatures__)
+    ['double|double', 'long|double']
+    """
+    return x * factor
+
+
+@cython.fused_specializations(number=int)
+def describe(number x):
+    """
+    >>> describe(3)
+    'int'
+    >>> describe(1.5)
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    >>> list(describe.__signatures__)
+    ['int']
+    """
+    return cython.typeof(x)
+
+
+@cython.fused_specializations(floating=double)
+def memview_sum(cython.floating[:] values):
+    """
+    >>> from array import array
+    >>> memview_sum(array('d', [1.0, 2.5]))
+    3.5
+    >>> memview_sum(array('f', [1.0, 2.5]))
+    Traceback (most recent call last):
+    TypeError: No matching signature found
+    >>> list(memview_sum.__signatures__)
+    ['double']
+    """
+    cdef cython.floating result = 0
+    for value in values:
+        result += value
+    return result
+
+
+@cython.fused_specializations(number=(int, double))
+cdef number twice(number x):
+    return x * 2
+
+
+def call_cdef():
+    """
+    >>> call_cdef()
+    (4, 5.0)
+    """
+    return twice(<int>2), twice(2.5)
@@ -0,0 +1,144 @@
+# mode: run
+# tag: genexpr, builtins
+
+cimport cython
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+@cython.test_fail_if_path_exists('//SimpleCallNode')
+def tuple_of_squares(seq):
+    """
+    >>> tuple_of_squares([1, 2, 3])
+    (1, 4, 9)
+    >>> tuple_of_squares([])
+    ()
+    """
+    return tuple(x * x for x in seq)
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def frozenset_of_remainders(seq):
+    """
+    >>> sorted(frozenset_of_remainders([1, 2, 3, 4]))
+    [0, 1]
+    >>> type(frozenset_of_remainders([])) is frozenset
+    True
+    """
+    return frozenset(x % 2 for x in seq)
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def max_length(seq):
+    """
+    >>> max_length(['a', 'abc', 'ab'])
+    3
+    >>> max_length([])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ValueError: ...
+    """
+    return max(len(s) for s in seq)
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def min_negated(seq):
+    """
+    >>> min_negated([3, 1, 2])
+    -3
+    >>> min_negated([None])
+    Traceback (most recent call last):
+    TypeError: bad operand type for unary -: 'NoneType'
+    """
+    return min(-x for x in seq)
+
+
+def min_typed(int n):
+    """
+    >>> min_typed(5)
+    -2
+    >>> min_typed(0)  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ValueError: ...
+    """
+    return min(i * (i - 4) // 2 for i in range(n))
+
+
+def max_first_of_equal(seq):
+    """
+    Like the builtin, keep the first of several maximal items.
+
+    >>> a, b = [1], [1]
+    >>> max_first_of_equal([a, b]) is a
+    True
+    >>> max(x for x in [a, b]) is a
+    True
+    """
+    return max(x for x in seq)
+
+
+def max_unorderable(seq):
+    """
+    >>> max_unorderable([1, 'a'])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    TypeError: ...
+    >>> max_unorderable([None])
+    """
+    return max(x for x in seq)
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def join_bytes(seq):
+    """
+    >>> join_bytes([b'a', b'b']) == b'a-b'
+    True
+    """
+    return b'-'.join(s for s in seq)
+
+
+@cython.exhausts_iterables
+cdef list reversed_items(items):
+    result = []
+    for item in items:
+        result.insert(0, item)
+    return result
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def call_consumer(seq):
+    """
+    >>> call_consumer([1, 2, 3])
+    [6, 4, 2]
+    """
+    return reversed_items(x * 2 for x in seq)
+
+
+@cython.exhausts_iterables
+cdef object first_item(items):
+    for item in items:
+        return item
+
+
+@cython.test_assert_path_exists('//InlinedGeneratorExpressionNode')
+def call_consumer_that_stops_early(seq, seen):
+    """
+    The generator expression is evaluated completely before the call.
+
+    >>> seen = []
+    >>> call_consumer_that_stops_early([1, 2, 3], seen)
+    2
+    >>> seen
+    [1, 2, 3]
+    """
+    return first_item(seen.append(x) or x * 2 for x in seq)
+
+
+cdef list plain_reversed_items(items):
+    return reversed_items(items)
+
+
+@cython.test_fail_if_path_exists('//InlinedGeneratorExpressionNode')
+def call_plain_function(seq):
+    """
+    >>> call_plain_function([1, 2, 3])
+    [6, 4, 2]
+    """
+    return plain_reversed_items(x * 2 for x in seq)
@@ -0,0 +1,72 @@
+# mode: run
+# tag: kwargs
+
+# Functions with many keyword arguments look up the keyword names
+# with a generated switch instead of comparing them to each name.
+
+
+def many(a, b, c=3, d=4, *, e=5, ff=6, gamma=7, delta=8, epsilon=9):
+    """
+    >>> many(1, 2)
+    (1, 2, 3, 4, 5, 6, 7, 8, 9)
+    >>> many(1, 2, epsilon=0, ff=-1, c=-2)
+    (1, 2, -2, 4, 5, -1, 7, 8, 0)
+    >>> many(b=1, a=2, d=3, delta=4, gamma=5, e=6)
+    (2, 1, 3, 3, 6, 6, 5, 4, 9)
+
+    Keys that are not interned, or str subclasses:
+
+    >>> many(1, 2, **{''.join(['gam', 'ma']): 0})
+    (1, 2, 3, 4, 5, 6, 0, 8, 9)
+    >>> class S(str): pass
+    >>> many(1, 2, **{S('delta'): 0})
+    (1, 2, 3, 4, 5, 6, 7, 0, 9)
+
+    >>> many(1, 2, 3, c=4)
+    Traceback (most recent call last):
+    TypeError: many() got multiple values for keyword argument 'c'
+    >>> many(1, 2, gammA=0)
+    Traceback (most recent call last):
+    TypeError: many() got an unexpected keyword argument 'gammA'
+    >>> many(1, 2, dalta=0)
+    Traceback (most recent call last):
+    TypeError: many() got an unexpected keyword argument 'dalta'
+    >>> many(1, 2, **{S('x'): 0})
+    Traceback (most recent call last):
+    TypeError: many() got an unexpected keyword argument 'x'
+    """
+    return a, b, c, d, e, ff, gamma, delta, epsilon
+
+
+def with_kwargs(a, b=2, c=3, d=4, **kwargs):
+    """
+    >>> with_kwargs(1, d=0, x=1, dd=2, ä=3)
+    (1, 2, 3, 0, [('dd', 2), ('x', 1), ('ä', 3)])
+    >>> with_kwargs(a=1, b=0)
+    (1, 0, 3, 4, [])
+    """
+    return a, b, c, d, sorted(kwargs.items())
+
+
+def non_ascii(α, β=2, γ=3, δ=4):
+    """
+    >>> non_ascii(1, δ=0, β=5)
+    (1, 5, 3, 0)
+    >>> non_ascii(1, ε=0)
+    Traceback (most recent call last):
+    TypeError: non_ascii() got an unexpected keyword argument 'ε'
+    """
+    return α, β, γ, δ
+
+
+def posonly(a, b, /, c, d, e=5, f=6):
+    """
+    >>> posonly(1, 2, 3, 4, f=0)
+    (1, 2, 3, 4, 5, 0)
+    >>> posonly(1, 2, d=1, c=2, e=3)
+    (1, 2, 2, 1, 3, 6)
+    >>> posonly(1, 2, 3, 4, a=0)
+    Traceback (most recent call last):
+    TypeError: posonly() got an unexpected keyword argument 'a'
+    """
+    return a, b, c, d, e, f
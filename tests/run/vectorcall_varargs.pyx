@@ -0,0 +1,68 @@
+# mode: run
+# tag: cyfunction, vectorcall
+
+# Functions that only take *args keep the METH_VARARGS signature
+# but are still called through vectorcall.
+
+
+def star_args(*args):
+    """
+    >>> star_args()
+    ()
+    >>> star_args(1, 2)
+    (1, 2)
+    >>> star_args(*range(3))
+    (0, 1, 2)
+    >>> star_args(a=1)
+    Traceback (most recent call last):
+    TypeError: star_args() got an unexpected keyword argument 'a'
+    """
+    return args
+
+
+def star_args_kwonly(*args, key=None):
+    """
+    >>> star_args_kwonly(1, key=2)
+    ((1,), 2)
+    >>> star_args_kwonly(**{'key': 3})
+    ((), 3)
+    >>> star_args_kwonly(key=1, other=2)
+    Traceback (most recent call last):
+    TypeError: star_args_kwonly() got an unexpected keyword argument 'other'
+    """
+    return args, key
+
+
+def star_args_kwargs(*args, **kwargs):
+    """
+    >>> star_args_kwargs(1, a=2)
+    ((1,), [('a', 2)])
+    >>> star_args_kwargs(*[1, 2], **{'b': 3, 'a': 4})
+    ((1, 2), [('a', 4), ('b', 3)])
+    """
+    return args, sorted(kwargs.items())
+
+
+cdef class C:
+    """
+    >>> c = C()
+    >>> c.method(1, 2)
+    (True, (1, 2), [])
+    >>> c.method(x=1)
+    (True, (), [('x', 1)])
+    >>> C.method(c, 3)
+    (True, (3,), [])
+    >>> C.method()  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    TypeError: ...needs an argument
+    >>> C.static(1, 2)
+    (1, 2)
+    >>> c.static(3)
+    (3,)
+    """
+    def method(self, *args, **kwargs):
+        return isinstance(self, C), args, sorted(kwargs.items())
+
+    @staticmethod
+    def static(*args):
+        return args
@@ -0,0 +1,65 @@
+# mode: run
+# tag: memoryview
+# cython: test_assert_c_code_has = CYTHON_VECTORIZE_LOOP\s+for \(
+
+cimport cython
+
+
+@cython.vectorize(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def multiply_add(double[::1] out, double[::1] a, double[::1] b, double c):
+    """
+    >>> from array import array
+    >>> a = array('d', [1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> b = array('d', [2.0, 2.0, 2.0, 2.0, 0.5])
+    >>> out = array('d', [0.0] * 5)
+    >>> multiply_add(out, a, b, 1.0)
+    >>> list(out)
+    [3.0, 5.0, 7.0, 9.0, 3.5]
+    """
+    cdef Py_ssize_t i
+    for i in range(out.shape[0]):
+        out[i] = a[i] * b[i] + c
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def scale(double[::1] values, double factor):
+    """
+    >>> from array import array
+    >>> values = array('d', [1.0, 2.0, 3.0])
+    >>> scale(values, 3.0)
+    >>> list(values)
+    [3.0, 6.0, 9.0]
+    """
+    cdef Py_ssize_t i
+    with cython.vectorize(True):
+        for i in range(values.shape[0]):
+            values[i] *= factor
+
+
+def int_sum(int n):
+    """
+    >>> int_sum(10)
+    (45, 90)
+    """
+    cdef int i, total = 0, total2 = 0
+    with cython.vectorize(True):
+        for i in range(n):
+            total += i
+        for i from 0 <= i < n:
+            total2 += 2 * i
+    return total, total2
+
+
+def python_target(n):
+    """
+    >>> python_target(3)
+    [0, 1, 2]
+    """
+    result = []
+    with cython.vectorize(True):
+        for i in range(n):
+            result.append(i)
+    return result